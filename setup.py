@@ -29,6 +29,9 @@ setup(
         "opencv-python>=4.5.0",
         # Add any other required dependencies here
     ],
+    extras_require={
+        "accel": ["numba>=0.56", "numexpr>=2.8"],  # Fused projection kernels (optional)
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent",
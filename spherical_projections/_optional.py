@@ -0,0 +1,61 @@
+"""
+Optional accelerator imports.
+
+Numba is not a hard dependency of the package. When it cannot be imported,
+``njit`` degrades to a no-op decorator and ``prange`` to ``range`` so kernels
+can still be defined at module level; callers check ``NUMBA_AVAILABLE`` and
+take their NumPy code path instead of running the (slow) pure-Python loops.
+
+NumExpr is used the same way: ``numexpr`` is ``None`` when it is missing and
+``NUMEXPR_AVAILABLE`` tells callers whether fused expressions can be evaluated.
+CuPy likewise: ``cupy`` is ``None`` unless it can be imported, and
+``CUPY_AVAILABLE`` gates the on-device grid backend.
+"""
+
+import logging
+
+logger = logging.getLogger('spherical_projections.optional')
+
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    numba = None
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        Stand-in for ``numba.njit`` when Numba is not installed.
+
+        Supports both the bare ``@njit`` and the ``@njit(...)`` forms and
+        returns the decorated function unchanged.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    import numexpr
+    NUMEXPR_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    numexpr = None
+    NUMEXPR_AVAILABLE = False
+
+try:
+    import cupy
+    CUPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    cupy = None
+    CUPY_AVAILABLE = False
+
+logger.debug(
+    "Numba available: %s, NumExpr available: %s, CuPy available: %s",
+    NUMBA_AVAILABLE, NUMEXPR_AVAILABLE, CUPY_AVAILABLE
+)
+
+__all__ = [
+    "CUPY_AVAILABLE", "NUMBA_AVAILABLE", "NUMEXPR_AVAILABLE",
+    "cupy", "njit", "numba", "numexpr", "prange",
+]
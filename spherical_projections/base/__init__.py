@@ -10,7 +10,7 @@ strategy, grid generation, interpolation, and coordinate transformations.
 from .config import BaseProjectionConfig
 from .strategy import BaseProjectionStrategy
 from .grid import BaseGridGeneration
-from .interpolation import BaseInterpolation
+from .interpolation import BaseInterpolation, RemapMaps
 from .transform import BaseCoordinateTransformer
 from ..exceptions import (
     ProjectionError,
@@ -27,6 +27,7 @@ __all__ = [
     "BaseProjectionStrategy",
     "BaseGridGeneration",
     "BaseInterpolation",
+    "RemapMaps",
     "BaseCoordinateTransformer",
     "ProjectionError",
     "ConfigurationError",
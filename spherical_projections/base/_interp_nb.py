@@ -0,0 +1,116 @@
+"""
+Numba remap kernels used by `BaseInterpolation.apply`.
+
+The kernels reproduce ``cv2.remap`` bit for bit on the inputs they accept, so the
+interpolation result does not depend on which path ran. They are only worth
+dispatching to when they can do something OpenCV cannot do in the same pass;
+here that is skipping masked pixels and zeroing them while remapping.
+"""
+
+from .._optional import njit, prange
+import cv2
+import numpy as np
+
+# Border modes the kernels handle; anything else stays on cv2.remap.
+SUPPORTED_BORDER_MODES = (
+    cv2.BORDER_CONSTANT,
+    cv2.BORDER_REPLICATE,
+    cv2.BORDER_REFLECT,
+    cv2.BORDER_WRAP,
+    cv2.BORDER_REFLECT_101,
+)
+
+
+def border_value_u8(border_value, channels: int) -> np.ndarray:
+    """
+    Convert an OpenCV border value to the per-channel uint8 values remap fills with.
+
+    A scalar is treated like OpenCV's ``Scalar(v)``: it sets the first channel only.
+
+    Args:
+        border_value: Scalar or sequence given as ``borderValue``.
+        channels (int): Number of image channels.
+
+    Returns:
+        np.ndarray: ``(channels,)`` int64 array of saturated fill values.
+    """
+    values = np.zeros(4, dtype=np.float64)
+    flat = np.atleast_1d(np.asarray(border_value if border_value is not None else 0, dtype=np.float64))[:4]
+    values[:flat.size] = flat
+    return np.clip(np.rint(values[:channels]), 0, 255).astype(np.int64)
+
+
+@njit(cache=True, inline='always')
+def _border_index(p, n, mode):
+    """
+    Map an out-of-range coordinate into ``[0, n)`` like ``cv2.borderInterpolate``.
+
+    Returns -1 for ``BORDER_CONSTANT``, meaning the border value is used.
+    """
+    if 0 <= p < n:
+        return p
+    if mode == 1:  # BORDER_REPLICATE
+        return 0 if p < 0 else n - 1
+    if mode == 3:  # BORDER_WRAP
+        return p % n
+    if mode == 2 or mode == 4:  # BORDER_REFLECT, BORDER_REFLECT_101
+        if n == 1:
+            return 0
+        delta = 1 if mode == 4 else 0
+        while p < 0 or p >= n:
+            if p < 0:
+                p = -p - 1 + delta
+            else:
+                p = 2 * n - p - 1 - delta
+        return p
+    return -1
+
+
+@njit(parallel=True, cache=True)
+def remap_linear_fixed_u8_masked(src, xy, fxy, mask, border_mode, cval, out):
+    """
+    Bilinear remap of a uint8 ``(H, W, C)`` image with fixed-point maps, fused with masking.
+
+    ``xy`` and ``fxy`` are the ``CV_16SC2`` / ``CV_16UC1`` maps from ``cv2.convertMaps``.
+    Pixels whose mask is zero are written as zero without being sampled; the others
+    use OpenCV's 5-bit interpolation table and 15-bit fixed-point weights.
+    """
+    rows, cols = mask.shape
+    src_h, src_w, channels = src.shape
+    for j in prange(rows):
+        for i in range(cols):
+            if mask[j, i] == 0:
+                for c in range(channels):
+                    out[j, i, c] = 0
+                continue
+            sx = np.int64(xy[j, i, 0])
+            sy = np.int64(xy[j, i, 1])
+            a = np.int64(fxy[j, i]) & 1023
+            ax = a & 31
+            ay = a >> 5
+            w00 = (32 - ax) * (32 - ay) * 32
+            w01 = ax * (32 - ay) * 32
+            w10 = (32 - ax) * ay * 32
+            w11 = ax * ay * 32
+            if 0 <= sx < src_w - 1 and 0 <= sy < src_h - 1:
+                for c in range(channels):
+                    v = (np.int64(src[sy, sx, c]) * w00 + np.int64(src[sy, sx + 1, c]) * w01
+                         + np.int64(src[sy + 1, sx, c]) * w10 + np.int64(src[sy + 1, sx + 1, c]) * w11)
+                    v = (v + 16384) >> 15
+                    out[j, i, c] = 255 if v > 255 else (0 if v < 0 else v)
+                continue
+            if border_mode == 0 and (sx >= src_w or sx + 1 < 0 or sy >= src_h or sy + 1 < 0):
+                for c in range(channels):
+                    out[j, i, c] = cval[c]
+                continue
+            x0 = _border_index(sx, src_w, border_mode)
+            x1 = _border_index(sx + 1, src_w, border_mode)
+            y0 = _border_index(sy, src_h, border_mode)
+            y1 = _border_index(sy + 1, src_h, border_mode)
+            for c in range(channels):
+                p00 = np.int64(src[y0, x0, c]) if x0 >= 0 and y0 >= 0 else cval[c]
+                p01 = np.int64(src[y0, x1, c]) if x1 >= 0 and y0 >= 0 else cval[c]
+                p10 = np.int64(src[y1, x0, c]) if x0 >= 0 and y1 >= 0 else cval[c]
+                p11 = np.int64(src[y1, x1, c]) if x1 >= 0 and y1 >= 0 else cval[c]
+                v = (p00 * w00 + p01 * w01 + p10 * w10 + p11 * w11 + 16384) >> 15
+                out[j, i, c] = 255 if v > 255 else (0 if v < 0 else v)
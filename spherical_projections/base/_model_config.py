@@ -0,0 +1,141 @@
+"""
+Shared plumbing for projection configurations backed by a frozen Pydantic model.
+
+A projection's configuration class declares its model in ``_model`` and inherits
+`ModelConfigMixin`; model installation, updates, trusted construction and attribute
+access are implemented once here.
+"""
+
+from typing import Any, Dict, Tuple, Type, TypeVar
+import logging
+
+import pydantic
+
+from ..exceptions import ConfigurationError
+from ._pydantic import construct_model, field_names
+
+logger = logging.getLogger('spherical_projections.base.model_config')
+
+ConfigT = TypeVar("ConfigT", bound="ModelConfigMixin")
+
+
+class ModelConfigMixin:
+    """
+    Configuration object wrapping an immutable Pydantic model.
+
+    Subclasses set ``_model`` to their model class (and optionally ``_logger`` to
+    their module logger). The model's fields are promoted to plain instance
+    attributes, so reads never go through the model.
+
+    Attributes:
+        config (pydantic.BaseModel): The current configuration model.
+    """
+
+    _model: Type[pydantic.BaseModel]
+    # Fields promoted to instance attributes by `_set_model`; filled in per subclass.
+    _fields: Tuple[str, ...] = ()
+    _logger: logging.Logger = logger
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        model = cls.__dict__.get("_model")
+        if model is not None:
+            cls._fields = field_names(model)
+
+    def _set_model(self, config: pydantic.BaseModel) -> None:
+        """
+        Install a model and expose its fields as plain instance attributes.
+
+        Field reads then resolve from the instance ``__dict__`` without reaching
+        `__getattr__` or the model. Values cached for the previous model are dropped.
+
+        Args:
+            config (pydantic.BaseModel): The new configuration model.
+        """
+        self.__dict__.clear()
+        self.config = config
+        for field in self._fields:
+            self.__dict__[field] = getattr(config, field)
+
+    def update(self, *, _trusted: bool = True, **kwargs: Any) -> None:
+        """
+        Update configuration parameters dynamically.
+
+        Updates are trusted by default and applied without re-running validation, for
+        library code that sweeps known-good values; pass ``_trusted=False`` for values
+        from users, as `ProjectionProcessor` does for its keyword overrides.
+
+        Args:
+            _trusted (bool): Skip validation of the updated values. Defaults to True.
+            **kwargs (Any): Parameters to update in the configuration.
+
+        Raises:
+            ConfigurationError: If validation fails (with ``_trusted=False``) or the
+                model cannot be built.
+        """
+        name = type(self).__name__
+        self._logger.debug("Updating %s with parameters: %s", name, kwargs)
+        data = {**self.config.__dict__, **kwargs}
+        try:
+            if _trusted:
+                config = construct_model(self._model, data)
+            else:
+                config = self._model(**data)
+            self._set_model(config)
+            self._logger.info("%s updated successfully.", name)
+        except Exception as e:
+            error_msg = f"Failed to update {name}: {e}"
+            self._logger.exception(error_msg)
+            raise ConfigurationError(error_msg) from e
+
+    @classmethod
+    def from_trusted(cls: Type[ConfigT], values: Dict[str, Any]) -> ConfigT:
+        """
+        Build a configuration from values known to be valid, skipping validation.
+
+        Args:
+            values (Dict[str, Any]): Configuration parameters; missing ones take their defaults.
+
+        Returns:
+            ConfigT: The configuration.
+        """
+        instance = cls.__new__(cls)
+        instance._set_model(construct_model(cls._model, values))
+        return instance
+
+    def __getattr__(self, item: str) -> Any:
+        """
+        Access configuration parameters as attributes.
+
+        Model fields are already instance attributes (see `_set_model`); anything else
+        resolved here is cached on the instance until the next `update`.
+
+        Args:
+            item (str): Parameter name.
+
+        Returns:
+            Any: The value of the parameter if it exists.
+
+        Raises:
+            AttributeError: If the parameter does not exist.
+        """
+        try:
+            value = getattr(self.config, item)
+        except AttributeError:
+            error_msg = f"'{type(self).__name__}' object has no attribute '{item}'"
+            self._logger.error(error_msg)
+            raise AttributeError(error_msg) from None
+        if not item.startswith("_"):
+            # Cache the value on the instance so later reads skip __getattr__;
+            # update() clears it.
+            self.__dict__[item] = value
+        return value
+
+    def __repr__(self) -> str:
+        """
+        String representation of the configuration.
+
+        Returns:
+            str: Human-readable string of configuration parameters.
+        """
+        return f"{type(self).__name__}({self.config.dict()})"
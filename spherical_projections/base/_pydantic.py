@@ -0,0 +1,82 @@
+"""
+Compatibility helpers for the Pydantic 1.x and 2.x APIs.
+
+The configuration models are written against the 1.x API, which Pydantic 2
+still accepts; the few calls whose names changed between the two major versions
+are routed through here.
+"""
+
+from typing import Any, Dict, Tuple, Type, TypeVar
+
+import pydantic
+
+PYDANTIC_V2: bool = int(pydantic.VERSION.split(".")[0]) >= 2
+
+ModelT = TypeVar("ModelT", bound=pydantic.BaseModel)
+
+if PYDANTIC_V2:
+    # Immutable configuration models: instances are never revalidated or copied
+    # when passed to another model, and updates replace the whole model. The
+    # validator is built on first use rather than at import, so importing the
+    # package does not pay for projections that are never configured.
+    FROZEN_MODEL_CONFIG = pydantic.ConfigDict(
+        frozen=True, arbitrary_types_allowed=True, revalidate_instances="never", defer_build=True
+    )
+    FrozenModelConfig = None
+else:  # pragma: no cover - depends on the installed Pydantic
+    FROZEN_MODEL_CONFIG = None
+
+    class FrozenModelConfig:
+        """Pydantic 1.x equivalent of `FROZEN_MODEL_CONFIG`."""
+        frozen = True
+        arbitrary_types_allowed = True
+        copy_on_model_validation = "none"
+
+
+def construct_model(model_cls: Type[ModelT], values: Dict[str, Any]) -> ModelT:
+    """
+    Build a model from trusted values without running validation.
+
+    Fields missing from ``values`` take their defaults.
+
+    Args:
+        model_cls (Type[ModelT]): The Pydantic model class.
+        values (Dict[str, Any]): Field values, assumed to be valid already.
+
+    Returns:
+        ModelT: The constructed model.
+    """
+    if PYDANTIC_V2:
+        return model_cls.model_construct(**values)
+    return model_cls.construct(**values)
+
+
+def field_names(model_cls: Type[pydantic.BaseModel]) -> Tuple[str, ...]:
+    """
+    Names of the fields declared on a model class.
+
+    Args:
+        model_cls (Type[pydantic.BaseModel]): The Pydantic model class.
+
+    Returns:
+        Tuple[str, ...]: The field names, in declaration order.
+    """
+    if PYDANTIC_V2:
+        return tuple(model_cls.model_fields)
+    return tuple(model_cls.__fields__)
+
+
+def is_frozen(model: pydantic.BaseModel) -> bool:
+    """
+    Whether a model instance is immutable, so updates must replace it.
+
+    Args:
+        model (pydantic.BaseModel): The model instance.
+
+    Returns:
+        bool: True for frozen (or ``allow_mutation = False``) models.
+    """
+    if PYDANTIC_V2:
+        return bool(type(model).model_config.get("frozen", False))
+    config = type(model).__config__
+    return bool(getattr(config, "frozen", False) or not getattr(config, "allow_mutation", True))
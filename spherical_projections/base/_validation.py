@@ -0,0 +1,39 @@
+"""
+Shared check for the configuration attributes a component requires.
+
+Every component built by `ProjectionProcessor` validates the same configuration
+object, so the attributes already confirmed on a configuration are remembered
+and later components only check what is new to them.
+"""
+
+from typing import Any, Iterable, List, Set
+import weakref
+
+# config -> attribute names already confirmed on it
+_VALIDATED: "weakref.WeakKeyDictionary[Any, Set[str]]" = weakref.WeakKeyDictionary()
+
+
+def missing_attributes(config: Any, required: Iterable[str]) -> List[str]:
+    """
+    Return the required attributes the configuration does not provide.
+
+    Args:
+        config (Any): The configuration object to check.
+        required (Iterable[str]): Attribute names the caller needs.
+
+    Returns:
+        List[str]: Names of the missing attributes, in the order given.
+    """
+    required = tuple(required)
+    try:
+        known = _VALIDATED.get(config)
+    except TypeError:
+        # Unhashable or not weakly referenceable: check every time.
+        return [attr for attr in required if not hasattr(config, attr)]
+    if known is None:
+        known = set()
+    missing = [attr for attr in required if attr not in known and not hasattr(config, attr)]
+    if not missing:
+        known.update(required)
+        _VALIDATED[config] = known
+    return missing
@@ -3,12 +3,52 @@
 from typing import Any, Dict, Optional
 from pydantic import BaseModel, Field, validator
 from ..base.interpolation import BaseInterpolation
+from ..base._pydantic import field_names
 from ..exceptions import ConfigurationError
 import logging
 
 # Initialize logger for this module
 logger = logging.getLogger('spherical_projections.base.config')
 
+def _same_value(current: Any, new: Any) -> bool:
+    """
+    Whether a parameter update would leave the value unchanged.
+
+    Args:
+        current (Any): The current value.
+        new (Any): The requested value.
+
+    Returns:
+        bool: True if the values compare equal; values that cannot be compared to a
+        single boolean (e.g. arrays) count as changed.
+    """
+    if current is new:
+        return True
+    try:
+        return type(current) is type(new) and bool(current == new)
+    except (TypeError, ValueError):
+        return False
+
+
+def _model_field(name: str) -> property:
+    """
+    Read-only property resolving a parameter on the current configuration model.
+
+    The value is read through ``config_object.config`` on every access, so it follows
+    the wrapped configuration object when that object replaces its model.
+
+    Args:
+        name (str): Parameter name.
+
+    Returns:
+        property: The property.
+    """
+    def fget(self: "BaseProjectionConfig") -> Any:
+        return getattr(self.config_object.config, name)
+
+    return property(fget, doc=f"The ``{name}`` parameter of the current configuration model.")
+
+
 class BaseProjectionConfigModel(BaseModel):
     """
     Pydantic model holding basic projection configuration parameters.
@@ -17,13 +57,22 @@ class BaseProjectionConfigModel(BaseModel):
         interpolation (Optional[int]): Interpolation method for OpenCV remap.
         borderMode (Optional[int]): Border mode for OpenCV remap.
         borderValue (Optional[Any]): Border value for OpenCV remap.
+        use_relative_map (bool): Remap with displacement maps (cv2.WARP_RELATIVE_MAP).
+        fixed_point_maps (Optional[bool]): Which interpolation modes get fixed-point remap maps;
+            None for nearest, linear and Lanczos, True to add area and cubic, False for none.
     """
     interpolation: Optional[int] = Field(default=0, description="Interpolation method for OpenCV remap")
     borderMode: Optional[int] = Field(default=0, description="Border mode for OpenCV remap")
     borderValue: Optional[Any] = Field(default=0, description="Border value for OpenCV remap")
+    use_relative_map: bool = Field(default=False, description="Remap with displacement maps (cv2.WARP_RELATIVE_MAP)")
+    fixed_point_maps: Optional[bool] = Field(
+        default=None,
+        description="Precompute fixed-point remap maps: None for nearest/linear/Lanczos, True to add area/cubic, False for float maps"
+    )
 
     class Config:
         arbitrary_types_allowed = True
+        defer_build = True
 
 class BaseProjectionConfig:
     """
@@ -31,6 +80,14 @@ class BaseProjectionConfig:
     Utilizes Pydantic for configuration validation and management.
     """
 
+    # The remap parameters read for every frame resolve through properties rather than
+    # falling through to `__getattr__`; other parameters still go through it.
+    interpolation = _model_field("interpolation")
+    borderMode = _model_field("borderMode")
+    borderValue = _model_field("borderValue")
+    use_relative_map = _model_field("use_relative_map")
+    fixed_point_maps = _model_field("fixed_point_maps")
+
     def __init__(self, config_object: Any) -> None:
         """
         Initialize the projection configuration.
@@ -48,7 +105,8 @@ class BaseProjectionConfig:
             raise ConfigurationError(error_msg)
         self.config_object: Any = config_object
         try:
-            self.params: BaseProjectionConfigModel = config_object.config
+            # Read once so a configuration whose parameters cannot be loaded fails here.
+            config_object.config
             logger.debug("Configuration parameters loaded successfully.")
         except Exception as e:
             error_msg = f"Failed to load configuration parameters: {e}"
@@ -56,6 +114,17 @@ class BaseProjectionConfig:
             raise ConfigurationError(error_msg) from e
         self.extra_params: Dict[str, Any] = {}
 
+    @property
+    def params(self) -> BaseProjectionConfigModel:
+        """
+        The current parameter model of the wrapped configuration object.
+
+        Returns:
+            BaseProjectionConfigModel: ``config_object.config``, which configuration
+            objects replace when they are updated.
+        """
+        return self.config_object.config
+
     def create_projection(self) -> Any:
         """
         Placeholder for creating a projection object.
@@ -98,30 +167,57 @@ class BaseProjectionConfig:
         logger.debug("create_transformer method called.")
         raise NotImplementedError("Subclasses or configuration must implement create_transformer.")
 
-    def update(self, **kwargs: Any) -> None:
+    def update(self, *, _trusted: bool = True, **kwargs: Any) -> None:
         """
         Update configuration parameters dynamically.
 
         Args:
+            _trusted (bool): Apply the values without validation. Pass False for values
+                that come from users; the configuration object's ``update`` must then
+                accept ``_trusted`` (the built-in configurations do). Defaults to True.
             **kwargs (Any): Parameters to update in the configuration.
+
+        Raises:
+            ConfigurationError: If the values are rejected by validation (with
+                ``_trusted=False``) or cannot be applied.
         """
-        logger.debug(f"Updating configuration with parameters: {kwargs}")
+        logger.debug("Updating configuration with parameters: %s", kwargs)
+        fields = {}
+        params = self.params
+        model_fields = field_names(type(params))
         for key, value in kwargs.items():
-            if key in self.params.__fields__:
+            if key in model_fields:
+                # Unchanged values are skipped so the parameter model (and anything
+                # cached against it) is kept when callers re-pass the same settings.
+                if not _same_value(getattr(params, key), value):
+                    fields[key] = value
+            else:
+                self.extra_params[key] = value
+                logger.debug("Extra parameter '%s' set to %s.", key, value)
+        if not fields:
+            return
+        if hasattr(type(self.config_object), "update"):
+            # Let the configuration object replace its model so the parameter
+            # values it caches are refreshed too.
+            if _trusted:
+                self.config_object.update(**fields)
+            else:
+                self.config_object.update(_trusted=False, **fields)
+        else:
+            for key, value in fields.items():
                 try:
                     setattr(self.params, key, value)
-                    logger.debug(f"Parameter '{key}' updated to {value}.")
                 except Exception as e:
                     error_msg = f"Failed to update parameter '{key}': {e}"
                     logger.exception(error_msg)
                     raise ConfigurationError(error_msg) from e
-            else:
-                self.extra_params[key] = value
-                logger.debug(f"Extra parameter '{key}' set to {value}.")
+        for key in fields:
+            logger.debug("Parameter '%s' updated to %s.", key, fields[key])
 
     def __getattr__(self, item: str) -> Any:
         """
-        Access configuration parameters as attributes.
+        Fallback for parameters without a property, i.e. those of the wrapped
+        configuration object and extra parameters.
 
         Args:
             item (str): Parameter name.
@@ -132,7 +228,7 @@ class BaseProjectionConfig:
         Raises:
             AttributeError: If the parameter does not exist.
         """
-        logger.debug(f"Accessing attribute '{item}'.")
+        logger.debug("Accessing attribute '%s'.", item)
         if hasattr(self.config_object, item):
             return getattr(self.config_object, item)
         if item in self.extra_params:
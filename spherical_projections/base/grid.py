@@ -8,6 +8,62 @@ from ..exceptions import GridGenerationError, ProcessingError
 # Initialize logger for this module
 logger = logging.getLogger('spherical_projections.base.grid')
 
+
+def _uniform_axis(start: float, stop: float, num: int, dtype: Any = np.float32) -> np.ndarray:
+    """
+    Evenly spaced samples over ``[start, stop]``, like ``np.linspace``.
+
+    The samples are computed directly in ``dtype`` as ``start + step * arange(num)``,
+    one scaled and shifted ramp, instead of going through ``linspace``'s float64
+    intermediate and cast. The last sample is set to ``stop`` exactly.
+
+    Args:
+        start (float): First sample.
+        stop (float): Last sample.
+        num (int): Number of samples.
+        dtype (Any): Floating point type of the result. Defaults to float32.
+
+    Returns:
+        np.ndarray: The ``(num,)`` samples.
+    """
+    values = np.arange(num, dtype=dtype)
+    if num > 1:
+        values *= (stop - start) / (num - 1)
+    values += start
+    if num > 1:
+        values[-1] = stop
+    return values
+
+
+def _symmetric_axis(extent: float, num: int, dtype: Any = np.float32) -> np.ndarray:
+    """
+    Evenly spaced samples over ``[-extent, extent]``, like ``_uniform_axis``.
+
+    Only the non-negative half of the axis is computed; the other half is its
+    mirror image, so the samples are exactly symmetric about zero.
+
+    Args:
+        extent (float): Last sample; the first one is ``-extent``.
+        num (int): Number of samples.
+        dtype (Any): Floating point type of the result. Defaults to float32.
+
+    Returns:
+        np.ndarray: The ``(num,)`` samples.
+    """
+    if num < 2:
+        return _uniform_axis(-extent, extent, num, dtype)
+    half_points = (num + 1) // 2
+    # Odd counts have a sample at zero, even counts start half a step from it.
+    half = np.arange(half_points, dtype=dtype)
+    if num % 2 == 0:
+        half += 0.5
+    half *= 2 * extent / (num - 1)
+    half[-1] = extent
+    values = np.empty(num, dtype=dtype)
+    values[num - half_points:] = half
+    np.negative(half[::-1][:num // 2], out=values[:num // 2])
+    return values
+
 class BaseGridGeneration:
     """
     Base class for grid generation in projections.
@@ -34,4 +90,29 @@ class BaseGridGeneration:
             NotImplementedError: If the subclass does not implement this method.
         """
         logger.debug("projection_grid method called (Base class).")
-        raise NotImplementedError("Subclasses must implement _create_grid.")
\ No newline at end of file
+        raise NotImplementedError("Subclasses must implement _create_grid.")
+
+    @property
+    def forward_grid(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Forward-projection grid for the current configuration, built on first access.
+
+        Nothing is computed when the generator is constructed. Generators that memoize
+        their grids on the configuration values (as the Gnomonic and Mercator ones do)
+        make repeated access free, and a configuration update is picked up without
+        explicit invalidation.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The grids returned by `projection_grid`.
+        """
+        return self.projection_grid()
+
+    @property
+    def backward_grid(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Backward-projection grid for the current configuration, built on first access.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The grids returned by `spherical_grid`.
+        """
+        return self.spherical_grid()
@@ -1,14 +1,96 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/base/interpolation.py
 
-from typing import Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, List, NamedTuple, Optional, Tuple
 import cv2
 import numpy as np
 import logging
+import weakref
+from .._optional import NUMBA_AVAILABLE
 from ..exceptions import InterpolationError
+from ._validation import missing_attributes
+from ._interp_nb import SUPPORTED_BORDER_MODES, border_value_u8, remap_linear_fixed_u8_masked
 
 # Initialize logger for this module
 logger = logging.getLogger('spherical_projections.base.interpolation')
 
+# cv2.remap indexes with signed 16-bit integers, so images or maps with a side
+# beyond this are remapped in blocks against cropped views of the source.
+_REMAP_MAX_DIM = 32000
+# Output block edge used when tiling an oversized remap.
+_REMAP_TILE = 4096
+# Source margin kept around each block's footprint for the interpolation kernel.
+_REMAP_PAD = 4
+# Number of float map pairs whose `build_maps` handle is kept by interpolate().
+_MAPS_CACHE_SIZE = 4
+# Largest valid-pixel fraction for which the fused Numba remap-and-mask kernel is
+# used; it skips masked pixels, but OpenCV's SIMD remap wins on mostly valid outputs.
+_FUSED_MASK_MAX_FILL = 0.5
+# Interpolation modes whose coordinates are precomputed as fixed-point maps by default.
+# Fixed-point maps hold coordinates on a 1/32-pixel grid. Nearest and Lanczos output
+# matches float maps exactly; bilinear output can differ by a few grey levels (up to 7
+# on uint8 noise with OpenCV 5), which `fixed_point_maps=False` avoids.
+_FIXED_POINT_MODES = (cv2.INTER_NEAREST, cv2.INTER_LINEAR, cv2.INTER_LANCZOS4)
+# Modes converted only when `fixed_point_maps=True`: OpenCV evaluates their float maps
+# at full precision, so fixed-point output differs by up to 7 grey levels on uint8 noise.
+_OPT_IN_FIXED_POINT_MODES = (cv2.INTER_AREA, cv2.INTER_CUBIC)
+# Image dtypes OpenCV can mask with a bitwise AND.
+_CV_MASK_DTYPES = frozenset(
+    np.dtype(t) for t in (np.uint8, np.int8, np.uint16, np.int16, np.int32, np.float32, np.float64)
+)
+
+
+def _cuda_stream() -> Any:
+    """
+    Create a CUDA stream for ``cv2.cuda.remap`` if OpenCV can see a CUDA device.
+
+    Returns:
+        Any: A ``cv2.cuda_Stream``, or None when OpenCV has no usable CUDA support.
+    """
+    try:
+        if cv2.cuda.getCudaEnabledDeviceCount() > 0:
+            logger.debug("CUDA device found; remapping on the GPU.")
+            return cv2.cuda_Stream()
+    except (AttributeError, cv2.error):
+        pass
+    return None
+
+
+@lru_cache(maxsize=8)
+def _identity_grid(H: int, W: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cached read-only identity grids shared by every interpolator.
+
+    Args:
+        H (int): Output height.
+        W (int): Output width.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: ``(1, W)`` column and ``(H, 1)`` row indices.
+    """
+    ident_x = np.arange(W, dtype=np.float32)[None, :]
+    ident_y = np.arange(H, dtype=np.float32)[:, None]
+    ident_x.flags.writeable = False
+    ident_y.flags.writeable = False
+    return ident_x, ident_y
+
+
+class RemapMaps(NamedTuple):
+    """
+    Remap coordinates prepared by `BaseInterpolation.build_maps`.
+
+    Attributes:
+        map1 (np.ndarray): Fixed-point ``CV_16SC2`` map, or float32 x-map.
+        map2 (Optional[np.ndarray]): Fixed-point interpolation table (None for nearest), or float32 y-map.
+        interp_mode (int): OpenCV interpolation flag the maps were built for.
+        relative (bool): True if the maps hold displacements for ``cv2.WARP_RELATIVE_MAP``.
+    """
+    map1: np.ndarray
+    map2: Optional[np.ndarray]
+    interp_mode: int
+    relative: bool
+
 class BaseInterpolation:
     """
     Base class for image interpolation in projections.
@@ -25,79 +107,693 @@ class BaseInterpolation:
             TypeError: If 'config' does not have required attributes.
         """
         logger.debug("Initializing BaseInterpolation.")
-        if not hasattr(config, "interpolation") or not hasattr(config, "borderMode") or not hasattr(config, "borderValue"):
+        if missing_attributes(config, ("interpolation", "borderMode", "borderValue")):
             error_msg = "Config must have 'interpolation', 'borderMode', and 'borderValue' attributes."
             logger.error(error_msg)
             raise TypeError(error_msg)
         self.config: Any = config
+        # (id(map_x), id(map_y), src shape, interpolation, relative) -> (weakref(map_x), weakref(map_y), RemapMaps)
+        self._maps_cache: "OrderedDict[Tuple[Any, ...], Tuple[Any, ...]]" = OrderedDict()
+        # GPU remap state; the maps of the last handle applied stay resident on the device.
+        self._cuda_stream: Any = _cuda_stream()
+        self._gpu_maps: Optional[Tuple[Any, Any, Any]] = None
+        # (raw borderValue, 4-tuple passed to OpenCV) for the last border value seen.
+        self._border_cache: Optional[Tuple[Any, Tuple[float, float, float, float]]] = None
+        # (weakref(mask), dtype, ndim, prepared mask) for the last mask applied.
+        self._mask_cache: Optional[Tuple[Any, Any, int, np.ndarray]] = None
+        # (weakref(mask), valid-pixel fraction) for the last mask checked by `_use_fused_mask`.
+        self._mask_fill_cache: Optional[Tuple[Any, float]] = None
         logger.info("BaseInterpolation initialized successfully.")
 
-    def interpolate(
-        self, 
-        input_img: np.ndarray, 
-        map_x: np.ndarray, 
-        map_y: np.ndarray, 
-        mask: Optional[np.ndarray] = None
-    ) -> np.ndarray:
+    def clear_map_cache(self) -> None:
         """
-        Perform image interpolation based on the provided mapping.
+        Drop the map builds cached by `interpolate`.
+
+        Needed only if a map array passed to `interpolate` is modified in place
+        and then passed again.
+        """
+        self._maps_cache.clear()
+        self._gpu_maps = None
+        self._mask_cache = None
+        self._mask_fill_cache = None
+
+    def _cached_maps(
+        self, map_x: np.ndarray, map_y: np.ndarray, src_shape: Tuple[int, ...]
+    ) -> RemapMaps:
+        """
+        Return the `build_maps` handle for a map pair, building it on first use.
+
+        Handles are kept in a small LRU keyed by the identity of the map arrays, so
+        repeatedly remapping frames with the same float maps converts them only once.
+        Weak references guard against a new array reusing a freed array's id. Maps
+        are treated as read-only while cached.
 
         Args:
-            input_img (np.ndarray): The input image to interpolate.
             map_x (np.ndarray): The mapping for the x-coordinates.
             map_y (np.ndarray): The mapping for the y-coordinates.
-            mask (Optional[np.ndarray], optional): Mask to apply to the interpolated image. Defaults to None.
+            src_shape (Tuple[int, ...]): Shape of the image being remapped.
+
+        Returns:
+            RemapMaps: Maps ready for `apply`.
+        """
+        if self._is_fixed_point(map_x):
+            return self.build_maps(map_x, map_y, src_shape)
+        key = (
+            id(map_x), id(map_y), tuple(src_shape[:2]), self.config.interpolation,
+            self._use_relative_map(), getattr(self.config, "fixed_point_maps", None)
+        )
+        entry = self._maps_cache.get(key)
+        if entry is not None and entry[0]() is map_x and entry[1]() is map_y:
+            self._maps_cache.move_to_end(key)
+            logger.debug("Reusing cached remap maps.")
+            return entry[2]
+        maps = self.build_maps(map_x, map_y, src_shape)
+        if maps.map1 is map_x:
+            # Nothing was converted, and caching would keep the caller's arrays alive.
+            return maps
+        try:
+            self._maps_cache[key] = (weakref.ref(map_x), weakref.ref(map_y), maps)
+        except TypeError:
+            # Arrays that do not support weak references are converted but not cached.
+            return maps
+        while len(self._maps_cache) > _MAPS_CACHE_SIZE:
+            self._maps_cache.popitem(last=False)
+        return maps
+
+    @staticmethod
+    def _is_remap_ready(map_array: np.ndarray) -> bool:
+        """
+        Check whether a map can be handed to OpenCV remap as-is.
+
+        Args:
+            map_array (np.ndarray): Coordinate map.
+
+        Returns:
+            bool: True if the map is C-contiguous float32.
+        """
+        return map_array.dtype == np.float32 and map_array.flags.c_contiguous
+
+    def _border_value(self) -> Tuple[float, float, float, float]:
+        """
+        Return the configured border value as the 4-tuple OpenCV converts it to.
+
+        A scalar fills the first channel only, as ``cv2.remap`` does with a plain
+        number. The tuple is rebuilt only when ``borderValue`` is replaced.
+
+        Returns:
+            Tuple[float, float, float, float]: Per-channel border value.
+        """
+        raw = self.config.borderValue
+        cached = self._border_cache
+        if cached is None or cached[0] is not raw:
+            values = [0.0, 0.0, 0.0, 0.0]
+            flat = np.atleast_1d(np.asarray(0 if raw is None else raw, dtype=np.float64)).ravel()[:4]
+            values[:flat.size] = flat.tolist()
+            cached = self._border_cache = (raw, tuple(values))
+        return cached[1]
+
+    def _use_relative_map(self) -> bool:
+        """
+        Check whether the configuration asks for displacement (relative) maps.
+
+        Returns:
+            bool: True if ``use_relative_map`` is set on the configuration.
+        """
+        return bool(getattr(self.config, "use_relative_map", False))
+
+    def _use_fixed_point(self, interp_mode: int) -> bool:
+        """
+        Check whether maps for an interpolation mode should be converted to fixed-point.
+
+        Args:
+            interp_mode (int): OpenCV interpolation flag.
+
+        Returns:
+            bool: True if the mode is converted under the configured ``fixed_point_maps``:
+            None (the default) converts the `_FIXED_POINT_MODES`, True also converts the
+            area and cubic modes, and False keeps float maps for every mode.
+        """
+        setting = getattr(self.config, "fixed_point_maps", None)
+        if setting is None:
+            return interp_mode in _FIXED_POINT_MODES
+        return bool(setting) and interp_mode in _FIXED_POINT_MODES + _OPT_IN_FIXED_POINT_MODES
+
+    @staticmethod
+    def _identity_grid(shape: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Broadcastable identity coordinates for an output of the given shape.
+
+        Args:
+            shape (Tuple[int, int]): Output shape (height, width).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Read-only ``(1, W)`` column and ``(H, 1)`` row indices.
+        """
+        return _identity_grid(*shape[:2])
+
+    def convert_maps(
+        self, map_x: np.ndarray, map_y: np.ndarray, src_shape: Optional[Tuple[int, ...]] = None
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Convert float coordinate maps to OpenCV's fixed-point remap format.
+
+        Fixed-point maps (``CV_16SC2`` plus ``CV_16UC1`` interpolation table indices)
+        are smaller and faster to remap with, which pays off when the same maps are
+        applied to many frames. Nearest, linear and Lanczos maps are converted by
+        default; area and cubic maps only with ``fixed_point_maps=True``. Other modes
+        keep float32 maps.
+
+        The conversion rounds coordinates to 1/32 pixel. Nearest and Lanczos output is
+        unchanged, but bilinear (and opted-in area and cubic) output can differ from
+        float maps by up to 7 grey levels on uint8 noise with OpenCV 5, and by much less
+        on smooth images. Set ``fixed_point_maps=False`` when output must match float
+        maps exactly.
+
+        When ``use_relative_map`` is set, the absolute maps are instead turned into
+        float32 displacement fields (map minus the identity grid) for
+        ``cv2.WARP_RELATIVE_MAP``. Maps into sources too large for int16 coordinates
+        stay float32.
+
+        Args:
+            map_x (np.ndarray): The mapping for the x-coordinates.
+            map_y (np.ndarray): The mapping for the y-coordinates.
+            src_shape (Optional[Tuple[int, ...]]): Shape of the image the maps sample from.
+
+        Returns:
+            Tuple[np.ndarray, Optional[np.ndarray]]: Maps accepted by `interpolate`. For
+            nearest-neighbour maps OpenCV returns no interpolation table, so the second map
+            is None.
+
+        Raises:
+            InterpolationError: If the conversion fails.
+        """
+        map_x, map_y = np.broadcast_arrays(map_x, map_y)
+        map_x = map_x if self._is_remap_ready(map_x) else np.ascontiguousarray(map_x, dtype=np.float32)
+        map_y = map_y if self._is_remap_ready(map_y) else np.ascontiguousarray(map_y, dtype=np.float32)
+        if self._use_relative_map():
+            ident_x, ident_y = self._identity_grid(map_x.shape)
+            logger.debug("Converted remap coordinates to displacement maps.")
+            return np.subtract(map_x, ident_x, dtype=np.float32), np.subtract(map_y, ident_y, dtype=np.float32)
+        if not self._use_fixed_point(self.config.interpolation):
+            return map_x, map_y
+        if src_shape is not None and max(src_shape[:2]) > _REMAP_MAX_DIM:
+            return map_x, map_y
+        try:
+            map1, map2 = cv2.convertMaps(
+                map_x, map_y, cv2.CV_16SC2,
+                nninterpolation=self.config.interpolation == cv2.INTER_NEAREST
+            )
+            logger.debug("Converted remap coordinates to fixed-point maps.")
+        except cv2.error as e:
+            error_msg = f"OpenCV convertMaps failed: {e}"
+            logger.exception(error_msg)
+            raise InterpolationError(error_msg) from e
+        return map1, map2
+
+    @staticmethod
+    def _is_fixed_point(map_x: np.ndarray) -> bool:
+        """
+        Check whether a map pair was produced by `convert_maps` in fixed-point form.
+
+        Args:
+            map_x (np.ndarray): First map of the pair.
+
+        Returns:
+            bool: True if the map holds interleaved int16 (x, y) coordinates.
+        """
+        return map_x.dtype == np.int16 and map_x.ndim == 3
+
+    def _remap_tiled(self, input_img: np.ndarray, map_x: np.ndarray, map_y: np.ndarray, flags: int) -> np.ndarray:
+        """
+        Remap in output blocks, each against the source crop it actually samples.
+
+        Works around the int16 indexing limit of ``cv2.remap`` for very large images.
+        Each block's crop covers the bounding box of its map coordinates plus a kernel
+        margin; border modes are honoured by wrapping (``BORDER_WRAP``) or by keeping
+        the crop on the source edge that out-of-range samples reflect or clamp to.
+        Blocks whose crop is still too large are split further.
+
+        Args:
+            input_img (np.ndarray): The input image to interpolate.
+            map_x (np.ndarray): Absolute float32 x-map, or fixed-point map from `convert_maps`.
+            map_y (np.ndarray): Absolute float32 y-map, or interpolation table from `convert_maps`.
+            flags (int): Interpolation flags passed to ``cv2.remap``.
 
         Returns:
             np.ndarray: The interpolated image.
 
         Raises:
-            InterpolationError: If OpenCV remap fails or inputs are invalid.
+            InterpolationError: If a block cannot be reduced below the size limit.
         """
-        logger.debug("Starting image interpolation.")
-        if not isinstance(input_img, np.ndarray):
-            error_msg = "input_img must be a NumPy ndarray."
-            logger.error(error_msg)
-            raise InterpolationError(error_msg)
+        fixed_point = self._is_fixed_point(map_x)
+        src_h, src_w = input_img.shape[:2]
+        dst_h, dst_w = map_x.shape[:2]
+        result = np.empty((dst_h, dst_w) + input_img.shape[2:], dtype=input_img.dtype)
+        wrap = self.config.borderMode == cv2.BORDER_WRAP
+
+        def crop_range(coords: np.ndarray, size: int) -> Tuple[int, int]:
+            valid = coords[np.isfinite(coords)] if coords.dtype.kind == "f" else coords.ravel()
+            if valid.size == 0:
+                return 0, 1
+            c_min, c_max = float(valid.min()), float(valid.max())
+            lo = int(np.floor(c_min)) - _REMAP_PAD
+            # Even offsets keep OpenCV's round-half-to-even nearest sampling unchanged.
+            lo -= lo % 2
+            hi = int(np.ceil(c_max)) + _REMAP_PAD + 1
+            if wrap:
+                return lo, hi
+            # Reflected samples must stay inside the crop, which is anchored on the edge.
+            if c_min < 0:
+                hi = max(hi, int(np.ceil(-c_min)) + _REMAP_PAD + 1)
+            if c_max > size - 1:
+                lo = min(lo, int(np.floor(2 * (size - 1) - c_max)) - _REMAP_PAD)
+            lo -= lo % 2
+            lo, hi = max(lo, 0), min(hi, size)
+            return (lo, hi) if lo < hi else (0, 1)
+
+        blocks: List[Tuple[slice, slice]] = [
+            (slice(y0, min(y0 + _REMAP_TILE, dst_h)), slice(x0, min(x0 + _REMAP_TILE, dst_w)))
+            for y0 in range(0, dst_h, _REMAP_TILE)
+            for x0 in range(0, dst_w, _REMAP_TILE)
+        ]
+        while blocks:
+            rows, cols = blocks.pop()
+            if fixed_point:
+                block_x = map_x[rows, cols, 0]
+                block_y = map_x[rows, cols, 1]
+            else:
+                block_x, block_y = map_x[rows, cols], map_y[rows, cols]
+            x_lo, x_hi = crop_range(block_x, src_w)
+            y_lo, y_hi = crop_range(block_y, src_h)
+            if max(x_hi - x_lo, y_hi - y_lo) > _REMAP_MAX_DIM:
+                n_rows, n_cols = rows.stop - rows.start, cols.stop - cols.start
+                if max(n_rows, n_cols) <= 1:
+                    error_msg = "Remap footprint of a single pixel exceeds the OpenCV size limit."
+                    logger.error(error_msg)
+                    raise InterpolationError(error_msg)
+                mid_r, mid_c = rows.start + (n_rows + 1) // 2, cols.start + (n_cols + 1) // 2
+                blocks.extend(
+                    (r, c)
+                    for r in (slice(rows.start, mid_r), slice(mid_r, rows.stop))
+                    for c in (slice(cols.start, mid_c), slice(mid_c, cols.stop))
+                    if r.start < r.stop and c.start < c.stop
+                )
+                continue
+
+            if wrap:
+                crop = np.take(np.take(input_img, np.arange(y_lo, y_hi), axis=0, mode="wrap"),
+                               np.arange(x_lo, x_hi), axis=1, mode="wrap")
+            else:
+                crop = input_img[y_lo:y_hi, x_lo:x_hi]
+            if fixed_point:
+                block_1 = map_x[rows, cols] - np.array([x_lo, y_lo], dtype=np.int16)
+                block_2 = None if map_y is None else map_y[rows, cols]
+            else:
+                # One interleaved CV_32FC2 map per block: cv2.remap reads both
+                # coordinates from a single stream, which is faster than two planes.
+                block_1 = np.empty(block_x.shape + (2,), dtype=np.float32)
+                np.subtract(block_x, x_lo, out=block_1[..., 0], dtype=np.float32)
+                np.subtract(block_y, y_lo, out=block_1[..., 1], dtype=np.float32)
+                block_2 = None
+            # Each block is written straight into its view of the result.
+            cv2.remap(
+                crop, block_1, block_2,
+                dst=result[rows, cols],
+                interpolation=flags,
+                borderMode=self.config.borderMode,
+                borderValue=self._border_value()
+            )
+        logger.debug("Oversized remap completed in tiles.")
+        return result
+
+    def _remap_cuda(self, input_img: np.ndarray, maps: RemapMaps) -> Optional[np.ndarray]:
+        """
+        Remap on the GPU with ``cv2.cuda.remap``.
+
+        ``cv2.cuda.remap`` takes float32 maps only, so fixed-point maps are expanded
+        once; the device copies of the last handle's maps are kept for the next frame.
+        Any CUDA failure disables the GPU path for this interpolator.
+
+        Args:
+            input_img (np.ndarray): The input image to interpolate.
+            maps (RemapMaps): Absolute maps from `build_maps`.
+
+        Returns:
+            Optional[np.ndarray]: The interpolated image, or None to fall back to the CPU.
+        """
+        try:
+            cached = self._gpu_maps
+            if cached is None or cached[0]() is not maps.map1:
+                map_x, map_y = maps.map1, maps.map2
+                if self._is_fixed_point(map_x):
+                    map_x, map_y = cv2.convertMaps(
+                        map_x, map_y, cv2.CV_32FC1, nninterpolation=map_y is None
+                    )
+                gpu_map_x, gpu_map_y = cv2.cuda_GpuMat(), cv2.cuda_GpuMat()
+                gpu_map_x.upload(map_x, self._cuda_stream)
+                gpu_map_y.upload(map_y, self._cuda_stream)
+                self._gpu_maps = cached = (weakref.ref(maps.map1), gpu_map_x, gpu_map_y)
+            gpu_src = cv2.cuda_GpuMat()
+            gpu_src.upload(input_img, self._cuda_stream)
+            gpu_dst = cv2.cuda.remap(
+                gpu_src, cached[1], cached[2], maps.interp_mode,
+                borderMode=self.config.borderMode,
+                borderValue=self._border_value(),
+                stream=self._cuda_stream
+            )
+            result = gpu_dst.download(stream=self._cuda_stream)
+            self._cuda_stream.waitForCompletion()
+        except (cv2.error, AttributeError, TypeError) as e:
+            logger.warning("CUDA remap failed, falling back to the CPU: %s", e)
+            self._cuda_stream = None
+            self._gpu_maps = None
+            return None
+        logger.debug("CUDA remap executed successfully.")
+        return result.reshape(maps.map1.shape[:2] + input_img.shape[2:])
+
+    def _prepared_mask(self, mask: np.ndarray, dtype: Any, ndim: int) -> np.ndarray:
+        """
+        Return the mask converted for application to a result of the given dtype and rank.
+
+        Backward projection applies the same cached mask to every frame, so the
+        converted (and, for 3-D results, channel-broadcast) mask is kept for the last
+        mask array seen. Masks are treated as read-only while cached.
+
+        Args:
+            mask (np.ndarray): Validity mask of the output.
+            dtype (Any): Dtype to convert the mask to.
+            ndim (int): Rank of the result; 3 adds a trailing channel axis.
+
+        Returns:
+            np.ndarray: The prepared mask.
+        """
+        dtype = np.dtype(dtype)
+        cached = self._mask_cache
+        if cached is not None and cached[0]() is mask and cached[1] == dtype and cached[2] == ndim:
+            return cached[3]
+        prepared = np.ascontiguousarray(mask)
+        if prepared.dtype == np.bool_ and dtype == np.uint8:
+            prepared = prepared.view(np.uint8)
+        elif np.can_cast(prepared.dtype, dtype, "same_kind"):
+            prepared = prepared.astype(dtype, copy=False)
+        if ndim == 3:
+            prepared = prepared[:, :, None]
+        try:
+            self._mask_cache = (weakref.ref(mask), dtype, ndim, prepared)
+        except TypeError:
+            pass
+        return prepared
+
+    def _mask_fill(self, mask: np.ndarray) -> float:
+        """
+        Fraction of valid (non-zero) pixels in a mask, counted once per mask array.
+
+        Backward projection applies the same cached mask to every frame, so the count
+        is kept for the last mask seen, like the prepared mask in `_prepared_mask`.
+        Masks are treated as read-only while cached.
+
+        Args:
+            mask (np.ndarray): Validity mask of the output.
+
+        Returns:
+            float: The valid-pixel fraction.
+        """
+        cached = self._mask_fill_cache
+        if cached is not None and cached[0]() is mask:
+            return cached[1]
+        fill = np.count_nonzero(mask) / mask.size if mask.size else 0.0
+        try:
+            self._mask_fill_cache = (weakref.ref(mask), fill)
+        except TypeError:
+            pass
+        return fill
+
+    def _use_fused_mask(self, input_img: np.ndarray, maps: RemapMaps, mask: np.ndarray) -> bool:
+        """
+        Decide whether `_remap_masked_numba` should replace ``cv2.remap`` plus masking.
+
+        The fused kernel handles uint8 images with up to four channels, bilinear
+        fixed-point maps and the standard border modes. It skips masked pixels
+        entirely, so it only beats OpenCV's SIMD remap when at most
+        ``_FUSED_MASK_MAX_FILL`` of the output is valid.
+
+        Args:
+            input_img (np.ndarray): The input image.
+            maps (RemapMaps): Maps about to be applied.
+            mask (np.ndarray): Validity mask of the output.
+
+        Returns:
+            bool: True if the fused kernel applies.
+        """
+        return (
+            NUMBA_AVAILABLE
+            and input_img.dtype == np.uint8
+            and (input_img.ndim == 2 or (input_img.ndim == 3 and input_img.shape[2] <= 4))
+            and maps.interp_mode == cv2.INTER_LINEAR
+            and not maps.relative
+            and self._is_fixed_point(maps.map1)
+            and maps.map2 is not None
+            and mask.dtype in (np.bool_, np.uint8)
+            and self.config.borderMode in SUPPORTED_BORDER_MODES
+            and self._mask_fill(mask) <= _FUSED_MASK_MAX_FILL
+        )
+
+    def _remap_masked_numba(
+        self, input_img: np.ndarray, map1: np.ndarray, map2: np.ndarray, mask: np.ndarray
+    ) -> np.ndarray:
+        """
+        Bilinear remap and masking in one pass; bit-identical to ``cv2.remap`` followed by masking.
+
+        Args:
+            input_img (np.ndarray): uint8 image, 2-D or with up to four channels.
+            map1 (np.ndarray): Fixed-point ``CV_16SC2`` map.
+            map2 (np.ndarray): Fixed-point interpolation table.
+            mask (np.ndarray): Boolean or uint8 validity mask (non-zero means valid).
+
+        Returns:
+            np.ndarray: The masked interpolated image.
+        """
+        src = np.ascontiguousarray(input_img)
+        channels = 1 if src.ndim == 2 else src.shape[2]
+        result = np.empty(map1.shape[:2] + src.shape[2:], dtype=np.uint8)
+        remap_linear_fixed_u8_masked(
+            src.reshape(src.shape[0], src.shape[1], channels),
+            map1, map2, mask,
+            int(self.config.borderMode),
+            border_value_u8(self._border_value(), channels),
+            result.reshape(result.shape[0], result.shape[1], channels)
+        )
+        return result
+
+    def build_maps(
+        self, map_x: np.ndarray, map_y: Optional[np.ndarray], src_shape: Optional[Tuple[int, ...]] = None
+    ) -> RemapMaps:
+        """
+        Prepare coordinate maps once so they can be applied to many images.
+
+        Broadcastable maps are densified to float32 and, for the modes selected by
+        ``fixed_point_maps`` (see `convert_maps`), converted to fixed-point. Displacement maps (``use_relative_map``)
+        are kept relative when OpenCV supports ``cv2.WARP_RELATIVE_MAP`` and rebuilt as
+        absolute maps otherwise; relative maps get the fixed-point conversion as well.
+        Maps into sources beyond the int16 limit stay float32.
+
+        Args:
+            map_x (np.ndarray): The mapping for the x-coordinates, or the fixed-point
+                ``CV_16SC2`` map returned by `convert_maps`.
+            map_y (Optional[np.ndarray]): The mapping for the y-coordinates, or the fixed-point
+                interpolation table returned by `convert_maps` (None for nearest).
+            src_shape (Optional[Tuple[int, ...]]): Shape of the images the maps sample from.
+
+        Returns:
+            RemapMaps: Handle to pass to `apply`.
+
+        Raises:
+            InterpolationError: If the maps are invalid or cannot be converted.
+        """
+        interp_mode = self.config.interpolation
+        if isinstance(map_x, np.ndarray) and self._is_fixed_point(map_x):
+            # Nearest-neighbour conversion yields no interpolation table, so map_y may be None.
+            if map_y is not None and not isinstance(map_y, np.ndarray):
+                error_msg = "map_y must be a NumPy ndarray or None for fixed-point maps."
+                logger.error(error_msg)
+                raise InterpolationError(error_msg)
+            logger.debug("Using fixed-point remap maps.")
+            return RemapMaps(map_x, map_y, interp_mode, False)
         if not isinstance(map_x, np.ndarray) or not isinstance(map_y, np.ndarray):
             error_msg = "map_x and map_y must be NumPy ndarrays."
             logger.error(error_msg)
             raise InterpolationError(error_msg)
 
         try:
-            map_x_32: np.ndarray = map_x.astype(np.float32)
-            map_y_32: np.ndarray = map_y.astype(np.float32)
-            logger.debug("map_x and map_y converted to float32 successfully.")
-        except Exception as e:
-            error_msg = f"Failed to convert map_x or map_y to float32: {e}"
-            logger.exception(error_msg)
+            map_x, map_y = np.broadcast_arrays(map_x, map_y)
+        except ValueError as e:
+            error_msg = f"map_x and map_y shapes are not compatible: {e}"
+            logger.error(error_msg)
             raise InterpolationError(error_msg) from e
+        # Broadcastable maps (e.g. (1, W) and (H, 1)) are only densified here, where
+        # cv2.remap needs them; maps produced in float32 are passed through without a copy.
+        map_x_32 = map_x if self._is_remap_ready(map_x) else np.ascontiguousarray(map_x, dtype=np.float32)
+        map_y_32 = map_y if self._is_remap_ready(map_y) else np.ascontiguousarray(map_y, dtype=np.float32)
 
-        try:
-            result: np.ndarray = cv2.remap(
-                input_img, map_x_32, map_y_32,
-                interpolation=self.config.interpolation,
-                borderMode=self.config.borderMode,
-                borderValue=self.config.borderValue
-            )
-            logger.debug("OpenCV remap executed successfully.")
-        except cv2.error as e:
-            error_msg = f"OpenCV remap failed: {e}"
-            logger.exception(error_msg)
-            raise InterpolationError(error_msg) from e
+        oversized = max(map_x_32.shape[:2] + tuple(src_shape or ())[:2]) > _REMAP_MAX_DIM
+        relative = False
+        if self._use_relative_map():
+            if hasattr(cv2, "WARP_RELATIVE_MAP") and not oversized:
+                relative = True
+            else:
+                # OpenCV < 4.10, or tiled remap: rebuild absolute maps from the displacements.
+                logger.debug("Rebuilding absolute maps from displacement maps.")
+                ident_x, ident_y = self._identity_grid(map_x_32.shape)
+                map_x_32 = np.add(map_x_32, ident_x, dtype=np.float32)
+                map_y_32 = np.add(map_y_32, ident_y, dtype=np.float32)
+        if self._use_fixed_point(interp_mode) and not oversized and map_x_32.ndim == 2:
+            # Displacement maps convert like absolute ones; WARP_RELATIVE_MAP accepts both forms.
+            try:
+                map1, map2 = cv2.convertMaps(
+                    map_x_32, map_y_32, cv2.CV_16SC2,
+                    nninterpolation=interp_mode == cv2.INTER_NEAREST
+                )
+                logger.debug("Converted remap coordinates to fixed-point maps.")
+            except cv2.error as e:
+                error_msg = f"OpenCV convertMaps failed: {e}"
+                logger.exception(error_msg)
+                raise InterpolationError(error_msg) from e
+            return RemapMaps(map1, map2, interp_mode, relative)
+        return RemapMaps(map_x_32, map_y_32, interp_mode, relative)
+
+    def apply(self, maps: RemapMaps, input_img: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Remap an image with maps prepared by `build_maps`.
+
+        Args:
+            maps (RemapMaps): Handle returned by `build_maps`.
+            input_img (np.ndarray): The input image to interpolate.
+            mask (Optional[np.ndarray], optional): Mask to apply to the interpolated image, boolean
+                or uint8 (non-zero means valid). A scalar ``True`` means every pixel is valid
+                and skips masking. Defaults to None.
 
+        Returns:
+            np.ndarray: The interpolated image.
+
+        Raises:
+            InterpolationError: If OpenCV remap fails or inputs are invalid.
+        """
+        if not isinstance(input_img, np.ndarray):
+            error_msg = "input_img must be a NumPy ndarray."
+            logger.error(error_msg)
+            raise InterpolationError(error_msg)
+        if not isinstance(maps, RemapMaps):
+            error_msg = "maps must be a RemapMaps handle returned by build_maps."
+            logger.error(error_msg)
+            raise InterpolationError(error_msg)
+
+        if mask is True or (isinstance(mask, np.ndarray) and mask.ndim == 0 and bool(mask)):
+            mask = None
         if mask is not None:
-            logger.debug("Applying mask to interpolated image.")
             if not isinstance(mask, np.ndarray):
                 error_msg = "mask must be a NumPy ndarray if provided."
                 logger.error(error_msg)
                 raise InterpolationError(error_msg)
-            if mask.shape != result.shape[:2]:
+            if mask.shape != maps.map1.shape[:2]:
                 error_msg = "mask shape must match the first two dimensions of the result."
                 logger.error(error_msg)
                 raise InterpolationError(error_msg)
-            result *= mask[:, :, None]
+
+        map1, map2 = maps.map1, maps.map2
+        flags = maps.interp_mode
+        oversized = max(input_img.shape[:2] + map1.shape[:2]) > _REMAP_MAX_DIM
+        if maps.relative:
+            if oversized:
+                if self._is_fixed_point(map1):
+                    map1, map2 = cv2.convertMaps(map1, map2, cv2.CV_32FC1, nninterpolation=map2 is None)
+                ident_x, ident_y = self._identity_grid(map1.shape[:2])
+                map1 = np.add(map1, ident_x, dtype=np.float32)
+                map2 = np.add(map2, ident_y, dtype=np.float32)
+            else:
+                flags |= cv2.WARP_RELATIVE_MAP
+
+        result: Optional[np.ndarray] = None
+        if self._cuda_stream is not None and not oversized and not maps.relative:
+            result = self._remap_cuda(input_img, maps)
+        if result is None and mask is not None and not oversized and self._use_fused_mask(input_img, maps, mask):
+            logger.debug("Remapping and masking with the fused Numba kernel.")
+            return self._remap_masked_numba(input_img, map1, map2, mask)
+
+        if result is None:
+            try:
+                if oversized:
+                    result = self._remap_tiled(input_img, map1, map2, flags)
+                else:
+                    result = cv2.remap(
+                        input_img, map1, map2,
+                        interpolation=flags,
+                        borderMode=self.config.borderMode,
+                        borderValue=self._border_value()
+                    )
+                logger.debug("OpenCV remap executed successfully.")
+            except cv2.error as e:
+                error_msg = f"OpenCV remap failed: {e}"
+                logger.exception(error_msg)
+                raise InterpolationError(error_msg) from e
+
+        if mask is not None:
+            logger.debug("Applying mask to interpolated image.")
+            if result.dtype in _CV_MASK_DTYPES and mask.dtype in (np.bool_, np.uint8) and (
+                result.ndim == 2 or result.shape[2] <= 4
+            ):
+                # Binary masks are applied by OpenCV's SIMD bitwise AND, which zeroes
+                # masked pixels of any depth (NaNs included) in a single pass. A boolean
+                # mask is reinterpreted as 0/1 bytes without a copy.
+                result = cv2.bitwise_and(result, result, mask=self._prepared_mask(mask, np.uint8, 2))
+            else:
+                np.multiply(result, self._prepared_mask(mask, result.dtype, result.ndim), out=result)
             logger.debug("Mask applied successfully.")
 
         logger.info("Image interpolation completed successfully.")
-        return result
\ No newline at end of file
+        return result
+
+    def interpolate(
+        self, 
+        input_img: np.ndarray, 
+        map_x: np.ndarray, 
+        map_y: Optional[np.ndarray], 
+        mask: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Perform image interpolation based on the provided mapping.
+
+        Builds the maps (reusing a cached build for map arrays seen recently) and
+        applies them; see `build_maps` and `apply`. Float maps are converted to
+        fixed-point as described in `convert_maps`, which is not lossless for bilinear
+        sampling; set ``fixed_point_maps=False`` to remap with the float maps as given.
+
+        Args:
+            input_img (np.ndarray): The input image to interpolate.
+            map_x (np.ndarray): The mapping for the x-coordinates, or the fixed-point
+                ``CV_16SC2`` map returned by `convert_maps`. With ``use_relative_map``
+                set, map_x and map_y are displacements from the output pixel position.
+            map_y (Optional[np.ndarray]): The mapping for the y-coordinates, or the fixed-point
+                interpolation table returned by `convert_maps` (None for nearest).
+            mask (Optional[np.ndarray], optional): Mask to apply to the interpolated image, boolean
+                or uint8 (non-zero means valid). A scalar ``True`` means every pixel is valid
+                and skips masking. Defaults to None.
+
+        Returns:
+            np.ndarray: The interpolated image.
+
+        Raises:
+            InterpolationError: If OpenCV remap fails or inputs are invalid.
+        """
+        logger.debug("Starting image interpolation.")
+        if not isinstance(input_img, np.ndarray):
+            error_msg = "input_img must be a NumPy ndarray."
+            logger.error(error_msg)
+            raise InterpolationError(error_msg)
+        if not isinstance(map_x, np.ndarray) or not (
+            isinstance(map_y, np.ndarray) or (map_y is None and self._is_fixed_point(map_x))
+        ):
+            error_msg = "map_x and map_y must be NumPy ndarrays."
+            logger.error(error_msg)
+            raise InterpolationError(error_msg)
+
+        return self.apply(self._cached_maps(map_x, map_y, input_img.shape), input_img, mask)
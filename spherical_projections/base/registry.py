@@ -2,22 +2,28 @@
 
 from typing import Any, Dict, Optional, Type, Union
 import logging
+import weakref
 
 logger = logging.getLogger('spherical_projections.registry')
 
 class RegistryBase(type):
     """
     Metaclass to automatically register classes in a central REGISTRY dictionary.
+
+    The registry holds weak references, so dynamically created subclasses (test
+    parametrizations, notebook reloads) are released once nothing else uses them.
+    Classes named ``Base*`` or defining ``_abstract = True`` are not registered.
     """
 
-    REGISTRY = {}
+    REGISTRY = weakref.WeakValueDictionary()
 
     def __new__(cls, name, bases, attrs):
         """
-        Create a new class and register it in the REGISTRY.
+        Create a new class and register it in the REGISTRY unless it is abstract.
         """
         new_cls = type.__new__(cls, name, bases, attrs)
-        cls.REGISTRY[new_cls.__name__] = new_cls
+        if not attrs.get('_abstract', False) and not name.startswith('Base'):
+            cls.REGISTRY[new_cls.__name__] = new_cls
         return new_cls
 
     @classmethod
@@ -1,13 +1,28 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/base/transform.py
 
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 import numpy as np
 import logging
+from .._optional import NUMBA_AVAILABLE, njit, prange
 from ..exceptions import TransformationError, ConfigurationError
 
 # Initialize logger for this module
 logger = logging.getLogger('spherical_projections.base.transform')
 
+
+@njit(parallel=True, fastmath=True, cache=True, error_model='numpy')
+def _affine_pair(a, b, scale_a, offset_a, scale_b, offset_b, out_a, out_b):
+    """
+    Fused ``a * scale_a + offset_a`` and ``b * scale_b + offset_b`` over a 2-D grid.
+
+    Both inputs are read once and both maps written once, in parallel over rows.
+    """
+    rows, cols = out_a.shape
+    for j in prange(rows):
+        for i in range(cols):
+            out_a[j, i] = a[j, i] * scale_a + offset_a
+            out_b[j, i] = b[j, i] * scale_b + offset_b
+
 class BaseCoordinateTransformer:
     """
     Utility class for transforming coordinates between different systems.
@@ -23,12 +38,148 @@ class BaseCoordinateTransformer:
         logger.debug("Initializing BaseCoordinateTransformer.")
         self.config = config
 
+    @staticmethod
+    def _affine_coords(
+        values: np.ndarray, scale: float, offset: float, dtype: Any = np.float32, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Compute ``values * scale + offset`` into a fresh array of the requested dtype.
+
+        The result is written with ``out=`` ufuncs, so float64 inputs are converted
+        while computing rather than through an extra ``astype`` copy downstream.
+
+        Args:
+            values (np.ndarray): Input coordinates.
+            scale (float): Multiplicative factor.
+            offset (float): Additive offset.
+            dtype (Any): Dtype of the result. Defaults to float32, the map type used by ``cv2.remap``.
+            out (Optional[np.ndarray]): Array to write into instead of allocating one,
+                e.g. a block of a larger map. Its dtype takes precedence over ``dtype``.
+
+        Returns:
+            np.ndarray: The transformed coordinates.
+        """
+        if out is None:
+            out = np.empty(np.shape(values), dtype=dtype)
+        np.multiply(values, scale, out=out)
+        np.add(out, offset, out=out)
+        return out
+
     @classmethod
+    def _affine_coords_pair(
+        cls,
+        a: np.ndarray,
+        b: np.ndarray,
+        affine_a: Tuple[float, float],
+        affine_b: Tuple[float, float],
+        dtype: Any = np.float32,
+        out_a: Optional[np.ndarray] = None,
+        out_b: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply `_affine_coords` to both coordinates of a map pair.
+
+        Same-shaped 2-D inputs go through a single fused Numba pass when Numba is
+        available; otherwise each map is computed with `_affine_coords`.
+
+        Args:
+            a (np.ndarray): First input coordinates (the x-map source).
+            b (np.ndarray): Second input coordinates (the y-map source).
+            affine_a (Tuple[float, float]): ``(scale, offset)`` applied to ``a``.
+            affine_b (Tuple[float, float]): ``(scale, offset)`` applied to ``b``.
+            dtype (Any): Dtype of the results. Defaults to float32.
+            out_a (Optional[np.ndarray]): Preallocated result for ``a``.
+            out_b (Optional[np.ndarray]): Preallocated result for ``b``.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The transformed coordinates.
+        """
+        shape = np.shape(a)
+        if NUMBA_AVAILABLE and len(shape) == 2 and np.shape(b) == shape and all(
+            out is None or out.shape == shape for out in (out_a, out_b)
+        ):
+            if out_a is None:
+                out_a = np.empty(shape, dtype=dtype)
+            if out_b is None:
+                out_b = np.empty(shape, dtype=dtype)
+            _affine_pair(a, b, float(affine_a[0]), float(affine_a[1]),
+                         float(affine_b[0]), float(affine_b[1]), out_a, out_b)
+            return out_a, out_b
+        return (
+            cls._affine_coords(a, *affine_a, dtype=dtype, out=out_a),
+            cls._affine_coords(b, *affine_b, dtype=dtype, out=out_b),
+        )
+
+    def _validate_inputs(self, array: np.ndarray, name: str) -> None:
+        """
+        Validate input arrays to ensure they are NumPy arrays.
+
+        Args:
+            array (np.ndarray): Input array to validate.
+            name (str): Name of the array for error messages.
+
+        Raises:
+            TransformationError: If the input is not a NumPy ndarray.
+        """
+        if not isinstance(array, np.ndarray):
+            error_msg = f"{name} must be a NumPy ndarray."
+            logger.error(error_msg)
+            raise TransformationError(error_msg)
+
+    @staticmethod
+    def _axis_affine(min_val: float, max_val: float, size: int) -> Tuple[float, float]:
+        """
+        Scale and offset mapping ``[min_val, max_val]`` onto ``[0, size-1]``.
+
+        Args:
+            min_val (float): Value mapped to pixel 0.
+            max_val (float): Value mapped to pixel ``size - 1``.
+            size (int): Size of the target axis.
+
+        Returns:
+            Tuple[float, float]: ``(scale, offset)`` for `_affine_coords`.
+        """
+        scale = (size - 1) / (max_val - min_val)
+        return scale, -min_val * scale
+
+    def _compute_image_coords(
+        self,
+        values: np.ndarray,
+        min_val: float,
+        max_val: float,
+        size: int,
+        dtype: Any = np.float32,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Generalized method to compute normalized image coordinates.
+
+        Args:
+            values (np.ndarray): Input values to normalize (e.g., lat, lon, x, y).
+            min_val (float): Minimum value for normalization.
+            max_val (float): Maximum value for normalization.
+            size (int): Size of the target axis.
+            dtype (Any): Dtype of the result. Defaults to float32.
+            out (Optional[np.ndarray]): Preallocated array to write the result into.
+
+        Returns:
+            np.ndarray: Normalized image coordinates scaled to [0, size-1].
+        """
+        normalized = self._affine_coords(
+            values, *self._axis_affine(min_val, max_val, size), dtype=dtype, out=out
+        )
+        logger.debug("Computed normalized image coordinates.")
+        return normalized
+
     def spherical_to_image_coords(
-        lat: np.ndarray, 
-        lon: np.ndarray, 
-        config: Any, 
-        shape: Tuple[int, int, ...]
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        shape: Tuple[int, int],
+        dtype: Any = np.float32,
+        *,
+        out_x: Optional[np.ndarray] = None,
+        out_y: Optional[np.ndarray] = None
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Placeholder method for converting spherical coordinates to image coordinates.
@@ -36,13 +187,17 @@ class BaseCoordinateTransformer:
         Raises:
             NotImplementedError: This method must be implemented by a subclass.
         """
-        raise NotImplementedError("Subclasses must implement forward.")
+        raise NotImplementedError("Subclasses must implement spherical_to_image_coords.")
 
-    @staticmethod
     def projection_to_image_coords(
-        x: np.ndarray, 
-        y: np.ndarray, 
-        config: Any
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        config: Any,
+        dtype: Any = np.float32,
+        *,
+        out_x: Optional[np.ndarray] = None,
+        out_y: Optional[np.ndarray] = None
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Placeholder method for converting projection coordinates to image coordinates.
@@ -50,4 +205,4 @@ class BaseCoordinateTransformer:
         Raises:
             NotImplementedError: This method must be implemented by a subclass.
         """
-        raise NotImplementedError("Subclasses must implement forward.")
\ No newline at end of file
+        raise NotImplementedError("Subclasses must implement projection_to_image_coords.")
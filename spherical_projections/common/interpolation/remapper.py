@@ -41,8 +41,9 @@ class Remapper:
         self.interpolation = interpolation
         self.border_mode = border_mode
 
-        logger.info(f"Initialized Remapper with method={method}, order={order}, prefilter={prefilter}, "
-                    f"mode={mode}, interpolation={interpolation}, border_mode={border_mode}")
+        logger.info("Initialized Remapper with method=%s, order=%s, prefilter=%s, "
+                    "mode=%s, interpolation=%s, border_mode=%s",
+                    method, order, prefilter, mode, interpolation, border_mode)
 
     def remap_image(self, img, phi, lamb):
         """
@@ -53,8 +54,8 @@ class Remapper:
         :param lamb: Float array, same shape as output, specifying the "col" coordinates.
         :return: Remapped image as a NumPy array (same shape as phi,lamb + channels).
         """
-        logger.debug(f"Starting remap with method={self.method}.")
-        logger.debug(f"Image shape: {img.shape}, phi shape: {phi.shape}, lamb shape: {lamb.shape}")
+        logger.debug("Starting remap with method=%s.", self.method)
+        logger.debug("Image shape: %s, phi shape: %s, lamb shape: %s", img.shape, phi.shape, lamb.shape)
 
         if self.method == "ndimage":
             # For an image with C channels
@@ -25,7 +25,8 @@ class UnsharpMasker:
         self.kernel_size = kernel_size
         self.strength = strength
 
-        logger.info(f"Initialized UnsharpMasker with sigma={sigma}, kernel_size={kernel_size}, strength={strength}")
+        logger.info("Initialized UnsharpMasker with sigma=%s, kernel_size=%s, strength=%s",
+                    sigma, kernel_size, strength)
 
     def apply_unsharp_mask(self, image):
         """
@@ -36,11 +37,11 @@ class UnsharpMasker:
         """
         import cv2
         logger.debug("Starting unsharp masking process.")
-        logger.debug(f"Applying GaussianBlur with kernel_size={self.kernel_size}, sigma={self.sigma}")
+        logger.debug("Applying GaussianBlur with kernel_size=%s, sigma=%s", self.kernel_size, self.sigma)
 
         blurred = cv2.GaussianBlur(image, (self.kernel_size, self.kernel_size), self.sigma)
 
-        logger.debug(f"Combining original image with blurred image for sharpening with strength={self.strength}.")
+        logger.debug("Combining original image with blurred image for sharpening with strength=%s.", self.strength)
         # unsharp_mask = original_image * (1 + strength) + blurred_image * (-strength)
         sharpened = cv2.addWeighted(image, 1.0 + self.strength, blurred, -self.strength, 0)
 
@@ -23,32 +23,35 @@ def register_default_projections():
     """
     Register default projections with their components.
 
+    Idempotent: projections already present in the registry (from an earlier call
+    or registered by the user under the same name) are left untouched.
+
     Raises:
         RegistrationError: If registration of any default projection fails.
     """
     logger.debug("Registering default projections.")
     try:
         # Register Gnomonic projection
-        ProjectionRegistry.register("gnomonic", {
-            "config": GnomonicConfig,
-            "grid_generation": GnomonicGridGeneration,
-            "projection_strategy": GnomonicProjectionStrategy,
-            "interpolation": BaseInterpolation,
-            "transformer": GnomonicTransformer,  # Updated to GnomonicTransformer
-        })
-        logger.info("Default projection 'gnomonic' registered successfully.")
+        if not ProjectionRegistry.is_registered("gnomonic"):
+            ProjectionRegistry.register("gnomonic", {
+                "config": GnomonicConfig,
+                "grid_generation": GnomonicGridGeneration,
+                "projection_strategy": GnomonicProjectionStrategy,
+                "interpolation": BaseInterpolation,
+                "transformer": GnomonicTransformer,  # Updated to GnomonicTransformer
+            })
+            logger.info("Default projection 'gnomonic' registered successfully.")
 
         # Register Mercator projection
-        ProjectionRegistry.register("mercator", {
-            "config": MercatorConfig,
-            "grid_generation": MercatorGridGeneration,
-            "projection_strategy": MercatorProjectionStrategy,
-            "interpolation": BaseInterpolation,
-            "transformer": MercatorTransformer,  # Updated to MercatorTransformer
-        })
-
-
-        logger.info("Default projection 'mercator' registered successfully.")
+        if not ProjectionRegistry.is_registered("mercator"):
+            ProjectionRegistry.register("mercator", {
+                "config": MercatorConfig,
+                "grid_generation": MercatorGridGeneration,
+                "projection_strategy": MercatorProjectionStrategy,
+                "interpolation": BaseInterpolation,
+                "transformer": MercatorTransformer,  # Updated to MercatorTransformer
+            })
+            logger.info("Default projection 'mercator' registered successfully.")
 
     except RegistrationError as e:
         logger.exception("Failed to register default projections.")
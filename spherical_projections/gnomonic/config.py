@@ -3,8 +3,11 @@
 from typing import Any, Optional
 from pydantic import BaseModel, Field, validator
 import cv2
+import numpy as np
 import logging
 from ..exceptions import ConfigurationError
+from ..base._model_config import ModelConfigMixin
+from ..base._pydantic import PYDANTIC_V2, FROZEN_MODEL_CONFIG, FrozenModelConfig
 
 # Initialize logger for this module
 logger = logging.getLogger('spherical_projections.gnomonic_projection.gnomonic.config')
@@ -32,6 +35,13 @@ class GnomonicConfigModel(BaseModel):
     interpolation: Optional[int] = Field(default=cv2.INTER_LINEAR, description="Interpolation method for OpenCV remap.")
     borderMode: Optional[int] = Field(default=cv2.BORDER_CONSTANT, description="Border mode for OpenCV remap.")
     borderValue: Optional[Any] = Field(default=0, description="Border value for OpenCV remap.")
+    use_relative_map: bool = Field(default=False, description="Remap with displacement maps (cv2.WARP_RELATIVE_MAP).")
+    fixed_point_maps: Optional[bool] = Field(
+        default=None,
+        description="Precompute fixed-point remap maps: None for nearest/linear/Lanczos, True to add area/cubic, False for float maps."
+    )
+    dtype: Any = Field(default=np.float32, description="Floating point type of the projection grids.")
+    backend: str = Field(default="numpy", description="Array library grids are built with: 'numpy' or 'cupy'.")
 
     @validator('fov_deg')
     def validate_fov(cls, v):
@@ -42,10 +52,21 @@ class GnomonicConfigModel(BaseModel):
             raise ValueError("Field of view (fov_deg) must be between 0 and 180 degrees.")
         return v
 
-    class Config:
-        arbitrary_types_allowed = True
+    @validator('backend')
+    def validate_backend(cls, v):
+        """
+        Validate that the grid backend is a supported array library.
+        """
+        if v not in ("numpy", "cupy"):
+            raise ValueError("backend must be 'numpy' or 'cupy'.")
+        return v
+
+    if PYDANTIC_V2:
+        model_config = FROZEN_MODEL_CONFIG
+    else:  # pragma: no cover - depends on the installed Pydantic
+        Config = FrozenModelConfig
 
-class GnomonicConfig:
+class GnomonicConfig(ModelConfigMixin):
     """
     Configuration class for Gnomonic projections using Pydantic for validation.
 
@@ -54,6 +75,9 @@ class GnomonicConfig:
     and managed efficiently.
     """
 
+    _model = GnomonicConfigModel
+    _logger = logger
+
     def __init__(self, **kwargs: Any) -> None:
         """
         Initialize the GnomonicConfig with provided parameters.
@@ -66,59 +90,9 @@ class GnomonicConfig:
         """
         logger.debug("Initializing GnomonicConfig with parameters: %s", kwargs)
         try:
-            self.config = GnomonicConfigModel(**kwargs)
+            self._set_model(self._model(**kwargs))
             logger.info("GnomonicConfig initialized successfully.")
         except Exception as e:
             error_msg = f"Failed to initialize GnomonicConfig: {e}"
             logger.exception(error_msg)
             raise ConfigurationError(error_msg) from e
-
-    def update(self, **kwargs: Any) -> None:
-        """
-        Update configuration parameters dynamically.
-
-        Args:
-            **kwargs (Any): Parameters to update in the configuration.
-
-        Raises:
-            ConfigurationError: If updating fails due to invalid parameters.
-        """
-        logger.debug(f"Updating GnomonicConfig with parameters: {kwargs}")
-        try:
-            updated_config = self.config.copy(update=kwargs)
-            self.config = updated_config
-            logger.info("GnomonicConfig updated successfully.")
-        except Exception as e:
-            error_msg = f"Failed to update GnomonicConfig: {e}"
-            logger.exception(error_msg)
-            raise ConfigurationError(error_msg) from e
-
-    def __getattr__(self, item: str) -> Any:
-        """
-        Access configuration parameters as attributes.
-
-        Args:
-            item (str): Parameter name.
-
-        Returns:
-            Any: The value of the parameter if it exists.
-
-        Raises:
-            AttributeError: If the parameter does not exist.
-        """
-        logger.debug(f"Accessing GnomonicConfig attribute '{item}'.")
-        try:
-            return getattr(self.config, item)
-        except AttributeError:
-            error_msg = f"'GnomonicConfig' object has no attribute '{item}'"
-            logger.error(error_msg)
-            raise AttributeError(error_msg) from None
-
-    def __repr__(self) -> str:
-        """
-        String representation of the configuration.
-
-        Returns:
-            str: Human-readable string of configuration parameters.
-        """
-        return f"GnomonicConfig({self.config.dict()})"
\ No newline at end of file
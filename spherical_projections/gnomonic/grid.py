@@ -1,44 +1,239 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/gnomonic/grid.py
 
-from typing import Any, Tuple
-from ..base.grid import BaseGridGeneration
-from .config import GnomonicConfig
-from ..exceptions import GridGenerationError
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+from ..base.grid import BaseGridGeneration, _symmetric_axis, _uniform_axis
+from ..base._validation import missing_attributes
+from .._optional import CUPY_AVAILABLE, cupy
+from ..exceptions import ConfigurationError, GridGenerationError
 import numpy as np
 import logging
 
 logger = logging.getLogger('spherical_projections.gnomonic_projection.gnomonic.grid')
 
+_REQUIRED_ATTRIBUTES = (
+    "fov_deg", "R", "x_points", "y_points",
+    "lon_min", "lon_max", "lon_points", "lat_min", "lat_max", "lat_points",
+)
+
+
+@lru_cache(maxsize=8)
+def _projection_grid(
+    fov_deg: float, R: float, x_points: int, y_points: int, dtype: np.dtype
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the read-only forward-projection grid for a field of view.
+
+    Args:
+        fov_deg (float): Field of view in degrees.
+        R (float): Radius of the sphere.
+        x_points (int): Number of grid points in the x-direction.
+        y_points (int): Number of grid points in the y-direction.
+        dtype (np.dtype): Floating point type of the grid.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Broadcastable ``(1, W)`` X and ``(H, 1)`` Y grids.
+    """
+    # The grid is centered on the tangent point, so both axes are symmetric about zero.
+    extent = np.tan(np.deg2rad(fov_deg / 2)) * R
+    x_vals = _symmetric_axis(extent, x_points, dtype)
+    y_vals = _symmetric_axis(extent, y_points, dtype)
+    x_vals.setflags(write=False)
+    y_vals.setflags(write=False)
+    return x_vals[np.newaxis, :], y_vals[:, np.newaxis]
+
+
+@lru_cache(maxsize=8)
+def _spherical_grid(
+    lon_min: float, lon_max: float, lon_points: int,
+    lat_min: float, lat_max: float, lat_points: int,
+    delta_lat: float, delta_lon: float, dtype: np.dtype
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the read-only (lon, lat) grid for backward projection.
+
+    Args:
+        lon_min (float): Minimum longitude in degrees.
+        lon_max (float): Maximum longitude in degrees.
+        lon_points (int): Number of longitude points.
+        lat_min (float): Minimum latitude in degrees.
+        lat_max (float): Maximum latitude in degrees.
+        lat_points (int): Number of latitude points.
+        delta_lat (float): Offset added to the latitudes.
+        delta_lon (float): Offset added to the longitudes.
+        dtype (np.dtype): Floating point type of the grid.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Broadcastable ``(1, W)`` longitude and ``(H, 1)``
+        latitude grids.
+    """
+    lon_vals = _uniform_axis(lon_min, lon_max, lon_points, dtype) + delta_lon
+    lat_vals = _uniform_axis(lat_min, lat_max, lat_points, dtype) + delta_lat
+    lon_vals.setflags(write=False)
+    lat_vals.setflags(write=False)
+    return lon_vals[np.newaxis, :], lat_vals[:, np.newaxis]
+
+
+def _device_grid(
+    direction: str, config: Any, delta_lat: float, delta_lon: float, dtype: np.dtype
+) -> Tuple[Any, Any]:
+    """
+    Build a grid on the GPU with CuPy.
+
+    Device grids are not memoized; they are meant for callers that keep the rest
+    of their pipeline on the device.
+
+    Args:
+        direction (str): ``'forward'`` or ``'backward'``.
+        config (Any): Configuration providing the grid parameters.
+        delta_lat (float): Offset added to the latitudes of the backward grid.
+        delta_lon (float): Offset added to the longitudes of the backward grid.
+        dtype (np.dtype): Floating point type of the grid.
+
+    Returns:
+        Tuple[Any, Any]: Broadcastable ``(1, W)`` and ``(H, 1)`` CuPy arrays.
+    """
+    if direction == "forward":
+        extent = np.tan(np.deg2rad(config.fov_deg / 2)) * config.R
+        x_vals = cupy.linspace(-extent, extent, config.x_points, dtype=dtype)
+        y_vals = cupy.linspace(-extent, extent, config.y_points, dtype=dtype)
+    else:
+        x_vals = cupy.linspace(config.lon_min, config.lon_max, config.lon_points, dtype=dtype) + delta_lon
+        y_vals = cupy.linspace(config.lat_min, config.lat_max, config.lat_points, dtype=dtype) + delta_lat
+    return x_vals[None, :], y_vals[:, None]
+
+
 class GnomonicGridGeneration(BaseGridGeneration):
     """
     Grid generation for the Gnomonic projection.
+
+    Grids are memoized on the parameters they depend on and returned read-only,
+    so repeated projections with an unchanged configuration reuse them.
     """
 
-    def projection_grid(self, delta_lat=0, delta_lon=0):
+    def __init__(self, config):
+        """
+        Initialize the GnomonicGridGeneration with the given configuration.
+
+        Args:
+            config: Configuration object providing the grid parameters.
+
+        Raises:
+            ConfigurationError: If required attributes are missing.
+        """
+        # Duck-typed check, remembered per configuration object, so generators can
+        # be created in tight loops without re-checking the same configuration.
+        missing = missing_attributes(config, _REQUIRED_ATTRIBUTES)
+        if missing:
+            error_msg = f"Configuration object is missing required attributes: {', '.join(missing)}"
+            logger.error(error_msg)
+            raise ConfigurationError(error_msg)
+        self.config = config
+
+    def _array_module(self) -> Any:
+        """
+        Return the array library selected by the configured ``backend``.
+
+        Returns:
+            Any: ``numpy``, or ``cupy`` for the ``'cupy'`` backend.
+
+        Raises:
+            GridGenerationError: If the CuPy backend is selected but CuPy is not installed.
+        """
+        if getattr(self.config, "backend", "numpy") != "cupy":
+            return np
+        if not CUPY_AVAILABLE:
+            error_msg = "The 'cupy' grid backend requires CuPy, which is not installed."
+            logger.error(error_msg)
+            raise GridGenerationError(error_msg)
+        return cupy
+
+    def _create_grid(
+        self,
+        direction: str,
+        delta_lat=0,
+        delta_lon=0,
+        dtype=None,
+        out: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build (or fetch from the memo) the grid for one projection direction.
+
+        Args:
+            direction (str): ``'forward'`` for the projection-plane grid or ``'backward'``
+                for the (lon, lat) grid.
+            delta_lat: Offset added to the latitudes of the backward grid.
+            delta_lon: Offset added to the longitudes of the backward grid.
+            dtype: Floating point type of the grid. Defaults to the dtype of ``out`` if
+                given, else the configured ``dtype``.
+            out (Optional[Tuple[np.ndarray, np.ndarray]]): Writable arrays to fill with the
+                two grids instead of returning the shared read-only ones. Each may be the
+                broadcastable ``(1, W)`` / ``(H, 1)`` shape or the dense ``(H, W)`` one.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Broadcastable ``(1, W)`` and ``(H, 1)`` grids, or
+            ``out``. With the ``'cupy'`` backend these are CuPy arrays on the device.
+
+        Raises:
+            GridGenerationError: If the direction is unknown.
+            ValueError: If ``out`` cannot hold the grid (raised by NumPy).
+        """
+        if dtype is None:
+            dtype = out[0].dtype if out is not None else getattr(self.config, "dtype", np.float32)
+        if direction not in ("forward", "backward"):
+            error_msg = f"Unknown grid direction '{direction}'; expected 'forward' or 'backward'."
+            logger.error(error_msg)
+            raise GridGenerationError(error_msg)
+        xp = self._array_module()
+        if xp is not np:
+            grids = _device_grid(direction, self.config, delta_lat, delta_lon, np.dtype(dtype))
+        elif direction == "forward":
+            grids = _projection_grid(
+                self.config.fov_deg, self.config.R, self.config.x_points, self.config.y_points,
+                np.dtype(dtype)
+            )
+        else:
+            grids = _spherical_grid(
+                self.config.lon_min, self.config.lon_max, self.config.lon_points,
+                self.config.lat_min, self.config.lat_max, self.config.lat_points,
+                delta_lat, delta_lon, np.dtype(dtype)
+            )
+        if out is None:
+            return grids
+        xp.copyto(out[0], grids[0])
+        xp.copyto(out[1], grids[1])
+        return out[0], out[1]
+
+    def projection_grid(self, delta_lat=0, delta_lon=0, dtype=None, out=None):
         """
         Generate the forward-projection grid (X, Y) for the Gnomonic projection.
 
+        Args:
+            dtype: Floating point type of the grid. Defaults to the configured ``dtype``
+                (float32, the map type consumed by ``cv2.remap``, so no conversion is
+                needed downstream).
+            out: Optional ``(grid_x, grid_y)`` buffers to write the grid into, see
+                `_create_grid`.
+
         Returns:
-            Tuple[np.ndarray, np.ndarray]: The X and Y coordinate grids for forward projection.
+            Tuple[np.ndarray, np.ndarray]: The X and Y coordinate grids for forward projection,
+            as broadcastable ``(1, W)`` and ``(H, 1)`` views rather than dense arrays.
         """
         logger.debug("Generating Gnomonic projection grid.")
-        half_fov_rad = np.deg2rad(self.config.fov_deg / 2)
-        x_max = np.tan(half_fov_rad) * self.config.R
-        y_max = np.tan(half_fov_rad) * self.config.R
-        x_vals = np.linspace(-x_max, x_max, self.config.x_points)
-        y_vals = np.linspace(-y_max, y_max, self.config.y_points)
-        grid_x, grid_y = np.meshgrid(x_vals, y_vals)
-        return grid_x, grid_y
+        return self._create_grid("forward", delta_lat, delta_lon, dtype, out)
 
-    def spherical_grid(self, delta_lat=0, delta_lon=0):
+    def spherical_grid(self, delta_lat=0, delta_lon=0, dtype=None, out=None):
         """
         Generate the (lon, lat) grid for backward projection.
 
+        Args:
+            dtype: Floating point type of the grid. Defaults to the configured ``dtype``.
+            out: Optional ``(lon_grid, lat_grid)`` buffers to write the grid into, see
+                `_create_grid`.
+
         Returns:
-            Tuple[np.ndarray, np.ndarray]: The longitude and latitude grids.
+            Tuple[np.ndarray, np.ndarray]: The longitude and latitude grids, as broadcastable
+            ``(1, W)`` and ``(H, 1)`` views rather than dense arrays.
         """
         logger.debug("Generating Gnomonic spherical grid.")
-        lon_vals = np.linspace(self.config.lon_min, self.config.lon_max, self.config.lon_points) + delta_lon
-        lat_vals = np.linspace(self.config.lat_min, self.config.lat_max, self.config.lat_points) + delta_lat
-        grid_lon, grid_lat = np.meshgrid(lon_vals, lat_vals)
-        return grid_lon, grid_lat
\ No newline at end of file
+        return self._create_grid("backward", delta_lat, delta_lon, dtype, out)
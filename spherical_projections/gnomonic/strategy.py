@@ -1,14 +1,295 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/gnomonic/strategy.py
 
-from typing import Any, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from ..base.strategy import BaseProjectionStrategy
 from .config import GnomonicConfig
 from ..exceptions import ProcessingError
+from .._optional import NUMBA_AVAILABLE, NUMEXPR_AVAILABLE, cupy, njit, numexpr, prange
 import numpy as np
 import logging
+import math
+import threading
 
 logger = logging.getLogger('spherical_projections.gnomonic_projection.gnomonic.strategy')
 
+# Scalar conversion factors; multiplying by these avoids building temporary
+# arrays the way ``np.deg2rad([a, b])`` does.
+_DEG2RAD = np.float64(np.pi / 180.0)
+_RAD2DEG = 1.0 / _DEG2RAD
+
+
+@njit(parallel=True, fastmath=True, cache=True, error_model='numpy')
+def _gnomonic_inverse(x, y, R, sin_phi1, cos_phi1, lam0, lat_out, lon_out):
+    """
+    Fused inverse Gnomonic projection (planar -> geographic) over a 2-D grid.
+
+    Uses the rho-free form of the inverse (see ``from_projection_to_spherical``),
+    so the grid is read once and the outputs written once. ``x`` and ``y`` may be
+    broadcast views; latitude and longitude are written in degrees. The scalar
+    arguments are expected in the grid dtype, so float32 grids are evaluated in
+    single precision.
+
+    The memoized ``(1, W)`` / ``(H, 1)`` projection grid is passed in as such
+    views, so generating the grid and evaluating the trigonometry happen in this
+    one pass without a dense ``(H, W)`` coordinate array ever being built.
+    """
+    rows, cols = lat_out.shape
+    for j in prange(rows):
+        for i in range(cols):
+            xv = x[j, i]
+            yv = y[j, i]
+            m = R * cos_phi1 + yv * sin_phi1
+            z = R * sin_phi1 - yv * cos_phi1
+            phi = math.atan2(z, math.sqrt(xv * xv + m * m))
+            lam = lam0 + math.atan2(xv, m)
+            lat_out[j, i] = math.degrees(phi)
+            lon_out[j, i] = math.degrees(lam)
+
+
+@njit(parallel=True, fastmath=True, cache=True, error_model='numpy')
+def _gnomonic_forward(lat, lon, R, sin_phi1, cos_phi1, lam0, tol, x_out, y_out, mask_out):
+    """
+    Fused forward Gnomonic projection (geographic -> planar) over a 2-D grid.
+
+    Reads latitude/longitude in degrees once and writes the planar coordinates
+    and the validity mask (``cos_c > -tol``, see `_horizon_tol`) in the same pass.
+    As for the inverse, the scalar arguments are expected in the grid dtype.
+    """
+    rows, cols = x_out.shape
+    # math.sin/cos lower to the libm single-precision routines for float32 grids;
+    # inlined minimax polynomials measured no faster here, so they are not used.
+    for j in prange(rows):
+        for i in range(cols):
+            phi = math.radians(lat[j, i])
+            dlam = math.radians(lon[j, i]) - lam0
+            sin_phi = math.sin(phi)
+            cos_phi = math.cos(phi)
+            cos_dlam = math.cos(dlam)
+            cos_c = sin_phi1 * sin_phi + cos_phi1 * cos_phi * cos_dlam
+            if cos_c == 0.0:
+                cos_c = 1e-10
+            scale = R / cos_c
+            x_out[j, i] = scale * cos_phi * math.sin(dlam)
+            y_out[j, i] = scale * (cos_phi1 * sin_phi - sin_phi1 * cos_phi * cos_dlam)
+            mask_out[j, i] = cos_c > -tol
+
+
+@njit(parallel=True, fastmath=True, cache=True, error_model='numpy')
+def _gnomonic_inverse_batch(x, y, R, sin_phi1, cos_phi1, lam0, lat_out, lon_out):
+    """
+    `_gnomonic_inverse` for a batch of projection centers over one grid.
+
+    ``sin_phi1``, ``cos_phi1`` and ``lam0`` hold one value per center and the
+    outputs are ``(B, H, W)``. The parallel loop runs over every (center, row)
+    pair, so batches of small grids still keep all threads busy.
+    """
+    batch, rows, cols = lat_out.shape
+    for k in prange(batch * rows):
+        b = k // rows
+        j = k % rows
+        sp = sin_phi1[b]
+        cp = cos_phi1[b]
+        for i in range(cols):
+            xv = x[j, i]
+            yv = y[j, i]
+            m = R * cp + yv * sp
+            z = R * sp - yv * cp
+            lat_out[b, j, i] = math.degrees(math.atan2(z, math.sqrt(xv * xv + m * m)))
+            lon_out[b, j, i] = math.degrees(lam0[b] + math.atan2(xv, m))
+
+
+@njit(parallel=True, fastmath=True, cache=True, error_model='numpy')
+def _gnomonic_inverse_equatorial(x, y, R, lam0, lat_out, lon_out):
+    """
+    `_gnomonic_inverse` specialized to a center on the equator (``phi1 = 0``).
+
+    There ``m = R`` and ``z = -y``, so for a ``(1, W)`` / ``(H, 1)`` grid given as
+    the 1-D axes ``x`` and ``y`` the longitude and ``hypot(x, R)`` depend on the
+    column only. They are computed once per column, leaving one ``atan2`` per point
+    instead of two.
+    """
+    rows, cols = lat_out.shape
+    h = np.empty(cols, dtype=lat_out.dtype)
+    lon_row = np.empty(cols, dtype=lon_out.dtype)
+    for i in range(cols):
+        h[i] = math.sqrt(x[i] * x[i] + R * R)
+        lon_row[i] = math.degrees(lam0 + math.atan2(x[i], R))
+    for j in prange(rows):
+        z = -y[j]
+        for i in range(cols):
+            lat_out[j, i] = math.degrees(math.atan2(z, h[i]))
+            lon_out[j, i] = lon_row[i]
+
+
+@njit(parallel=True, fastmath=True, cache=True, error_model='numpy')
+def _gnomonic_forward_separable(
+    sin_phi, cos_phi, sin_dlam, cos_dlam, R, sin_phi1, cos_phi1, tol, x_out, y_out, mask_out
+):
+    """
+    `_gnomonic_forward` for a grid whose latitude varies by row only and whose
+    longitude varies by column only.
+
+    The trigonometry is taken from per-row (``sin_phi``, ``cos_phi``) and
+    per-column (``sin_dlam``, ``cos_dlam``) tables, so each point costs a few
+    multiply-adds and a division; the column tables are reused by every row and
+    stay in cache.
+    """
+    rows, cols = x_out.shape
+    for j in prange(rows):
+        a = sin_phi1 * sin_phi[j]
+        b = cos_phi1 * cos_phi[j]
+        c = cos_phi1 * sin_phi[j]
+        d = sin_phi1 * cos_phi[j]
+        e = cos_phi[j]
+        for i in range(cols):
+            cos_c = a + b * cos_dlam[i]
+            if cos_c == 0.0:
+                cos_c = 1e-10
+            scale = R / cos_c
+            x_out[j, i] = scale * e * sin_dlam[i]
+            y_out[j, i] = scale * (c - d * cos_dlam[i])
+            mask_out[j, i] = cos_c > -tol
+
+
+@lru_cache(maxsize=None)
+def _cupy_kernels() -> Tuple[Any, Any]:
+    """
+    CUDA versions of the fused inverse and forward kernels, built on first use.
+
+    Each is a CuPy ``ElementwiseKernel`` running one thread per grid point with
+    the same formulas as `_gnomonic_inverse` and `_gnomonic_forward`; inputs are
+    broadcast by CuPy, so the ``(1, W)`` / ``(H, 1)`` device grids are not expanded.
+
+    Returns:
+        Tuple[Any, Any]: The inverse and forward kernels.
+    """
+    inverse = cupy.ElementwiseKernel(
+        "T x, T y, T R, T sin_phi1, T cos_phi1, T lam0",
+        "T lat, T lon",
+        """
+        T m = R * cos_phi1 + y * sin_phi1;
+        T z = R * sin_phi1 - y * cos_phi1;
+        lat = atan2(z, sqrt(x * x + m * m)) * (T)57.29577951308232;
+        lon = (lam0 + atan2(x, m)) * (T)57.29577951308232;
+        """,
+        "gnomonic_inverse",
+    )
+    forward = cupy.ElementwiseKernel(
+        "T lat, T lon, T R, T sin_phi1, T cos_phi1, T lam0, T tol",
+        "T x, T y, bool mask",
+        """
+        T phi = lat * (T)0.017453292519943295;
+        T dlam = lon * (T)0.017453292519943295 - lam0;
+        T sin_phi = sin(phi);
+        T cos_phi = cos(phi);
+        T cos_dlam = cos(dlam);
+        T cos_c = sin_phi1 * sin_phi + cos_phi1 * cos_phi * cos_dlam;
+        if (cos_c == 0) cos_c = (T)1e-10;
+        T scale = R / cos_c;
+        x = scale * cos_phi * sin(dlam);
+        y = scale * (cos_phi1 * sin_phi - sin_phi1 * cos_phi * cos_dlam);
+        mask = cos_c > -tol;
+        """,
+        "gnomonic_forward",
+    )
+    return inverse, forward
+
+
+def _on_device(*arrays: Any) -> bool:
+    """
+    Whether any of the arrays lives on the GPU as a CuPy array.
+
+    Args:
+        *arrays (Any): Arrays or scalars to check.
+
+    Returns:
+        bool: True if CuPy is available and one of the inputs is a ``cupy.ndarray``.
+    """
+    return cupy is not None and any(isinstance(a, cupy.ndarray) for a in arrays)
+
+
+@lru_cache(maxsize=64)
+def _center_trig(phi1_deg: float, lam0_deg: float) -> Tuple[float, float, float]:
+    """
+    Trigonometry of a projection center, as plain floats.
+
+    Args:
+        phi1_deg (float): Latitude of the projection center in degrees.
+        lam0_deg (float): Longitude of the projection center in degrees.
+
+    Returns:
+        Tuple[float, float, float]: sin(phi1), cos(phi1) and lam0 in radians.
+    """
+    phi1_rad = math.radians(phi1_deg)
+    logger.debug("Projection center (phi1_rad, lam0_rad): (%s, %s)", phi1_rad, math.radians(lam0_deg))
+    return math.sin(phi1_rad), math.cos(phi1_rad), math.radians(lam0_deg)
+
+
+def _horizon_tol(dtype: Any) -> float:
+    """
+    Rounding slack for the ``cos_c >= 0`` visibility test in the given dtype.
+
+    In float32, points on the horizon (e.g. the poles for an equatorial center)
+    can come out with ``cos_c`` a fraction of an ulp below zero, because the
+    trigonometry is evaluated at rounded angles, and would be masked although
+    they are valid at float64 precision. One ulp of slack keeps them; a wider
+    margin starts admitting points that are genuinely behind the horizon.
+
+    Args:
+        dtype (Any): Floating point type of the grid.
+
+    Returns:
+        float: The slack; points with ``cos_c >= -tol`` are treated as visible.
+    """
+    return float(np.finfo(dtype).eps)
+
+
+def _kernel_shape(shape: Tuple[int, ...]) -> Optional[Tuple[int, int]]:
+    """
+    2-D shape the fused kernels walk for inputs of the given broadcast shape.
+
+    Grids are walked as they are; 1-D point lists are walked as a single row,
+    which is a free view of the inputs and outputs.
+
+    Args:
+        shape (Tuple[int, ...]): Broadcast shape of the kernel inputs.
+
+    Returns:
+        Optional[Tuple[int, int]]: The kernel shape, or None if the kernels do not
+        handle inputs of this dimensionality.
+    """
+    if len(shape) == 2:
+        return shape
+    if len(shape) == 1:
+        return (1, shape[0])
+    return None
+
+
+def _evaluate_into(
+    expr: str, local_dict: Dict[str, Any], dtype: Any, out: Optional[np.ndarray]
+) -> np.ndarray:
+    """
+    Evaluate a NumExpr expression, writing into ``out`` when one is given.
+
+    NumExpr writes in place only into C-contiguous arrays of the result dtype;
+    any other ``out`` receives a copy of the result instead.
+
+    Args:
+        expr (str): The expression.
+        local_dict (Dict[str, Any]): Operands referenced by the expression.
+        dtype (Any): Dtype the expression evaluates to.
+        out (Optional[np.ndarray]): Preallocated array for the result.
+
+    Returns:
+        np.ndarray: The result; ``out`` itself when one was given.
+    """
+    if out is None or (out.dtype == dtype and out.flags.c_contiguous):
+        return numexpr.evaluate(expr, local_dict=local_dict, out=out)
+    np.copyto(out, numexpr.evaluate(expr, local_dict=local_dict), casting="same_kind")
+    return out
+
+
 class GnomonicProjectionStrategy(BaseProjectionStrategy):
     """
     Projection Strategy for Gnomonic Projection.
@@ -34,100 +315,504 @@ class GnomonicProjectionStrategy(BaseProjectionStrategy):
             logger.error(error_msg)
             raise TypeError(error_msg)
         self.config: GnomonicConfig = config
+        # Checked once so the per-call hot paths skip building debug messages.
+        self._debug: bool = logger.isEnabledFor(logging.DEBUG)
+        # Scratch arrays for the NumPy path, reused while the grid shape is unchanged.
+        self._buf = threading.local()
         logger.info("GnomonicProjectionStrategy initialized successfully.")
 
-    def from_projection_to_spherical(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    def _center(self) -> Tuple[float, float, float]:
+        """
+        Return the trigonometry of the projection center.
+
+        The values are memoized on ``(phi1_deg, lam0_deg)`` by `_center_trig`, so
+        they are computed once per center and shared by every strategy using it.
+
+        Returns:
+            Tuple[float, float, float]: sin(phi1), cos(phi1) and lam0 in radians.
+        """
+        return _center_trig(self.config.phi1_deg, self.config.lam0_deg)
+
+    def _scratch(self, shape: Tuple[int, ...], dtype: Any, count: int) -> List[np.ndarray]:
+        """
+        Return ``count`` uninitialized scratch arrays of the given shape and dtype.
+
+        The arrays are allocated on first use and handed out again on later calls
+        with the same shape/dtype, so the NumPy path does not allocate a fresh set
+        of full-grid temporaries per call. Only the most recent shape is kept.
+
+        Args:
+            shape (Tuple[int, ...]): Shape of the arrays.
+            dtype (Any): NumPy dtype of the arrays.
+            count (int): Number of arrays required.
+
+        Returns:
+            List[np.ndarray]: Scratch arrays; their contents must not outlive the call.
+        """
+        key = (shape, np.dtype(dtype))
+        cached = getattr(self._buf, "arrays", None)
+        if getattr(self._buf, "key", None) != key or len(cached) < count:
+            cached = [np.empty(shape, dtype=dtype) for _ in range(count)]
+            self._buf.key, self._buf.arrays = key, cached
+        return cached[:count]
+
+    def _inverse_numexpr(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        sin_phi1: float,
+        cos_phi1: float,
+        lam0_rad: float,
+        out_lat: Optional[np.ndarray] = None,
+        out_lon: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Inverse Gnomonic projection evaluated as fused NumExpr expressions.
+
+        Scalars are cast to the grid dtype so float32 grids are not upcast. The
+        rho-free form only needs the ``m`` and ``z`` terms, which are evaluated once
+        at the shape of ``y``; each output is then a single expression.
+
+        Args:
+            x (np.ndarray): X-coordinates in the planar grid.
+            y (np.ndarray): Y-coordinates in the planar grid.
+            sin_phi1 (float): Sine of the projection center latitude.
+            cos_phi1 (float): Cosine of the projection center latitude.
+            lam0_rad (float): Longitude of the projection center in radians.
+            out_lat (Optional[np.ndarray]): Preallocated array for the latitudes.
+            out_lon (Optional[np.ndarray]): Preallocated array for the longitudes.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Latitude and longitude in degrees.
+        """
+        scalar = np.result_type(x, y, np.float32).type
+        local_dict = {
+            "x": x,
+            "y": y,
+            "R": scalar(self.config.R),
+            "sin_phi1": scalar(sin_phi1),
+            "cos_phi1": scalar(cos_phi1),
+            "lam0": scalar(lam0_rad),
+            "rad2deg": scalar(_RAD2DEG),
+        }
+        # m and z depend on y alone; for broadcast grids they are (H, 1) columns.
+        local_dict["m"] = numexpr.evaluate("R * cos_phi1 + y * sin_phi1", local_dict=local_dict)
+        local_dict["z"] = numexpr.evaluate("R * sin_phi1 - y * cos_phi1", local_dict=local_dict)
+        lat = _evaluate_into("arctan2(z, sqrt(x * x + m * m)) * rad2deg", local_dict, scalar, out_lat)
+        lon = _evaluate_into("(lam0 + arctan2(x, m)) * rad2deg", local_dict, scalar, out_lon)
+        return lat, lon
+
+    def _forward_numexpr(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        sin_phi1: float,
+        cos_phi1: float,
+        lam0_rad: float,
+        out_x: Optional[np.ndarray] = None,
+        out_y: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Forward Gnomonic projection evaluated as fused NumExpr expressions.
+
+        The trigonometric terms are evaluated once, each at the shape of its own
+        input, and shared by the ``cos_c``, ``x`` and ``y`` expressions; NumExpr does
+        not eliminate common subexpressions itself. The ``cos_c == 0`` guard is folded
+        into the divisions with ``where`` rather than applied as a separate pass.
+
+        Args:
+            lat (np.ndarray): Latitude values in degrees.
+            lon (np.ndarray): Longitude values in degrees.
+            sin_phi1 (float): Sine of the projection center latitude.
+            cos_phi1 (float): Cosine of the projection center latitude.
+            lam0_rad (float): Longitude of the projection center in radians.
+            out_x (Optional[np.ndarray]): Preallocated array for the X coordinates.
+            out_y (Optional[np.ndarray]): Preallocated array for the Y coordinates.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: X and Y planar coordinates and the validity mask.
+        """
+        scalar = np.result_type(lat, lon, np.float32).type
+        local_dict = {
+            "lat": lat,
+            "lon": lon,
+            "R": scalar(self.config.R),
+            "sin_phi1": scalar(sin_phi1),
+            "cos_phi1": scalar(cos_phi1),
+            "lam0": scalar(lam0_rad),
+            "deg2rad": scalar(_DEG2RAD),
+            "eps": scalar(1e-10),
+            "tol": scalar(_horizon_tol(scalar)),
+        }
+        # For broadcast (H, 1) / (1, W) grids these are O(H + W) evaluations.
+        for name, expr in (
+            ("sin_phi", "sin(lat * deg2rad)"),
+            ("cos_phi", "cos(lat * deg2rad)"),
+            ("sin_dlam", "sin(lon * deg2rad - lam0)"),
+            ("cos_dlam", "cos(lon * deg2rad - lam0)"),
+        ):
+            local_dict[name] = numexpr.evaluate(expr, local_dict=local_dict)
+        cos_c = numexpr.evaluate(
+            "sin_phi1 * sin_phi + cos_phi1 * cos_phi * cos_dlam",
+            local_dict=local_dict,
+        )
+        local_dict["cos_c"] = cos_c
+        x = _evaluate_into(
+            "R * cos_phi * sin_dlam / where(cos_c == 0, eps, cos_c)",
+            local_dict,
+            scalar,
+            out_x,
+        )
+        y = _evaluate_into(
+            "R * (cos_phi1 * sin_phi - sin_phi1 * cos_phi * cos_dlam) / where(cos_c == 0, eps, cos_c)",
+            local_dict,
+            scalar,
+            out_y,
+        )
+        # Points on the horizon, to within rounding, count as valid.
+        mask = numexpr.evaluate("cos_c >= -tol", local_dict=local_dict)
+        return x, y, mask
+
+    def from_projection_to_spherical(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        *,
+        out_lat: Optional[np.ndarray] = None,
+        out_lon: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Perform inverse Gnomonic projection from planar grid coordinates to geographic coordinates.
 
+        The tangent-plane point is treated as the direction ``(x, m, z)`` with
+        ``m = R cos(phi1) + y sin(phi1)`` and ``z = R sin(phi1) - y cos(phi1)``, so
+        ``phi = arctan2(z, hypot(x, m))`` and ``lam = lam0 + arctan2(x, m)``. This is
+        equivalent to the textbook ``rho``/``c`` form but has no division by ``rho``
+        and stays exact at the projection center.
+
+        CuPy inputs are projected on the GPU (see `_cupy_kernels`) and the results
+        are returned as CuPy arrays.
+
         Args:
             x (np.ndarray): X-coordinates in the planar grid.
             y (np.ndarray): Y-coordinates in the planar grid.
+            out_lat (Optional[np.ndarray]): Preallocated array of the broadcast shape to
+                write the latitudes into, e.g. a buffer kept across calls on grids of
+                the same shape.
+            out_lon (Optional[np.ndarray]): Preallocated array for the longitudes.
 
         Returns:
             Tuple[np.ndarray, np.ndarray]: Arrays of latitude and longitude corresponding to the input grid points.
 
         Raises:
-            ProcessingError: If the projection computation fails.
+            ProcessingError: If the input grids cannot be broadcast together.
         """
-        logger.debug("Starting inverse Gnomonic projection (Planar to Geographic).")
+        if self._debug:
+            logger.debug("Starting inverse Gnomonic projection (Planar to Geographic).")
         try:
-            phi1_rad, lam0_rad = np.deg2rad([self.config.phi1_deg, self.config.lam0_deg])
-            logger.debug(f"Projection center (phi1_rad, lam0_rad): ({phi1_rad}, {lam0_rad})")
-
-            rho = np.sqrt(x**2 + y**2)
-            logger.debug("Computed rho (radial distances) from grid points.")
+            shape = np.broadcast_shapes(np.shape(x), np.shape(y))
+        except ValueError as e:
+            error_msg = f"Failed during inverse Gnomonic projection: {e}"
+            logger.exception(error_msg)
+            raise ProcessingError(error_msg) from e
 
-            c = np.arctan2(rho, self.config.R)
-            sin_c, cos_c = np.sin(c), np.cos(c)
-            logger.debug(f"Computed auxiliary angles c, sin_c, cos_c for rho.")
+        sin_phi1, cos_phi1, lam0_rad = self._center()
 
-            phi = np.arcsin(cos_c * np.sin(phi1_rad) - (y * sin_c * np.cos(phi1_rad)) / rho)
-            logger.debug("Computed latitude (phi) for inverse projection.")
+        if _on_device(x, y):
+            dtype = cupy.result_type(x, y, cupy.float32)
+            scalar = dtype.type
+            outputs = ()
+            if out_lat is not None or out_lon is not None:
+                outputs = (
+                    cupy.empty(shape, dtype=dtype) if out_lat is None else out_lat,
+                    cupy.empty(shape, dtype=dtype) if out_lon is None else out_lon,
+                )
+            inverse, _ = _cupy_kernels()
+            lat, lon = inverse(
+                cupy.asarray(x, dtype=dtype), cupy.asarray(y, dtype=dtype),
+                scalar(self.config.R), scalar(sin_phi1), scalar(cos_phi1), scalar(lam0_rad),
+                *outputs
+            )
+            if self._debug:
+                logger.debug("Inverse Gnomonic projection computed with the CuPy kernel.")
+            return lat, lon
 
-            lam = lam0_rad + np.arctan2(
-                x * sin_c,
-                rho * np.cos(phi1_rad) * cos_c + y * np.sin(phi1_rad) * sin_c
+        kernel_shape = _kernel_shape(shape) if NUMBA_AVAILABLE else None
+        if kernel_shape is not None:
+            dtype = np.result_type(x, y, np.float32)
+            lat = np.empty(shape, dtype=dtype) if out_lat is None else out_lat
+            lon = np.empty(shape, dtype=dtype) if out_lon is None else out_lon
+            # Scalars in the grid dtype, so float32 grids are not promoted to float64.
+            scalar = dtype.type
+            if sin_phi1 == 0.0 and len(shape) == 2 and np.shape(x) == (1, shape[1]) \
+                    and np.shape(y) == (shape[0], 1):
+                # Equatorial center (e.g. the side faces of a cube map).
+                _gnomonic_inverse_equatorial(
+                    np.ravel(x), np.ravel(y), scalar(self.config.R), scalar(lam0_rad), lat, lon
+                )
+                if self._debug:
+                    logger.debug("Inverse Gnomonic projection computed with the equatorial Numba kernel.")
+                return lat, lon
+            _gnomonic_inverse(
+                np.broadcast_to(x, shape).reshape(kernel_shape),
+                np.broadcast_to(y, shape).reshape(kernel_shape),
+                scalar(self.config.R), scalar(sin_phi1), scalar(cos_phi1), scalar(lam0_rad),
+                lat.reshape(kernel_shape), lon.reshape(kernel_shape)
             )
-            logger.debug("Computed longitude (lambda) for inverse projection.")
+            if self._debug:
+                logger.debug("Inverse Gnomonic projection computed with the fused Numba kernel.")
+            return lat, lon
+
+        if NUMEXPR_AVAILABLE:
+            lat, lon = self._inverse_numexpr(x, y, sin_phi1, cos_phi1, lam0_rad, out_lat, out_lon)
+            if self._debug:
+                logger.debug("Inverse Gnomonic projection computed with NumExpr.")
+            return lat, lon
 
-            lat = np.rad2deg(phi)
-            lon = np.rad2deg(lam)
-            logger.debug("Converted phi and lambda from radians to degrees.")
+        dtype = np.result_type(x, y, np.float32)
+        # m = R * cos(phi1) + y * sin(phi1), z = R * sin(phi1) - y * cos(phi1), taken at
+        # the shape of y, so only (H, 1) for broadcast grids.
+        m = np.add(np.multiply(y, sin_phi1, dtype=dtype), self.config.R * cos_phi1, dtype=dtype)
+        z = np.add(np.multiply(y, -cos_phi1, dtype=dtype), self.config.R * sin_phi1, dtype=dtype)
 
+        # phi = arctan2(z, hypot(x, m)), lam = lam0 + arctan2(x, m)
+        h = np.hypot(x, m, out=self._scratch(shape, dtype, 1)[0])
+        lat = np.arctan2(z, h, out=out_lat)
+        lon = np.arctan2(x, m, out=out_lon)
+        np.add(lon, lam0_rad, out=lon)
+
+        np.multiply(lat, _RAD2DEG, out=lat)
+        np.multiply(lon, _RAD2DEG, out=lon)
+
+        if self._debug:
             logger.debug("Inverse Gnomonic projection computed successfully.")
-            return lat, lon
-        except Exception as e:
-            error_msg = f"Failed during inverse Gnomonic projection: {e}"
+        return lat, lon
+
+    def from_projection_to_spherical_batch(
+        self, x: np.ndarray, y: np.ndarray, phi1_deg: Any, lam0_deg: Any
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Inverse Gnomonic projection of one planar grid for several projection centers.
+
+        Equivalent to calling `from_projection_to_spherical` once per center (e.g. per
+        video frame), but evaluated in a single pass over the whole batch. The
+        configured center is not used.
+
+        Args:
+            x (np.ndarray): X-coordinates in the planar grid.
+            y (np.ndarray): Y-coordinates in the planar grid.
+            phi1_deg (Any): Sequence of ``B`` center latitudes in degrees.
+            lam0_deg (Any): Sequence of ``B`` center longitudes in degrees.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Latitude and longitude arrays of shape
+            ``(B,) + broadcast shape of x and y``.
+
+        Raises:
+            ProcessingError: If the grids cannot be broadcast together or the center
+                sequences are not 1-D and of equal length.
+        """
+        if self._debug:
+            logger.debug("Starting batched inverse Gnomonic projection (Planar to Geographic).")
+        phi1_rad = np.radians(np.asarray(phi1_deg, dtype=np.float64))
+        lam0_rad = np.radians(np.asarray(lam0_deg, dtype=np.float64))
+        if phi1_rad.ndim != 1 or phi1_rad.shape != lam0_rad.shape:
+            error_msg = (
+                "Projection centers must be 1-D sequences of equal length, "
+                f"got shapes {phi1_rad.shape} and {lam0_rad.shape}."
+            )
+            logger.error(error_msg)
+            raise ProcessingError(error_msg)
+        try:
+            shape = np.broadcast_shapes(np.shape(x), np.shape(y))
+        except ValueError as e:
+            error_msg = f"Failed during batched inverse Gnomonic projection: {e}"
             logger.exception(error_msg)
             raise ProcessingError(error_msg) from e
 
-    def from_spherical_to_projection(self, lat: np.ndarray, lon: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        dtype = np.result_type(x, y, np.float32)
+        sin_phi1 = np.sin(phi1_rad).astype(dtype)
+        cos_phi1 = np.cos(phi1_rad).astype(dtype)
+        lam0 = lam0_rad.astype(dtype)
+        batch = len(phi1_rad)
+        R = dtype.type(self.config.R)
+
+        kernel_shape = _kernel_shape(shape) if NUMBA_AVAILABLE else None
+        if kernel_shape is not None:
+            lat = np.empty((batch,) + shape, dtype=dtype)
+            lon = np.empty_like(lat)
+            _gnomonic_inverse_batch(
+                np.broadcast_to(x, shape).reshape(kernel_shape),
+                np.broadcast_to(y, shape).reshape(kernel_shape),
+                R, sin_phi1, cos_phi1, lam0,
+                lat.reshape((batch,) + kernel_shape), lon.reshape((batch,) + kernel_shape)
+            )
+            if self._debug:
+                logger.debug("Batched inverse Gnomonic projection computed with the fused Numba kernel.")
+            return lat, lon
+
+        # One broadcast expression over the batch axis: centers vary along axis 0.
+        centers = (batch,) + (1,) * len(shape)
+        sin_phi1 = sin_phi1.reshape(centers)
+        cos_phi1 = cos_phi1.reshape(centers)
+
+        if NUMEXPR_AVAILABLE:
+            local_dict = {
+                "x": x,
+                "y": y,
+                "R": R,
+                "sin_phi1": sin_phi1,
+                "cos_phi1": cos_phi1,
+                "lam0": lam0.reshape(centers),
+                "rad2deg": dtype.type(_RAD2DEG),
+            }
+            # m and z depend on the center and y only, so they are (B, H, 1) for broadcast grids.
+            local_dict["m"] = numexpr.evaluate("R * cos_phi1 + y * sin_phi1", local_dict=local_dict)
+            local_dict["z"] = numexpr.evaluate("R * sin_phi1 - y * cos_phi1", local_dict=local_dict)
+            lat = numexpr.evaluate("arctan2(z, sqrt(x * x + m * m)) * rad2deg", local_dict=local_dict)
+            lon = numexpr.evaluate("(lam0 + arctan2(x, m)) * rad2deg", local_dict=local_dict)
+            if self._debug:
+                logger.debug("Batched inverse Gnomonic projection computed with NumExpr.")
+            return lat, lon
+
+        m = R * cos_phi1 + y * sin_phi1
+        z = R * sin_phi1 - y * cos_phi1
+        lat = np.arctan2(z, np.hypot(x, m))
+        lon = np.arctan2(x, m)
+        np.add(lon, lam0.reshape(centers), out=lon)
+        np.multiply(lat, _RAD2DEG, out=lat, casting="same_kind")
+        np.multiply(lon, _RAD2DEG, out=lon, casting="same_kind")
+        if self._debug:
+            logger.debug("Batched inverse Gnomonic projection computed successfully.")
+        return lat, lon
+
+    def from_spherical_to_projection(
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        *,
+        out_x: Optional[np.ndarray] = None,
+        out_y: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         Perform forward Gnomonic projection from geographic coordinates to planar grid coordinates.
 
+        CuPy inputs are projected on the GPU and the results are returned as CuPy arrays.
+
         Args:
             lat (np.ndarray): Latitude values in degrees.
             lon (np.ndarray): Longitude values in degrees.
+            out_x (Optional[np.ndarray]): Preallocated array of the broadcast shape to
+                write the X coordinates into.
+            out_y (Optional[np.ndarray]): Preallocated array for the Y coordinates.
 
         Returns:
             Tuple[np.ndarray, np.ndarray, np.ndarray]: Arrays of X and Y planar coordinates and a mask indicating valid points.
 
         Raises:
-            ProcessingError: If the projection computation fails.
+            ProcessingError: If the input grids cannot be broadcast together.
         """
-        logger.debug("Starting forward Gnomonic projection (Geographic to Planar).")
+        if self._debug:
+            logger.debug("Starting forward Gnomonic projection (Geographic to Planar).")
         try:
-            phi1_rad, lam0_rad = np.deg2rad([self.config.phi1_deg, self.config.lam0_deg])
-            logger.debug(f"Projection center (phi1_rad, lam0_rad): ({phi1_rad}, {lam0_rad})")
+            shape = np.broadcast_shapes(np.shape(lat), np.shape(lon))
+        except ValueError as e:
+            error_msg = f"Failed during forward Gnomonic projection: {e}"
+            logger.exception(error_msg)
+            raise ProcessingError(error_msg) from e
 
-            phi_rad, lam_rad = np.deg2rad([lat, lon])
-            logger.debug("Converted input lat/lon to radians.")
+        sin_phi1, cos_phi1, lam0_rad = self._center()
 
-            cos_c = (
-                np.sin(phi1_rad) * np.sin(phi_rad) +
-                np.cos(phi1_rad) * np.cos(phi_rad) * np.cos(lam_rad - lam0_rad)
+        if _on_device(lat, lon):
+            dtype = cupy.result_type(lat, lon, cupy.float32)
+            scalar = dtype.type
+            outputs = ()
+            if out_x is not None or out_y is not None:
+                outputs = (
+                    cupy.empty(shape, dtype=dtype) if out_x is None else out_x,
+                    cupy.empty(shape, dtype=dtype) if out_y is None else out_y,
+                    cupy.empty(shape, dtype=np.bool_),
+                )
+            _, forward = _cupy_kernels()
+            x, y, mask = forward(
+                cupy.asarray(lat, dtype=dtype), cupy.asarray(lon, dtype=dtype),
+                scalar(self.config.R), scalar(sin_phi1), scalar(cos_phi1), scalar(lam0_rad),
+                scalar(_horizon_tol(dtype)), *outputs
             )
-            logger.debug("Computed cos_c for forward projection.")
+            if self._debug:
+                logger.debug("Forward Gnomonic projection computed with the CuPy kernel.")
+            return x, y, mask
 
-            cos_c = np.where(cos_c == 0, 1e-10, cos_c)
-            logger.debug("Adjusted cos_c to avoid division by zero.")
+        kernel_shape = _kernel_shape(shape) if NUMBA_AVAILABLE else None
+        if kernel_shape is not None:
+            dtype = np.result_type(lat, lon, np.float32)
+            x = np.empty(shape, dtype=dtype) if out_x is None else out_x
+            y = np.empty(shape, dtype=dtype) if out_y is None else out_y
+            mask = np.empty(shape, dtype=np.bool_)
+            scalar = dtype.type
+            if len(shape) == 2 and np.shape(lat) == (shape[0], 1) and np.shape(lon) == (1, shape[1]):
+                # (H, 1) / (1, W) grids: trig per row and per column instead of per point.
+                phi = np.multiply(np.ravel(lat), _DEG2RAD, dtype=dtype)
+                d_lam = np.subtract(np.multiply(np.ravel(lon), _DEG2RAD, dtype=dtype), lam0_rad, dtype=dtype)
+                _gnomonic_forward_separable(
+                    np.sin(phi), np.cos(phi), np.sin(d_lam), np.cos(d_lam),
+                    scalar(self.config.R), scalar(sin_phi1), scalar(cos_phi1),
+                    scalar(_horizon_tol(dtype)), x, y, mask
+                )
+                if self._debug:
+                    logger.debug("Forward Gnomonic projection computed with the separable Numba kernel.")
+                return x, y, mask
+            _gnomonic_forward(
+                np.broadcast_to(lat, shape).reshape(kernel_shape),
+                np.broadcast_to(lon, shape).reshape(kernel_shape),
+                scalar(self.config.R), scalar(sin_phi1), scalar(cos_phi1), scalar(lam0_rad),
+                scalar(_horizon_tol(dtype)),
+                x.reshape(kernel_shape), y.reshape(kernel_shape), mask.reshape(kernel_shape)
+            )
+            if self._debug:
+                logger.debug("Forward Gnomonic projection computed with the fused Numba kernel.")
+            return x, y, mask
 
-            x = self.config.R * np.cos(phi_rad) * np.sin(lam_rad - lam0_rad) / cos_c
-            logger.debug("Computed X planar coordinates for forward projection.")
+        if NUMEXPR_AVAILABLE:
+            x, y, mask = self._forward_numexpr(lat, lon, sin_phi1, cos_phi1, lam0_rad, out_x, out_y)
+            if self._debug:
+                logger.debug("Forward Gnomonic projection computed with NumExpr.")
+            return x, y, mask
 
-            y = self.config.R * (
-                np.cos(phi1_rad) * np.sin(phi_rad) -
-                np.sin(phi1_rad) * np.cos(phi_rad) * np.cos(lam_rad - lam0_rad)
-            ) / cos_c
-            logger.debug("Computed Y planar coordinates for forward projection.")
+        dtype = np.result_type(lat, lon, np.float32)
 
-            mask = cos_c > 0
-            logger.debug("Generated mask for valid projection points (cos_c > 0).")
+        # Each trig term is taken once, at the shape of its own input, and reused by
+        # cos_c, x and y; for broadcast (H, 1) / (1, W) grids that is O(H + W) work.
+        phi = np.multiply(lat, _DEG2RAD, dtype=dtype)
+        sin_phi, cos_phi = np.sin(phi), np.cos(phi)
+        d_lam = np.subtract(np.multiply(lon, _DEG2RAD, dtype=dtype), lam0_rad, dtype=dtype)
+        sin_d_lam, cos_d_lam = np.sin(d_lam), np.cos(d_lam)
 
+        cos_c, tmp = self._scratch(shape, dtype, 2)
+
+        # cos_c = sin(phi1) * sin(phi) + cos(phi1) * cos(phi) * cos(lam - lam0)
+        np.multiply(cos_phi, cos_d_lam, out=tmp)
+        np.multiply(tmp, cos_phi1, out=cos_c)
+        np.add(cos_c, sin_phi * sin_phi1, out=cos_c)
+
+        # Points on the horizon (cos_c == 0, to within rounding) count as valid; the one
+        # comparison gives the mask and selects where the denominator is clamped away from zero.
+        mask = cos_c >= -_horizon_tol(dtype)
+        np.maximum(cos_c, 1e-10, out=cos_c, where=mask)
+
+        # Both coordinates are scaled by R / cos_c; divide once and multiply twice.
+        scale = np.divide(self.config.R, cos_c, out=cos_c)
+
+        # x = R * cos(phi) * sin(lam - lam0) / cos_c
+        x = np.multiply(cos_phi, sin_d_lam, out=out_x)
+        np.multiply(x, scale, out=x)
+
+        # y = R * (cos(phi1) * sin(phi) - sin(phi1) * cos(phi) * cos(lam - lam0)) / cos_c,
+        # with tmp still holding cos(phi) * cos(lam - lam0)
+        y = np.multiply(tmp, -sin_phi1, out=out_y)
+        np.add(y, sin_phi * cos_phi1, out=y)
+        np.multiply(y, scale, out=y)
+
+        if self._debug:
             logger.debug("Forward Gnomonic projection computed successfully.")
-            return x, y, mask
-        except Exception as e:
-            error_msg = f"Failed during forward Gnomonic projection: {e}"
-            logger.exception(error_msg)
-            raise ProcessingError(error_msg) from e
\ No newline at end of file
+        return x, y, mask
@@ -1,14 +1,57 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/gnomonic/transform.py
 
-from typing import Tuple, Any
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 import numpy as np
 import logging
-from ..exceptions import TransformationError, ConfigurationError
+from ..exceptions import ConfigurationError
 from ..base.transform import BaseCoordinateTransformer
+from ..base._validation import missing_attributes
 
 # Configure logger for the transformation module
 logger = logging.getLogger('spherical_projections.gnomonic_projection.gnomonic.transform')
 
+
+@lru_cache(maxsize=32)
+def _spherical_affine(
+    lon_min: float, lon_max: float, lat_min: float, lat_max: float, W: int, H: int
+) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+    """
+    Affine parameters mapping longitude/latitude onto an ``H`` x ``W`` image.
+
+    Depends only on the configuration and image size, so it is computed once per
+    combination rather than on every frame.
+
+    Returns:
+        Tuple[Tuple[float, float], Tuple[float, float]]: ``(scale, offset)`` for the
+        x-map (longitude) and for the y-map (latitude, top row at ``lat_max``).
+    """
+    return (
+        BaseCoordinateTransformer._axis_affine(lon_min, lon_max, W),
+        BaseCoordinateTransformer._axis_affine(lat_max, lat_min, H),
+    )
+
+
+@lru_cache(maxsize=32)
+def _grid_bounds(
+    fov_deg: float, R: float, x_points: int, y_points: int
+) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+    """
+    Affine parameters mapping Gnomonic planar coordinates onto the output image.
+
+    The plane spans ``[-R tan(fov/2), R tan(fov/2)]`` on both axes, with the top
+    image row at the positive y bound.
+
+    Returns:
+        Tuple[Tuple[float, float], Tuple[float, float]]: ``(scale, offset)`` for the
+        x-map and for the y-map.
+    """
+    half_extent = np.tan(np.deg2rad(fov_deg / 2)) * R
+    return (
+        BaseCoordinateTransformer._axis_affine(-half_extent, half_extent, x_points),
+        BaseCoordinateTransformer._axis_affine(half_extent, -half_extent, y_points),
+    )
+
 class GnomonicTransformer(BaseCoordinateTransformer):
     """
     Transformation Logic for Gnomonic Projection.
@@ -35,53 +78,26 @@ class GnomonicTransformer(BaseCoordinateTransformer):
             "x_points",
             "y_points"
         ]
-        missing_attributes = [attr for attr in required_attributes if not hasattr(config, attr)]
+        missing = missing_attributes(config, required_attributes)
 
-        if missing_attributes:
-            error_msg = f"Configuration object is missing required attributes: {', '.join(missing_attributes)}"
+        if missing:
+            error_msg = f"Configuration object is missing required attributes: {', '.join(missing)}"
             logger.error(error_msg)
             raise ConfigurationError(error_msg)
 
         self.config = config
+        self._debug: bool = logger.isEnabledFor(logging.DEBUG)
         logger.info("GnomonicTransformer initialized successfully.")
 
-    def _validate_inputs(self, array: np.ndarray, name: str) -> None:
-        """
-        Validate input arrays to ensure they are NumPy arrays.
-
-        Args:
-            array (np.ndarray): Input array to validate.
-            name (str): Name of the array for error messages.
-
-        Raises:
-            TransformationError: If the input is not a NumPy ndarray.
-        """
-        if not isinstance(array, np.ndarray):
-            error_msg = f"{name} must be a NumPy ndarray."
-            logger.error(error_msg)
-            raise TransformationError(error_msg)
-
-    def _compute_image_coords(
-        self, values: np.ndarray, min_val: float, max_val: float, size: int
-    ) -> np.ndarray:
-        """
-        Generalized method to compute normalized image coordinates.
-
-        Args:
-            values (np.ndarray): Input values to normalize (e.g., lat, lon, x, y).
-            min_val (float): Minimum value for normalization.
-            max_val (float): Maximum value for normalization.
-            size (int): Size of the target axis.
-
-        Returns:
-            np.ndarray: Normalized image coordinates scaled to [0, size-1].
-        """
-        normalized = (values - min_val) / (max_val - min_val) * (size - 1)
-        logger.debug(f"Computed normalized image coordinates.")
-        return normalized
-
     def spherical_to_image_coords(
-        self, lat: np.ndarray, lon: np.ndarray, shape: Tuple[int, int]
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        shape: Tuple[int, int],
+        dtype: Any = np.float32,
+        *,
+        out_x: Optional[np.ndarray] = None,
+        out_y: Optional[np.ndarray] = None
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Convert spherical coordinates (lat, lon) to image coordinates.
@@ -90,28 +106,37 @@ class GnomonicTransformer(BaseCoordinateTransformer):
             lat (np.ndarray): Array of latitude values.
             lon (np.ndarray): Array of longitude values.
             shape (Tuple[int, int]): Shape of the image (height, width).
+            dtype (Any): Dtype of the returned maps. Defaults to float32.
+            out_x (Optional[np.ndarray]): Preallocated array to write map_x into.
+            out_y (Optional[np.ndarray]): Preallocated array to write map_y into.
 
         Returns:
             Tuple[np.ndarray, np.ndarray]: Image coordinates map_x, map_y.
         """
-        logger.debug("Mapping spherical coordinates to image coordinates for Gnomonic projection.")
+        if self._debug:
+            logger.debug("Mapping spherical coordinates to image coordinates for Gnomonic projection.")
         H, W = shape  
 
-        # Clamp extreme values if necessary (example only, logic unchanged)
-        lon[lon>180] = -360 + lon[lon>180]
-        lon[lon<-180] = 180 + (lon[lon<-180] + 180)
-        lat[lat>90] = -180 + lat[lat>90]
+        # Wrap out-of-range angles in place. Masked ufuncs do each wrap in one
+        # comparison and one pass, instead of boolean gathers and scatters.
+        np.subtract(lon, 360, out=lon, where=lon > 180)
+        np.add(lon, 360, out=lon, where=lon < -180)
+        np.subtract(lat, 180, out=lat, where=lat > 90)
 
-        map_x = self._compute_image_coords(
-            lon, self.config.lon_min, self.config.lon_max, W
+        affine_x, affine_y = _spherical_affine(
+            self.config.lon_min, self.config.lon_max, self.config.lat_min, self.config.lat_max, W, H
         )
-        map_y = self._compute_image_coords(
-            lat, self.config.lat_max, self.config.lat_min, H
-        )
-        return map_x, map_y
+        return self._affine_coords_pair(lon, lat, affine_x, affine_y, dtype, out_x, out_y)
 
     def projection_to_image_coords(
-        self, x: np.ndarray, y: np.ndarray, config: Any
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        config: Any,
+        dtype: Any = np.float32,
+        *,
+        out_x: Optional[np.ndarray] = None,
+        out_y: Optional[np.ndarray] = None
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Convert Gnomonic planar coordinates (x, y) to image coordinates.
@@ -120,17 +145,14 @@ class GnomonicTransformer(BaseCoordinateTransformer):
             x (np.ndarray): Planar X-coordinates.
             y (np.ndarray): Planar Y-coordinates.
             config (Any): Projection configuration object with fov_deg, R, etc.
+            dtype (Any): Dtype of the returned maps. Defaults to float32.
+            out_x (Optional[np.ndarray]): Preallocated array to write map_x into.
+            out_y (Optional[np.ndarray]): Preallocated array to write map_y into.
 
         Returns:
             Tuple[np.ndarray, np.ndarray]: Image coordinates map_x, map_y.
         """
-        logger.debug("Mapping Gnomonic planar coordinates to image coordinates.")
-        half_fov_rad = np.deg2rad(config.fov_deg / 2)
-        x_max = np.tan(half_fov_rad) * config.R
-        y_max = np.tan(half_fov_rad) * config.R
-        x_min, y_min = -x_max, -y_max
-
-        map_x = self._compute_image_coords(x, x_min, x_max, config.x_points)
-        map_y = self._compute_image_coords(y, y_max, y_min, config.y_points)
-
-        return map_x, map_y
\ No newline at end of file
+        if self._debug:
+            logger.debug("Mapping Gnomonic planar coordinates to image coordinates.")
+        affine_x, affine_y = _grid_bounds(config.fov_deg, config.R, config.x_points, config.y_points)
+        return self._affine_coords_pair(x, y, affine_x, affine_y, dtype, out_x, out_y)
\ No newline at end of file
@@ -3,8 +3,10 @@
 from typing import Any, Optional
 from pydantic import BaseModel, Field
 import cv2
+import numpy as np
 import logging
-from ..exceptions import ConfigurationError
+from ..base._model_config import ModelConfigMixin
+from ..base._pydantic import PYDANTIC_V2, FROZEN_MODEL_CONFIG, FrozenModelConfig
 
 logger = logging.getLogger('spherical_projections.projection.mercator.config')
 
@@ -24,6 +26,10 @@ class MercatorConfigModel(BaseModel):
         interpolation (Optional[int]): Interpolation method for OpenCV remap.
         borderMode (Optional[int]): Border mode for OpenCV remap.
         borderValue (Optional[Any]): Border value for OpenCV remap.
+        use_relative_map (bool): Remap with displacement maps (cv2.WARP_RELATIVE_MAP).
+        fixed_point_maps (Optional[bool]): Which interpolation modes get fixed-point remap maps;
+            None for nearest, linear and Lanczos, True to add area and cubic, False for none.
+        dtype (Any): Floating point type of the projection grids.
     """
     R: float = Field(1., description="Radius of the sphere (in kilometers).")
     lon_min: float = Field(-180.0, description="Minimum longitude.")
@@ -38,12 +44,26 @@ class MercatorConfigModel(BaseModel):
     interpolation: Optional[int] = Field(default=cv2.INTER_LINEAR, description="Interpolation method for OpenCV remap")
     borderMode: Optional[int] = Field(default=cv2.BORDER_CONSTANT, description="Border mode for OpenCV remap")
     borderValue: Optional[Any] = Field(default=0, description="Border value for OpenCV remap")
-
-class MercatorConfig:
+    use_relative_map: bool = Field(default=False, description="Remap with displacement maps (cv2.WARP_RELATIVE_MAP)")
+    fixed_point_maps: Optional[bool] = Field(
+        default=None,
+        description="Precompute fixed-point remap maps: None for nearest/linear/Lanczos, True to add area/cubic, False for float maps"
+    )
+    dtype: Any = Field(default=np.float32, description="Floating point type of the projection grids")
+
+    if PYDANTIC_V2:
+        model_config = FROZEN_MODEL_CONFIG
+    else:  # pragma: no cover - depends on the installed Pydantic
+        Config = FrozenModelConfig
+
+class MercatorConfig(ModelConfigMixin):
     """
     Configuration class for Mercator projection.
     """
 
+    _model = MercatorConfigModel
+    _logger = logger
+
     def __init__(self, **kwargs):
         """
         Initialize the MercatorConfig with specified parameters.
@@ -56,57 +76,7 @@ class MercatorConfig:
         """
         logger.debug("Initializing MercatorConfig with parameters: %s", kwargs)
         try:
-            self.config = MercatorConfigModel(**kwargs)
+            self._set_model(self._model(**kwargs))
         except Exception as e:
             logger.error("Failed to initialize MercatorConfig.")
             raise ValueError(f"Configuration error: {e}")
-
-    def __repr__(self):
-        """
-        Return a string representation of the MercatorConfig.
-
-        Returns:
-            str: Stringified config dictionary.
-        """
-        return f"MercatorConfig({self.config.dict()})"
-
-    def update(self, **kwargs: Any) -> None:
-        """
-        Dynamically update the Mercator configuration.
-
-        Args:
-            **kwargs (Any): Configuration parameters to update.
-
-        Raises:
-            ConfigurationError: If an error occurs during update.
-        """
-        logger.debug(f"Updating MercatorConfig with parameters: {kwargs}")
-        try:
-            updated_config = self.config.copy(update=kwargs)
-            self.config = updated_config
-            logger.info("MercatorConfig updated successfully.")
-        except Exception as e:
-            error_msg = f"Failed to update MercatorConfig: {e}"
-            logger.exception(error_msg)
-            raise ConfigurationError(error_msg) from e
-
-    def __getattr__(self, item: str) -> Any:
-        """
-        Access configuration parameters as attributes.
-
-        Args:
-            item (str): Attribute name.
-
-        Returns:
-            Any: The value of the attribute if it exists.
-
-        Raises:
-            AttributeError: If the attribute does not exist.
-        """
-        logger.debug(f"Accessing MercatorConfig attribute '{item}'.")
-        try:
-            return getattr(self.config, item)
-        except AttributeError:
-            error_msg = f"'MercatorConfig' object has no attribute '{item}'"
-            logger.error(error_msg)
-            raise AttributeError(error_msg) from None
\ No newline at end of file
@@ -1,41 +1,114 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/mercator/grid.py
 
-from ..base.grid import BaseGridGeneration
+from functools import lru_cache
+from typing import Tuple
+from ..base.grid import BaseGridGeneration, _uniform_axis
 import numpy as np
 import logging
 
 logger = logging.getLogger('spherical_projections.projection.mercator.grid')
 
+
+@lru_cache(maxsize=8)
+def _projection_grid(
+    lon_min: float, lon_max: float, x_points: int,
+    lat_min: float, lat_max: float, y_points: int, dtype: np.dtype
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the read-only Mercator projection grid (lon, lat).
+
+    Args:
+        lon_min (float): Minimum longitude in degrees.
+        lon_max (float): Maximum longitude in degrees.
+        x_points (int): Number of points along the x-axis.
+        lat_min (float): Minimum latitude in degrees.
+        lat_max (float): Maximum latitude in degrees.
+        y_points (int): Number of points along the y-axis.
+        dtype (np.dtype): Floating point type of the grid.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Broadcastable ``(1, W)`` longitude and ``(H, 1)``
+        latitude grids.
+    """
+    y_max = np.arcsinh(np.tan(np.radians(lat_max)))
+    y_min = np.arcsinh(np.tan(np.radians(lat_min)))
+    lat = _uniform_axis(y_min, y_max, y_points, dtype)
+    lon = _uniform_axis(lon_min, lon_max, x_points, dtype)
+    lon = np.radians(lon)
+    lat.setflags(write=False)
+    lon.setflags(write=False)
+    return lon[np.newaxis, :], lat[:, np.newaxis]
+
+
+@lru_cache(maxsize=8)
+def _spherical_grid(
+    lon_min: float, lon_max: float, lon_points: int,
+    lat_min: float, lat_max: float, lat_points: int, dtype: np.dtype
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the read-only grid for backward projection.
+
+    Args:
+        lon_min (float): Minimum longitude in degrees.
+        lon_max (float): Maximum longitude in degrees.
+        lon_points (int): Number of longitude points.
+        lat_min (float): Minimum latitude in degrees.
+        lat_max (float): Maximum latitude in degrees.
+        lat_points (int): Number of latitude points.
+        dtype (np.dtype): Floating point type of the grid.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Broadcastable ``(H, 1)`` and ``(1, W)`` grids
+        (map_x, map_y).
+    """
+    x = _uniform_axis(lon_min, lon_max, lon_points, dtype)
+    y = _uniform_axis(lat_max, lat_min, lat_points, dtype)
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return y[:, np.newaxis], x[np.newaxis, :]
+
+
 class MercatorGridGeneration(BaseGridGeneration):
     """
     Grid generation for Mercator projection.
+
+    Grids are memoized on the parameters they depend on and returned read-only.
     """
 
-    def projection_grid(self):
+    def projection_grid(self, dtype=None):
         """
         Generate the Mercator projection grid (lon, lat).
 
+        Args:
+            dtype: Floating point type of the grid. Defaults to the configured ``dtype``.
+
         Returns:
-            Tuple[np.ndarray, np.ndarray]: The longitude and latitude grids for forward projection.
+            Tuple[np.ndarray, np.ndarray]: The longitude and latitude grids for forward projection,
+            as broadcastable ``(1, W)`` and ``(H, 1)`` views rather than dense arrays.
         """
         logger.debug("Generating Mercator projection grid.")
-        y_max = np.log(np.tan(np.pi / 4 + np.radians(self.config.config.lat_max) / 2))
-        y_min = np.log(np.tan(np.pi / 4 + np.radians(self.config.config.lat_min) / 2))
-        lat = np.linspace(y_min, y_max, self.config.config.y_points)
-        lon = np.linspace(self.config.config.lon_min, self.config.config.lon_max, self.config.config.x_points)
-        lon = np.radians(lon)
-        grid_lon, grid_lat = np.meshgrid(lon, lat)
-        return grid_lon, grid_lat
-
-    def spherical_grid(self):
+        if dtype is None:
+            dtype = getattr(self.config, "dtype", np.float32)
+        cfg = self.config.config
+        return _projection_grid(
+            cfg.lon_min, cfg.lon_max, cfg.x_points, cfg.lat_min, cfg.lat_max, cfg.y_points, np.dtype(dtype)
+        )
+
+    def spherical_grid(self, dtype=None):
         """
         Generate the grid for backward projection in Mercator projection.
 
+        Args:
+            dtype: Floating point type of the grid. Defaults to the configured ``dtype``.
+
         Returns:
-            Tuple[np.ndarray, np.ndarray]: The X and Y coordinate grids (map_x, map_y).
+            Tuple[np.ndarray, np.ndarray]: The X and Y coordinate grids (map_x, map_y), as
+            broadcastable ``(H, 1)`` and ``(1, W)`` views rather than dense arrays.
         """
         logger.debug("Generating Mercator spherical grid.")
-        x = np.linspace(self.config.config.lon_min, self.config.config.lon_max, self.config.config.lon_points)
-        y = np.linspace(self.config.config.lat_max, self.config.config.lat_min, self.config.config.lat_points)
-        map_y, map_x = np.meshgrid(x, y)
-        return map_x, map_y
\ No newline at end of file
+        if dtype is None:
+            dtype = getattr(self.config, "dtype", np.float32)
+        cfg = self.config.config
+        return _spherical_grid(
+            cfg.lon_min, cfg.lon_max, cfg.lon_points, cfg.lat_min, cfg.lat_max, cfg.lat_points, np.dtype(dtype)
+        )
@@ -20,6 +20,8 @@ class MercatorProjectionStrategy(BaseProjectionStrategy):
         """
         logger.debug("Initializing MercatorProjectionStrategy.")
         self.config = config
+        # Checked once so the per-call paths skip the logging calls.
+        self._debug: bool = logger.isEnabledFor(logging.DEBUG)
 
     def from_projection_to_spherical(self, lon: np.ndarray, lat: np.ndarray):
         """
@@ -32,9 +34,17 @@ class MercatorProjectionStrategy(BaseProjectionStrategy):
         Returns:
             Tuple[np.ndarray, np.ndarray]: The (lat, lon) in some form.
         """
-        lon = lon / self.config.R
-        lat =  np.pi / 2 - 2 * np.arctan(np.e**(lat/ self.config.R))
-        logger.debug("Mercator forward projection computed successfully.")
+        # A Python float scale keeps float32 grids in float32 (no upcast to float64).
+        inv_R = 1.0 / self.config.R
+        lon = lon * inv_R
+        # pi/2 - 2 * arctan(exp(t)) is the negated Gudermannian, -arctan(sinh(t)); this
+        # form avoids the pow call and is evaluated in place in a single buffer.
+        lat = np.multiply(lat, inv_R)
+        np.sinh(lat, out=lat)
+        np.arctan(lat, out=lat)
+        np.negative(lat, out=lat)
+        if self._debug:
+            logger.debug("Mercator forward projection computed successfully.")
         return lat, lon
 
     def from_spherical_to_projection(self, x: np.ndarray, y: np.ndarray):
@@ -46,13 +56,19 @@ class MercatorProjectionStrategy(BaseProjectionStrategy):
             y (np.ndarray): Y coordinates (latitudes in degrees).
 
         Returns:
-            Tuple[np.ndarray, np.ndarray, np.ndarray]: The projected X, Y, and a mask.
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The projected X, Y, and the mask. Every
+            point is valid in Mercator, so the mask is a read-only all-True view broadcast to
+            the grid shape rather than a materialized array.
         """
-        logger.debug("Starting inverse Mercator projection (spherical to projection).")
-        lon_rad = np.radians(x)
-        lat_rad = np.radians(y)
-        x = 1 * lon_rad
-        y = 1 * np.log(np.tan(np.pi / 4 + lat_rad / 2))
-        mask = np.ones_like(x) == 1
-        logger.debug("Inverse Mercator projection computed successfully.")
+        if self._debug:
+            logger.debug("Starting inverse Mercator projection (spherical to projection).")
+        x = np.radians(x)
+        # y = log(tan(pi / 4 + lat_rad / 2)), written as the equivalent asinh(tan(lat_rad))
+        # and evaluated in place in a single buffer.
+        y = np.radians(y)
+        np.tan(y, out=y)
+        np.arcsinh(y, out=y)
+        mask = np.broadcast_to(True, np.broadcast_shapes(np.shape(x), np.shape(y)))
+        if self._debug:
+            logger.debug("Inverse Mercator projection computed successfully.")
         return x, y, mask
\ No newline at end of file
@@ -1,13 +1,62 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/mercator/transform.py
 
-from typing import Tuple, Any
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 import numpy as np
 import logging
 from ..exceptions import TransformationError, ConfigurationError
 from ..base.transform import BaseCoordinateTransformer
+from ..base._validation import missing_attributes
 
 logger = logging.getLogger('spherical_projections.projection.mercator.transform')
 
+
+@lru_cache(maxsize=32)
+def _latlon_affine(x_points: int, y_points: int) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+    """
+    Affine parameters mapping radian longitude/latitude onto the Mercator image.
+
+    Args:
+        x_points (int): Image width.
+        y_points (int): Image height.
+
+    Returns:
+        Tuple[Tuple[float, float], Tuple[float, float]]: ``(scale, offset)`` for the
+        x-map and for the y-map.
+    """
+    # map_x = ((lon / pi) * .5 + .5) * (x_points - 1)
+    # map_y = (1 - ((lat / (pi / 2)) * .5 + .5)) * (y_points - 1)
+    half_w = (x_points - 1) / 2
+    half_h = (y_points - 1) / 2
+    return (half_w / np.pi, half_w), (-half_h / (np.pi / 2), half_h)
+
+
+@lru_cache(maxsize=32)
+def _grid_bounds(
+    lat_min: float, lat_max: float, lon_max: float, x_points: int, y_points: int
+) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+    """
+    Affine parameters mapping Mercator planar coordinates onto the output image.
+
+    Args:
+        lat_min (float): Southern latitude bound in degrees.
+        lat_max (float): Northern latitude bound in degrees.
+        lon_max (float): Longitude bound in degrees.
+        x_points (int): Image width.
+        y_points (int): Image height.
+
+    Returns:
+        Tuple[Tuple[float, float], Tuple[float, float]]: ``(scale, offset)`` for the
+        x-map and for the y-map.
+    """
+    y_max = np.arcsinh(np.tan(np.radians(lat_max)))
+    y_min = np.arcsinh(np.tan(np.radians(lat_min)))
+    # map_x = ((lon / lon_max_rad) * .5 + .5) * x_points
+    half_w = x_points / 2
+    # map_y = ((lat - y_min) / (y_max - y_min)) * y_points
+    scale_y = y_points / (y_max - y_min)
+    return (half_w / np.radians(lon_max), half_w), (scale_y, -y_min * scale_y)
+
 class MercatorTransformer(BaseCoordinateTransformer):
     """
     Transformation logic for the Mercator projection.
@@ -25,18 +74,26 @@ class MercatorTransformer(BaseCoordinateTransformer):
         """
         logger.debug("Initializing MercatorTransformer.")
         required_attributes = ["lon_min", "lon_max", "lat_min", "lat_max", "x_points", "y_points"]
-        missing_attributes = [attr for attr in required_attributes if not hasattr(config, attr)]
+        missing = missing_attributes(config, required_attributes)
 
-        if missing_attributes:
-            error_msg = f"Configuration object is missing required attributes: {', '.join(missing_attributes)}"
+        if missing:
+            error_msg = f"Configuration object is missing required attributes: {', '.join(missing)}"
             logger.error(error_msg)
             raise ConfigurationError(error_msg)
 
         self.config = config
+        self._debug: bool = logger.isEnabledFor(logging.DEBUG)
         logger.info("MercatorTransformer initialized successfully.")
 
     def spherical_to_image_coords(
-        self, lat: np.ndarray, lon: np.ndarray, shape: Tuple[int, int]
+        self,
+        lat: np.ndarray,
+        lon: np.ndarray,
+        shape: Tuple[int, int],
+        dtype: Any = np.float32,
+        *,
+        out_x: Optional[np.ndarray] = None,
+        out_y: Optional[np.ndarray] = None
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Convert latitude and longitude to Mercator image coordinates.
@@ -45,35 +102,40 @@ class MercatorTransformer(BaseCoordinateTransformer):
             lat (np.ndarray): Latitude values in degrees.
             lon (np.ndarray): Longitude values in degrees.
             shape (Tuple[int, int]): Shape of the target image (height, width).
+            dtype (Any): Dtype of the returned maps. Defaults to float32.
+            out_x (Optional[np.ndarray]): Preallocated array to write map_x into.
+            out_y (Optional[np.ndarray]): Preallocated array to write map_y into.
 
         Returns:
             Tuple[np.ndarray, np.ndarray]: X and Y coordinates in image space.
 
         Raises:
-            TransformationError: If input arrays are invalid or computation fails.
+            TransformationError: If input arrays are invalid.
         """
-        logger.debug("Transforming latitude and longitude to Mercator image coordinates.")
-        try:
-            if not isinstance(lat, np.ndarray) or not isinstance(lon, np.ndarray):
-                raise TypeError("Latitude and longitude must be numpy arrays.")
-
-
+        if self._debug:
+            logger.debug("Transforming latitude and longitude to Mercator image coordinates.")
+        if not isinstance(lat, np.ndarray) or not isinstance(lon, np.ndarray):
+            error_msg = "Latitude and longitude must be numpy arrays."
+            logger.error(error_msg)
+            raise TransformationError(error_msg)
 
-            # Very simplistic placeholder logic (not a real Mercator transformation).
-            x = lon
-            y = lat
-            map_x = ((x / np.pi) * .5 + .5) * (self.config.x_points - 1)
-            map_y = (1 + -1*(( y / (np.pi/2) )* .5 + .5 ))* (self.config.y_points - 1)
+        # Very simplistic placeholder logic (not a real Mercator transformation).
+        affine_x, affine_y = _latlon_affine(self.config.x_points, self.config.y_points)
+        map_x, map_y = self._affine_coords_pair(lon, lat, affine_x, affine_y, dtype, out_x, out_y)
 
+        if self._debug:
             logger.debug("Latitude and longitude transformed successfully.")
-            return map_x, map_y
-
-        except Exception as e:
-            logger.exception("Failed to transform latitude and longitude to Mercator image coordinates.")
-            raise TransformationError(f"Mercator lat/lon transformation failed: {e}")
+        return map_x, map_y
 
     def projection_to_image_coords(
-        self, x: np.ndarray, y: np.ndarray, shape: Tuple[int, int]
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        shape: Tuple[int, int],
+        dtype: Any = np.float32,
+        *,
+        out_x: Optional[np.ndarray] = None,
+        out_y: Optional[np.ndarray] = None
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Transform XY grid coordinates to Mercator image coordinates.
@@ -82,33 +144,32 @@ class MercatorTransformer(BaseCoordinateTransformer):
             x (np.ndarray): X grid coordinates.
             y (np.ndarray): Y grid coordinates.
             shape (Tuple[int, int]): Shape of the target image (height, width).
+            dtype (Any): Dtype of the returned maps. Defaults to float32.
+            out_x (Optional[np.ndarray]): Preallocated array to write map_x into.
+            out_y (Optional[np.ndarray]): Preallocated array to write map_y into.
 
         Returns:
             Tuple[np.ndarray, np.ndarray]: X and Y coordinates in image space.
 
         Raises:
-            TransformationError: If input arrays are invalid or computation fails.
+            TransformationError: If input arrays are invalid.
         """
-        logger.debug("Transforming XY grid coordinates to Mercator image coordinates.")
-        try:
-            if not isinstance(x, np.ndarray) or not isinstance(y, np.ndarray):
-                raise TypeError("Grid coordinates must be numpy arrays.")
-
-            H = self.config.y_points
-            W = self.config.x_points
-            lon = x
-            lat = y
-
-            y_max = np.log(np.tan(np.pi / 4 + np.radians(self.config.config.lat_max) / 2))
-            y_min = np.log(np.tan(np.pi / 4 + np.radians(self.config.config.lat_min) / 2))
+        if self._debug:
+            logger.debug("Transforming XY grid coordinates to Mercator image coordinates.")
+        if not isinstance(x, np.ndarray) or not isinstance(y, np.ndarray):
+            error_msg = "Grid coordinates must be numpy arrays."
+            logger.error(error_msg)
+            raise TransformationError(error_msg)
 
-            map_x = ((lon / np.radians(self.config.config.lon_max)) * .5 + .5) * (self.config.x_points)
+        lon = x
+        lat = y
 
-            map_y = ((lat - y_min) / (y_max - y_min)) * self.config.y_points
+        cfg = self.config.config
+        affine_x, affine_y = _grid_bounds(
+            cfg.lat_min, cfg.lat_max, cfg.lon_max, self.config.x_points, self.config.y_points
+        )
+        map_x, map_y = self._affine_coords_pair(lon, lat, affine_x, affine_y, dtype, out_x, out_y)
 
+        if self._debug:
             logger.debug("XY grid coordinates transformed successfully.")
-            return map_x, map_y
-
-        except Exception as e:
-            logger.exception("Failed to transform XY grid coordinates to Mercator image coordinates.")
-            raise TransformationError(f"Mercator XY transformation failed: {e}")
\ No newline at end of file
+        return map_x, map_y
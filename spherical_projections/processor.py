@@ -1,8 +1,14 @@
 # /Users/robinsongarcia/projects/gnomonic/projection/processor.py
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional, Tuple
 from .base.config import BaseProjectionConfig
-from .exceptions import ProcessingError, InterpolationError, GridGenerationError, TransformationError
+from .base.interpolation import RemapMaps
+from .base._pydantic import is_frozen
+from ._optional import NUMBA_AVAILABLE, cupy
+from .exceptions import (
+    ConfigurationError, ProcessingError, InterpolationError, GridGenerationError, TransformationError
+)
 import logging
 import cv2
 import numpy as np
@@ -10,11 +16,96 @@ from .utils import PreprocessEquirectangularImage
 # Initialize logger for this module
 logger = logging.getLogger('spherical_projections.processor')
 
+
+def _is_device_array(grid: Any) -> bool:
+    """
+    Whether a grid is a CuPy array in GPU memory.
+
+    Args:
+        grid (Any): Grid or projection result.
+
+    Returns:
+        bool: True for CuPy arrays.
+    """
+    return cupy is not None and isinstance(grid, cupy.ndarray)
+
+
+def _host_grid(grid: Any) -> np.ndarray:
+    """
+    Return a grid as a NumPy array, copying grids built on the GPU back to the host.
+
+    Also applied to projection results, which are CuPy arrays when the grids were.
+
+    Args:
+        grid (Any): Grid or projection result, possibly a CuPy array.
+
+    Returns:
+        np.ndarray: The grid in host memory.
+    """
+    if _is_device_array(grid):
+        return cupy.asnumpy(grid)
+    return grid
+
+
+def _all_valid(mask: Any) -> bool:
+    """
+    Whether a mask is known to mark every pixel valid without scanning it.
+
+    That is the case for a scalar ``True`` and for a ``True`` broadcast to the grid
+    shape (all strides zero), as returned by projections where every point is valid.
+
+    Args:
+        mask (Any): Mask returned by `from_spherical_to_projection`.
+
+    Returns:
+        bool: True if masking the remapped image can be skipped.
+    """
+    if np.ndim(mask) == 0:
+        return bool(mask)
+    return (
+        isinstance(mask, np.ndarray) and mask.size > 0 and not any(mask.strides)
+        and bool(mask.flat[0])
+    )
+
+
+def _grid_tile(grid: np.ndarray, rows: slice, cols: slice) -> np.ndarray:
+    """
+    Slice a block out of a 2-D grid that may be a broadcastable view.
+
+    Axes of length one (e.g. the ``(1, W)`` and ``(H, 1)`` grids returned by
+    some grid generators) are kept whole so the block still broadcasts.
+
+    Args:
+        grid (np.ndarray): Dense or broadcastable 2-D grid.
+        rows (slice): Row range of the block.
+        cols (slice): Column range of the block.
+
+    Returns:
+        np.ndarray: View of the block.
+    """
+    return grid[
+        rows if grid.shape[0] != 1 else slice(None),
+        cols if grid.shape[1] != 1 else slice(None),
+    ]
+
+
 class ProjectionProcessor:
     """
     Processor for handling forward and backward projections using the provided configuration.
+
+    Attributes:
+        tile_size (Optional[int]): Edge length of the blocks used to build forward remap
+            coordinates for large grids, so each block's intermediates stay cache
+            resident between the projection and transform stages. ``None`` disables tiling.
+            Grids built on the GPU (``backend='cupy'``) are never tiled.
+        tile_workers (Optional[int]): Number of threads used to build tiles when Numba is
+            not installed (the Numba kernels already parallelize within a tile).
+            ``None`` lets ThreadPoolExecutor pick a default.
     """
 
+    tile_size: Optional[int] = 256
+    tile_workers: Optional[int] = None
+
     def __init__(self, config: BaseProjectionConfig) -> None:
         """
         Initialize the ProjectionProcessor with a given configuration.
@@ -44,19 +135,148 @@ class ProjectionProcessor:
             logger.exception(error_msg)
             raise ProcessingError(error_msg) from e
 
+        # Remap coordinates only depend on the configuration and the image shape,
+        # so they are reused across calls until either of them changes.
+        self._fwd_cache: Optional[Tuple[Any, Any]] = None
+        self._bwd_cache: Optional[Tuple[Any, Any, np.ndarray]] = None
+
+    def _cache_key(self, shape: Tuple[int, ...]) -> Tuple[Any, ...]:
+        """
+        Build the key identifying a set of cached remap coordinates.
+
+        Frozen parameter models are replaced, never mutated, when the configuration
+        changes, so the model itself identifies the parameters. The key holds a
+        reference to it, which keeps its ``id`` from being reused while cached.
+        Mutable models are snapshotted by value.
+
+        Args:
+            shape (Tuple[int, ...]): Shape of the image the maps are built for.
+
+        Returns:
+            Tuple[Any, ...]: Identity or snapshot of the configuration parameters and the shape.
+        """
+        params = self.config.config_object.config
+        if is_frozen(params):
+            return id(params), tuple(shape), params
+        return repr(sorted(params.__dict__.items())), tuple(shape)
+
+    def _prepare_maps(
+        self, map_x: np.ndarray, map_y: np.ndarray, src_shape: Tuple[int, ...]
+    ) -> Any:
+        """
+        Convert freshly computed remap coordinates into the form that gets cached.
+
+        Interpolators exposing `build_maps` return a `RemapMaps` handle holding
+        fixed-point maps where possible, so conversion is paid once per cache entry
+        rather than on every remap. Fixed-point bilinear maps are within a few grey
+        levels of float maps; ``fixed_point_maps=False`` keeps the float maps. Other interpolators get the plain map pair.
+
+        Args:
+            map_x (np.ndarray): The mapping for the x-coordinates.
+            map_y (np.ndarray): The mapping for the y-coordinates.
+            src_shape (Tuple[int, ...]): Shape of the image the maps sample from.
+
+        Returns:
+            Any: A `RemapMaps` handle, or the ``(map_x, map_y)`` pair, for `_remap`.
+        """
+        convert_maps = getattr(self.interpolation, "convert_maps", None)
+        if convert_maps is not None:
+            map_x, map_y = convert_maps(map_x, map_y, src_shape)
+        build_maps = getattr(self.interpolation, "build_maps", None)
+        if build_maps is None:
+            return map_x, map_y
+        return build_maps(map_x, map_y, src_shape)
+
+    def _remap(self, img: np.ndarray, maps: Any, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Remap an image with maps returned by `_prepare_maps`.
+
+        Args:
+            img (np.ndarray): The image to remap.
+            maps (Any): A `RemapMaps` handle or a ``(map_x, map_y)`` pair.
+            mask (Optional[np.ndarray]): Validity mask for the output, if any.
+
+        Returns:
+            np.ndarray: The remapped image.
+        """
+        if isinstance(maps, RemapMaps):
+            return self.interpolation.apply(maps, img, mask)
+        if mask is None:
+            return self.interpolation.interpolate(img, *maps)
+        return self.interpolation.interpolate(img, *maps, mask)
+
+    def _forward_tiled(
+        self, x_grid: np.ndarray, y_grid: np.ndarray, shape: Tuple[int, int]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build forward remap coordinates block by block.
+
+        Each ``tile_size`` x ``tile_size`` block is projected and transformed to image
+        coordinates in one go, with the transformer writing straight into its block of
+        the preallocated maps. Without Numba the
+        blocks are spread over a thread pool; NumPy releases the GIL inside ufuncs.
+
+        Args:
+            x_grid (np.ndarray): X-coordinates of the projection grid.
+            y_grid (np.ndarray): Y-coordinates of the projection grid.
+            shape (Tuple[int, int]): Shape of the source image (height, width).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The float32 maps map_x, map_y, as the two
+            channels of a single ``(2, H, W)`` buffer.
+        """
+        H, W = np.broadcast_shapes(np.shape(x_grid), np.shape(y_grid))
+        T = self.tile_size
+        # One allocation for both maps; each channel is still a contiguous (H, W) array.
+        map_x, map_y = np.empty((2, H, W), dtype=np.float32)
+
+        def build_tile(block: Tuple[slice, slice]) -> None:
+            rows, cols = block
+            lat, lon = self.projection.from_projection_to_spherical(
+                _grid_tile(x_grid, rows, cols), _grid_tile(y_grid, rows, cols)
+            )
+            self.transformer.spherical_to_image_coords(
+                lat, lon, shape, dtype=np.float32, out_x=map_x[rows, cols], out_y=map_y[rows, cols]
+            )
+
+        blocks = [
+            (slice(y0, min(y0 + T, H)), slice(x0, min(x0 + T, W)))
+            for y0 in range(0, H, T)
+            for x0 in range(0, W, T)
+        ]
+        if NUMBA_AVAILABLE or len(blocks) == 1:
+            for block in blocks:
+                build_tile(block)
+        else:
+            with ThreadPoolExecutor(max_workers=self.tile_workers) as executor:
+                # Consume the iterator so exceptions raised in workers propagate.
+                list(executor.map(build_tile, blocks))
+        logger.debug("Forward remap coordinates built in %dx%d tiles.", T, T)
+        return map_x, map_y
+
+    def clear_cache(self) -> None:
+        """
+        Drop the cached forward and backward remap coordinates.
+        """
+        logger.debug("Clearing cached remap coordinates.")
+        self._fwd_cache = None
+        self._bwd_cache = None
+
     def forward(self, img: np.ndarray, **kwargs: Any) -> np.ndarray:
         """
         Forward projection of an image.
 
         Args:
             img (np.ndarray): The input equirectangular image.
-            **kwargs (Any): Additional parameters to override projection configuration.
+            **kwargs (Any): Additional parameters to override projection configuration;
+                they are validated before the configuration is updated.
 
         Returns:
             np.ndarray: Projected rectilinear image.
 
         Raises:
             ValueError: If the input image is not a valid NumPy array.
+            ConfigurationError: If the parameter overrides are invalid.
             GridGenerationError: If grid generation fails.
             ProcessingError: If forward projection fails.
             TransformationError: If coordinate transformation fails.
@@ -69,26 +289,47 @@ class ProjectionProcessor:
             raise ValueError(error_msg)
 
         try:
-            self.config.update(**kwargs)
-            logger.debug(f"Configuration updated with parameters: {kwargs}")
+            # Caller-supplied overrides are validated, unlike internal trusted updates.
+            self.config.update(_trusted=False, **kwargs)
+            logger.debug("Configuration updated with parameters: %s", kwargs)
 
             img = PreprocessEquirectangularImage.preprocess(img, **kwargs)
 
-            x_grid, y_grid = self.grid_generation.projection_grid()
-            logger.debug("Forward grid generated successfully.")
+            key = self._cache_key(img.shape[:2])
+            if self._fwd_cache is not None and self._fwd_cache[0] == key:
+                _, maps = self._fwd_cache
+                logger.debug("Reusing cached forward remap coordinates.")
+            else:
+                x_grid, y_grid = self.grid_generation.projection_grid()
+                logger.debug("Forward grid generated successfully.")
 
-            lat, lon = self.projection.from_projection_to_spherical(x_grid, y_grid)
-            logger.debug("Forward projection computed successfully.")
+                grid_shape = np.broadcast_shapes(np.shape(x_grid), np.shape(y_grid))
+                # Tiling is a host-side cache optimisation; device grids are projected
+                # whole on the GPU instead of being copied back to be tiled.
+                on_device = _is_device_array(x_grid) or _is_device_array(y_grid)
+                if (
+                    self.tile_size and not on_device
+                    and len(grid_shape) == 2 and max(grid_shape) > self.tile_size
+                ):
+                    map_x, map_y = self._forward_tiled(x_grid, y_grid, img.shape[:2])
+                else:
+                    # Device grids are projected on the device; only the results are copied back.
+                    lat, lon = map(_host_grid, self.projection.from_projection_to_spherical(x_grid, y_grid))
+                    logger.debug("Forward projection computed successfully.")
 
-            map_x, map_y = self.transformer.spherical_to_image_coords(lat, lon, img.shape[:2])
-            logger.debug("Coordinates transformed to image space successfully.")
+                    map_x, map_y = self.transformer.spherical_to_image_coords(
+                        lat, lon, img.shape[:2], dtype=np.float32
+                    )
+                    logger.debug("Coordinates transformed to image space successfully.")
+                maps = self._prepare_maps(map_x, map_y, img.shape)
+                self._fwd_cache = (key, maps)
 
-            projected_img = self.interpolation.interpolate(img, map_x, map_y)
+            projected_img = self._remap(img, maps)
             logger.info("Forward projection completed successfully.")
             return projected_img
 
-        except (GridGenerationError, ProcessingError, TransformationError, InterpolationError) as e:
-            logger.error(f"Forward projection failed: {e}")
+        except (ConfigurationError, GridGenerationError, ProcessingError, TransformationError, InterpolationError) as e:
+            logger.error("Forward projection failed: %s", e)
             raise
         except Exception as e:
             logger.exception("Unexpected error during forward projection.")
@@ -100,13 +341,15 @@ class ProjectionProcessor:
 
         Args:
             rect_img (np.ndarray): The rectilinear image.
-            **kwargs (Any): Additional parameters to override projection configuration.
+            **kwargs (Any): Additional parameters to override projection configuration;
+                they are validated before the configuration is updated.
 
         Returns:
             np.ndarray: Back-projected equirectangular image.
 
         Raises:
             ValueError: If the input image is not a valid NumPy array.
+            ConfigurationError: If the parameter overrides are invalid.
             GridGenerationError: If grid generation fails.
             ProcessingError: If backward projection fails.
             TransformationError: If coordinate transformation fails.
@@ -119,29 +362,43 @@ class ProjectionProcessor:
             raise ValueError(error_msg)
 
         try:
-            self.config.update(**kwargs)
-            logger.debug(f"Configuration updated with parameters: {kwargs}")
+            # Caller-supplied overrides are validated, unlike internal trusted updates.
+            self.config.update(_trusted=False, **kwargs)
+            logger.debug("Configuration updated with parameters: %s", kwargs)
       
-            lon_grid, lat_grid = self.grid_generation.spherical_grid()
-            logger.debug("Backward grid generated successfully.")
+            key = self._cache_key(rect_img.shape[:2])
+            if self._bwd_cache is not None and self._bwd_cache[0] == key:
+                _, maps, mask = self._bwd_cache
+                logger.debug("Reusing cached backward remap coordinates.")
+            else:
+                lon_grid, lat_grid = self.grid_generation.spherical_grid()
+                logger.debug("Backward grid generated successfully.")
 
-            x, y, mask = self.projection.from_spherical_to_projection(lat_grid, lon_grid)
-            logger.debug("Backward projection computed successfully.")
+                x, y, mask = map(_host_grid, self.projection.from_spherical_to_projection(lat_grid, lon_grid))
+                logger.debug("Backward projection computed successfully.")
 
-            map_x, map_y = self.transformer.projection_to_image_coords(x, y, self.config.config_object)
-            logger.debug("Grid coordinates transformed to image space successfully.")
+                map_x, map_y = self.transformer.projection_to_image_coords(
+                    x, y, self.config.config_object, dtype=np.float32
+                )
+                logger.debug("Grid coordinates transformed to image space successfully.")
+                maps = self._prepare_maps(map_x, map_y, rect_img.shape)
+                self._bwd_cache = (key, maps, mask)
 
-            back_projected_img = self.interpolation.interpolate(
-                rect_img, map_x, map_y, mask if kwargs.get("return_mask", True) else None
-            )
+            # Masks that mark every pixel valid skip the masking pass entirely.
+            back_projected_img = self._remap(rect_img, maps, None if _all_valid(mask) else mask)
+            # The interpolation result is a fresh array, so it can be flipped in place.
+            cv2.flip(back_projected_img, 0, dst=back_projected_img)
             logger.info("Backward projection completed successfully.")
             if return_mask:
-                return cv2.flip(back_projected_img, 0), cv2.flip(mask * 1,0) == 1
+                # Copy so callers never hold a view into the cached mask.
+                if np.ndim(mask) == 0:
+                    return back_projected_img, np.full(back_projected_img.shape[:2], bool(mask))
+                return back_projected_img, np.ascontiguousarray(mask[::-1])
 
-            return cv2.flip(back_projected_img, 0)
+            return back_projected_img
 
-        except (GridGenerationError, ProcessingError, TransformationError, InterpolationError) as e:
-            logger.error(f"Backward projection failed: {e}")
+        except (ConfigurationError, GridGenerationError, ProcessingError, TransformationError, InterpolationError) as e:
+            logger.error("Backward projection failed: %s", e)
             raise
         except Exception as e:
             logger.exception("Unexpected error during backward projection.")
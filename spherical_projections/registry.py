@@ -9,11 +9,62 @@ import logging
 # Initialize logger for this module
 logger = logging.getLogger('spherical_projections.registry')
 
+def _create_projection(self: BaseProjectionConfig) -> Any:
+    """Instantiate the registered projection strategy for this configuration."""
+    return self._strategy_class(self.config_object)
+
+
+def _create_grid_generation(self: BaseProjectionConfig) -> Any:
+    """Instantiate the registered grid generation for this configuration."""
+    return self._grid_generation_class(self.config_object)
+
+
+def _create_interpolation(self: BaseProjectionConfig) -> Any:
+    """Instantiate the registered interpolation for this configuration."""
+    return self._interpolation_class(self.config_object)
+
+
+def _create_transformer(self: BaseProjectionConfig) -> Any:
+    """Instantiate the registered transformer for this configuration."""
+    return self._transformer_class(self.config_object)
+
+
 class ProjectionRegistry:
     """
     Registry for managing projection configurations and their components.
     """
     _registry: Dict[str, Dict[str, Type[Any]]] = {}
+    _config_classes: Dict[str, Type[BaseProjectionConfig]] = {}
+
+    @staticmethod
+    def _build_config_class(name: str, components: Dict[str, Type[Any]]) -> Type[BaseProjectionConfig]:
+        """
+        Synthesize a BaseProjectionConfig subclass bound to a projection's components.
+
+        The factory methods are shared module-level functions bound as methods on the
+        subclass, so no closures are created per `get_projection` call.
+
+        Args:
+            name (str): Name of the projection.
+            components (Dict[str, Type[Any]]): The registered components.
+
+        Returns:
+            Type[BaseProjectionConfig]: The configuration class for the projection.
+        """
+        namespace: Dict[str, Any] = {
+            "_strategy_class": components["projection_strategy"],
+            "_grid_generation_class": components["grid_generation"],
+            "create_projection": _create_projection,
+            "create_grid_generation": _create_grid_generation,
+        }
+        if components.get("interpolation"):
+            namespace["_interpolation_class"] = components["interpolation"]
+            namespace["create_interpolation"] = _create_interpolation
+        if components.get("transformer"):
+            namespace["_transformer_class"] = components["transformer"]
+            namespace["create_transformer"] = _create_transformer
+        class_name = "".join(part.capitalize() for part in name.split("_")) + "ProjectionConfig"
+        return type(class_name, (BaseProjectionConfig,), namespace)
 
     @classmethod
     def register(cls, name: str, components: Dict[str, Type[Any]]) -> None:
@@ -32,7 +83,7 @@ class ProjectionRegistry:
         Raises:
             RegistrationError: If required components are missing or invalid.
         """
-        logger.debug(f"Attempting to register projection '{name}' with components: {list(components.keys())}")
+        logger.debug("Attempting to register projection '%s' with components: %s", name, list(components))
         required_keys = {"config", "grid_generation", "projection_strategy"}
         missing_keys = required_keys - components.keys()
         if missing_keys:
@@ -46,10 +97,11 @@ class ProjectionRegistry:
                     error_msg = f"'{key}' component must be a class type."
                     logger.error(error_msg)
                     raise RegistrationError(error_msg)
-                logger.debug(f"'{key}' component validated as a class type.")
+                logger.debug("'%s' component validated as a class type.", key)
 
         cls._registry[name] = components
-        logger.info(f"Projection '{name}' registered successfully.")
+        cls._config_classes[name] = cls._build_config_class(name, components)
+        logger.info("Projection '%s' registered successfully.", name)
 
     @classmethod
     def get_projection(
@@ -72,7 +124,7 @@ class ProjectionRegistry:
         Raises:
             RegistrationError: If the projection name is not found or components are missing.
         """
-        logger.debug(f"Retrieving projection '{name}' with override parameters: {kwargs}")
+        logger.debug("Retrieving projection '%s' with override parameters: %s", name, kwargs)
         if name not in cls._registry:
             error_msg = f"Projection '{name}' not found in the registry."
             logger.error(error_msg)
@@ -81,11 +133,8 @@ class ProjectionRegistry:
         components = cls._registry[name]
         try:
             ConfigClass = components["config"]
-            GridGenerationClass = components["grid_generation"]
-            ProjectionStrategyClass = components["projection_strategy"]
-            InterpolationClass = components.get("interpolation", None)
-            TransformerClass = components.get("transformer", None)
-            logger.debug(f"Components for projection '{name}': {list(components.keys())}")
+            ProjectionConfigClass = cls._config_classes[name]
+            logger.debug("Components for projection '%s': %s", name, list(components))
         except KeyError as e:
             error_msg = f"Missing component in the registry: {e}"
             logger.error(error_msg)
@@ -94,26 +143,20 @@ class ProjectionRegistry:
         # Instantiate the configuration object
         try:
             config_instance = ConfigClass(**kwargs)
-            logger.debug(f"Configuration instance for projection '{name}' created successfully.")
+            logger.debug("Configuration instance for projection '%s' created successfully.", name)
         except Exception as e:
             error_msg = f"Failed to instantiate config class '{ConfigClass.__name__}': {e}"
             logger.exception(error_msg)
             raise RegistrationError(error_msg) from e
 
-        # Create a BaseProjectionConfig and attach the necessary methods
-        base_config = BaseProjectionConfig(config_instance)
-        base_config.create_projection = lambda: ProjectionStrategyClass(config_instance)
-        base_config.create_grid_generation = lambda: GridGenerationClass(config_instance)
-        if InterpolationClass:
-            base_config.create_interpolation = lambda: InterpolationClass(config_instance)
-        if TransformerClass:
-            base_config.create_transformer = lambda: TransformerClass(config_instance)
+        # Wrap the configuration in the projection's BaseProjectionConfig subclass
+        base_config = ProjectionConfigClass(config_instance)
 
         if return_processor:
-            logger.debug(f"Returning ProjectionProcessor for projection '{name}'.")
+            logger.debug("Returning ProjectionProcessor for projection '%s'.", name)
             return ProjectionProcessor(base_config)
 
-        logger.debug(f"Returning BaseProjectionConfig for projection '{name}'.")
+        logger.debug("Returning BaseProjectionConfig for projection '%s'.", name)
         return base_config
 
     @classmethod
@@ -126,5 +169,18 @@ class ProjectionRegistry:
         """
         logger.debug("Listing all registered projections.")
         projections = list(cls._registry.keys())
-        logger.info(f"Registered projections: {projections}")
-        return projections
\ No newline at end of file
+        logger.info("Registered projections: %s", projections)
+        return projections
+
+    @classmethod
+    def is_registered(cls, name: str) -> bool:
+        """
+        Check whether a projection is registered under the given name.
+
+        Args:
+            name (str): Name of the projection.
+
+        Returns:
+            bool: True if the projection is registered.
+        """
+        return name in cls._registry
@@ -1,4 +1,5 @@
 import cv2
+import math
 import numpy as np
 import logging
 
@@ -49,7 +50,9 @@ class PreprocessEquirectangularImage:
 
         x = np.linspace(0, W - 1, W)
         y = np.linspace(0, H - 1, H)
-        xv, yv = np.meshgrid(x, y)
+        # Broadcastable (1, W) / (H, 1) views; the trig below then runs on the axes
+        # and only the spherical coordinates are expanded to the full image.
+        xv, yv = x[np.newaxis, :], y[:, np.newaxis]
 
         lon = (xv / (W - 1)) * 360.0 - 180.0
         lat = 90.0 - (yv / (H - 1)) * 180.0
@@ -60,15 +63,18 @@ class PreprocessEquirectangularImage:
         y_sphere = np.cos(lat_rad) * np.sin(lon_rad)
         z_sphere = np.sin(lat_rad)
 
-        delta_lat_rad = np.radians(delta_lat)
-        delta_lon_rad = np.radians(delta_lon)
+        # Rotation angles as plain floats, so no 0-d arrays or ufunc calls per term.
+        delta_lat_rad = math.radians(delta_lat)
+        delta_lon_rad = math.radians(delta_lon)
+        cos_dlat, sin_dlat = math.cos(delta_lat_rad), math.sin(delta_lat_rad)
+        cos_dlon, sin_dlon = math.cos(delta_lon_rad), math.sin(delta_lon_rad)
 
         x_rot = x_sphere
-        y_rot = y_sphere * np.cos(delta_lat_rad) - z_sphere * np.sin(delta_lat_rad)
-        z_rot = y_sphere * np.sin(delta_lat_rad) + z_sphere * np.cos(delta_lat_rad)
+        y_rot = y_sphere * cos_dlat - z_sphere * sin_dlat
+        z_rot = y_sphere * sin_dlat + z_sphere * cos_dlat
 
-        x_final = x_rot * np.cos(delta_lon_rad) - y_rot * np.sin(delta_lon_rad)
-        y_final = x_rot * np.sin(delta_lon_rad) + y_rot * np.cos(delta_lon_rad)
+        x_final = x_rot * cos_dlon - y_rot * sin_dlon
+        y_final = x_rot * sin_dlon + y_rot * cos_dlon
         z_final = z_rot
 
         lon_final = np.arctan2(y_final, x_final)
@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+
+from spherical_projections import ProjectionRegistry
+from spherical_projections.exceptions import ConfigurationError
+
+
+class ProcessorOverrideValidationTest(unittest.TestCase):
+    """Keyword overrides passed to the processor are validated before they apply."""
+
+    def setUp(self):
+        self.img = np.zeros((32, 64, 3), dtype=np.uint8)
+
+    def _processor(self, name):
+        return ProjectionRegistry.get_projection(
+            name, return_processor=True, x_points=16, y_points=16, lon_points=64, lat_points=32
+        )
+
+    def test_invalid_overrides_raise(self):
+        cases = [("gnomonic", {"fov_deg": "abc"}), ("gnomonic", {"backend": "bogus"}),
+                 ("gnomonic", {"fov_deg": 200}), ("mercator", {"x_points": "wide"})]
+        for name, overrides in cases:
+            with self.subTest(projection=name, overrides=overrides):
+                processor = self._processor(name)
+                with self.assertRaises(ConfigurationError):
+                    processor.forward(self.img, **overrides)
+                with self.assertRaises(ConfigurationError):
+                    processor.backward(self.img, **overrides)
+                # A rejected update leaves the configuration as it was.
+                for key in overrides:
+                    self.assertNotEqual(getattr(processor.config, key), overrides[key])
+
+    def test_valid_override_applies(self):
+        processor = self._processor("gnomonic")
+        processor.forward(self.img, fov_deg=60)
+        self.assertEqual(processor.config.fov_deg, 60.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
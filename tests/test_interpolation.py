@@ -0,0 +1,230 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from spherical_projections import ProjectionRegistry
+from spherical_projections._optional import NUMBA_AVAILABLE
+from spherical_projections.base._interp_nb import SUPPORTED_BORDER_MODES
+
+
+class NearestInterpolationTest(unittest.TestCase):
+    """Nearest-neighbour maps convert to fixed-point without an interpolation table."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.img = (rng.random((64, 128, 3)) * 255).astype(np.uint8)
+
+    def _processor(self, name, interpolation):
+        return ProjectionRegistry.get_projection(
+            name, return_processor=True, interpolation=interpolation,
+            x_points=64, y_points=48, lon_points=128, lat_points=64
+        )
+
+    def test_forward_and_backward(self):
+        for name in ("gnomonic", "mercator"):
+            with self.subTest(projection=name):
+                processor = self._processor(name, cv2.INTER_NEAREST)
+                projected = processor.forward(self.img)
+                self.assertEqual(projected.shape, (48, 64, 3))
+                restored, mask = processor.backward(projected, return_mask=True)
+                self.assertEqual(restored.shape, self.img.shape)
+
+    def test_matches_float_map_remap(self):
+        # The fixed-point maps must sample the same source pixels as the float maps.
+        processor = self._processor("gnomonic", cv2.INTER_NEAREST)
+        interpolation = processor.interpolation
+        map_x, map_y = np.meshgrid(
+            np.linspace(0, 127, 64, dtype=np.float32), np.linspace(0, 63, 48, dtype=np.float32)
+        )
+        map1, map2 = interpolation.convert_maps(map_x, map_y, self.img.shape)
+        self.assertIsNone(map2)
+        result = interpolation.interpolate(self.img, map1, map2)
+        expected = cv2.remap(self.img, map_x, map_y, cv2.INTER_NEAREST)
+        np.testing.assert_array_equal(result, expected)
+
+
+
+class FixedPointToleranceTest(unittest.TestCase):
+    """Fixed-point maps stay within the documented grey-level tolerance of float maps."""
+
+    # Largest difference from float-map output on uint8 noise, per interpolation mode.
+    TOLERANCE = {
+        cv2.INTER_NEAREST: 0,
+        cv2.INTER_LINEAR: 7,
+        cv2.INTER_LANCZOS4: 0,
+        cv2.INTER_AREA: 7,
+        cv2.INTER_CUBIC: 7,
+    }
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.img = (rng.random((96, 160, 3)) * 255).astype(np.uint8)
+        self.map_x = (rng.random((80, 120)) * 170 - 5).astype(np.float32)
+        self.map_y = (rng.random((80, 120)) * 106 - 5).astype(np.float32)
+
+    def _interpolation(self, interpolation, fixed_point_maps=None):
+        return ProjectionRegistry.get_projection(
+            "gnomonic", return_processor=True, interpolation=interpolation,
+            fixed_point_maps=fixed_point_maps
+        ).interpolation
+
+    def _remap(self, interpolation, fixed_point_maps=None):
+        interp = self._interpolation(interpolation, fixed_point_maps)
+        maps = interp.build_maps(self.map_x, self.map_y, self.img.shape)
+        expected = cv2.remap(self.img, self.map_x, self.map_y, interpolation)
+        return maps, interp.apply(maps, self.img), expected
+
+    def test_tolerance_per_mode(self):
+        for mode, tolerance in self.TOLERANCE.items():
+            with self.subTest(mode=mode):
+                maps, result, expected = self._remap(mode, fixed_point_maps=True)
+                self.assertEqual(maps.map1.dtype, np.int16)
+                diff = np.abs(result.astype(np.int16) - expected.astype(np.int16))
+                self.assertLessEqual(int(diff.max()), tolerance)
+
+    def test_float_maps_are_exact_when_fixed_point_is_disabled(self):
+        for mode in self.TOLERANCE:
+            with self.subTest(mode=mode):
+                interp = self._interpolation(mode, fixed_point_maps=False)
+                result = interp.interpolate(self.img, self.map_x, self.map_y)
+                expected = cv2.remap(self.img, self.map_x, self.map_y, mode)
+                np.testing.assert_array_equal(result, expected)
+
+    def test_area_and_cubic_keep_float_maps_by_default(self):
+        for mode in (cv2.INTER_AREA, cv2.INTER_CUBIC):
+            with self.subTest(mode=mode):
+                maps, result, expected = self._remap(mode)
+                self.assertEqual(maps.map1.dtype, np.float32)
+                np.testing.assert_array_equal(result, expected)
+
+
+
+@unittest.skipUnless(NUMBA_AVAILABLE, "the fused remap-and-mask kernel needs Numba")
+class FusedMaskedRemapTest(unittest.TestCase):
+    """The fused Numba kernel matches cv2.remap followed by masking."""
+
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.img = (rng.random((70, 90, 3)) * 255).astype(np.uint8)
+        # Coordinates reach past every edge so each border mode is exercised.
+        map_x = (rng.random((60, 80)) * 130 - 20).astype(np.float32)
+        map_y = (rng.random((60, 80)) * 110 - 20).astype(np.float32)
+        self.map1, self.map2 = cv2.convertMaps(map_x, map_y, cv2.CV_16SC2)
+        self.mask = rng.random((60, 80)) < 0.3
+
+    def _interpolation(self, border_mode):
+        return ProjectionRegistry.get_projection(
+            "gnomonic", return_processor=True, interpolation=cv2.INTER_LINEAR,
+            borderMode=border_mode, borderValue=(10, 20, 30)
+        ).interpolation
+
+    def test_matches_opencv_for_every_border_mode(self):
+        for border_mode in SUPPORTED_BORDER_MODES:
+            for img in (self.img, np.ascontiguousarray(self.img[..., 0])):
+                with self.subTest(border_mode=border_mode, ndim=img.ndim):
+                    interp = self._interpolation(border_mode)
+                    result = interp._remap_masked_numba(img, self.map1, self.map2, self.mask)
+                    expected = cv2.remap(
+                        img, self.map1, self.map2, cv2.INTER_LINEAR,
+                        borderMode=border_mode, borderValue=(10, 20, 30)
+                    )
+                    expected[~self.mask] = 0
+                    np.testing.assert_array_equal(result, expected)
+
+    def test_apply_dispatches_sparse_masks_to_the_kernel(self):
+        interp = self._interpolation(cv2.BORDER_REFLECT_101)
+        maps = interp.build_maps(self.map1, self.map2, self.img.shape)
+        self.assertTrue(interp._use_fused_mask(self.img, maps, self.mask))
+        self.assertFalse(interp._use_fused_mask(self.img, maps, np.ones_like(self.mask)))
+        expected = cv2.remap(self.img, self.map1, self.map2, cv2.INTER_LINEAR,
+                             borderMode=cv2.BORDER_REFLECT_101)
+        expected[~self.mask] = 0
+        np.testing.assert_array_equal(interp.apply(maps, self.img, self.mask), expected)
+
+
+
+class TiledRemapTest(unittest.TestCase):
+    """Remaps into sources wider than cv2.remap's int16 limit are tiled transparently."""
+
+    WIDTH = 40000
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.img = (rng.random((40, self.WIDTH, 3)) * 255).astype(np.uint8)
+        self.rng = rng
+
+    def _interpolation(self, interpolation, border_mode=cv2.BORDER_CONSTANT):
+        return ProjectionRegistry.get_projection(
+            "gnomonic", return_processor=True, interpolation=interpolation, borderMode=border_mode
+        ).interpolation
+
+    def test_nearest_matches_direct_indexing(self):
+        # Samples spread over the whole width force the blocks to be split further.
+        map_x = (self.rng.integers(0, self.WIDTH, (48, 64)) + 0.25).astype(np.float32)
+        map_y = (self.rng.integers(0, 40, (48, 64)) - 0.25).astype(np.float32)
+        result = self._interpolation(cv2.INTER_NEAREST).interpolate(self.img, map_x, map_y)
+        expected = self.img[np.rint(map_y).astype(int), np.rint(map_x).astype(int)]
+        np.testing.assert_array_equal(result, expected)
+
+    def test_linear_matches_remap_of_the_sampled_region(self):
+        # A smooth map over the right end of the image, running past its edge.
+        x0 = 32000
+        cols = np.linspace(x0 + 0.3, self.WIDTH + 4.7, 3000, dtype=np.float32)
+        rows = np.linspace(-2.4, 41.6, 50, dtype=np.float32)
+        map_x, map_y = np.meshgrid(cols, rows)
+        for border_mode in (cv2.BORDER_CONSTANT, cv2.BORDER_REPLICATE, cv2.BORDER_REFLECT_101):
+            with self.subTest(border_mode=border_mode):
+                interp = self._interpolation(cv2.INTER_LINEAR, border_mode)
+                result = interp.interpolate(self.img, map_x, map_y)
+                expected = cv2.remap(
+                    np.ascontiguousarray(self.img[:, x0:]), map_x - x0, map_y,
+                    cv2.INTER_LINEAR, borderMode=border_mode
+                )
+                np.testing.assert_array_equal(result, expected)
+
+
+
+class RelativeMapTest(unittest.TestCase):
+    """Displacement maps (use_relative_map) give the same output as absolute maps."""
+
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        self.img = (rng.random((64, 128, 3)) * 255).astype(np.uint8)
+
+    def _processor(self, name, interpolation, use_relative_map, fixed_point_maps=None):
+        return ProjectionRegistry.get_projection(
+            name, return_processor=True, interpolation=interpolation,
+            use_relative_map=use_relative_map, fixed_point_maps=fixed_point_maps,
+            x_points=64, y_points=48, lon_points=128, lat_points=64
+        )
+
+    def test_processor_output_matches_absolute_maps(self):
+        for name in ("gnomonic", "mercator"):
+            for mode in (cv2.INTER_NEAREST, cv2.INTER_LINEAR, cv2.INTER_CUBIC):
+                for fixed_point_maps in (None, False):
+                    with self.subTest(projection=name, mode=mode, fixed_point_maps=fixed_point_maps):
+                        outputs = []
+                        for use_relative_map in (False, True):
+                            processor = self._processor(name, mode, use_relative_map, fixed_point_maps)
+                            projected = processor.forward(self.img)
+                            outputs.append((projected, processor.backward(projected)))
+                        absolute, relative = outputs
+                        np.testing.assert_array_equal(relative[0], absolute[0])
+                        np.testing.assert_array_equal(relative[1], absolute[1])
+
+    def test_relative_maps_on_an_oversized_source(self):
+        # Beyond the int16 limit the displacements are turned back into absolute maps for tiling.
+        img = np.tile(self.img, (1, 320, 1))
+        cols = np.linspace(33000.3, img.shape[1] + 2.7, 500, dtype=np.float32)
+        map_x, map_y = np.meshgrid(cols, np.linspace(-1.6, 65.4, 40, dtype=np.float32))
+        absolute = self._processor("gnomonic", cv2.INTER_LINEAR, False).interpolation
+        relative = self._processor("gnomonic", cv2.INTER_LINEAR, True).interpolation
+        disp_x, disp_y = relative.convert_maps(map_x, map_y, img.shape)
+        np.testing.assert_array_equal(
+            relative.interpolate(img, disp_x, disp_y), absolute.interpolate(img, map_x, map_y)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from spherical_projections.exceptions import ProcessingError
+from spherical_projections.gnomonic import strategy as gnomonic_strategy
+from spherical_projections.gnomonic.config import GnomonicConfig
+from spherical_projections.gnomonic.strategy import GnomonicProjectionStrategy
+
+
+class GnomonicBatchInverseTest(unittest.TestCase):
+    """The batched inverse projection matches one call per projection center."""
+
+    PHI1 = [0.0, 35.0, -60.0, 89.0]
+    LAM0 = [0.0, -120.0, 45.0, 170.0]
+
+    def setUp(self):
+        self.strategy = GnomonicProjectionStrategy(GnomonicConfig())
+
+    def _grids(self, dtype):
+        x = np.linspace(-1.5, 1.5, 40, dtype=dtype)[None, :]
+        y = np.linspace(-1.2, 1.2, 30, dtype=dtype)[:, None]
+        yield "broadcast", x, y
+        yield "dense", *np.meshgrid(x[0], y[:, 0])
+
+    def _loop(self, x, y):
+        lats, lons = [], []
+        for phi1, lam0 in zip(self.PHI1, self.LAM0):
+            strategy = GnomonicProjectionStrategy(GnomonicConfig(phi1_deg=phi1, lam0_deg=lam0))
+            lat, lon = strategy.from_projection_to_spherical(x, y)
+            lats.append(np.array(lat, copy=True))
+            lons.append(np.array(lon, copy=True))
+        return np.stack(lats), np.stack(lons)
+
+    def _check(self):
+        for dtype, atol in ((np.float32, 1e-4), (np.float64, 1e-10)):
+            for layout, x, y in self._grids(dtype):
+                with self.subTest(dtype=np.dtype(dtype).name, layout=layout):
+                    lat, lon = self.strategy.from_projection_to_spherical_batch(
+                        x, y, self.PHI1, self.LAM0
+                    )
+                    expected_lat, expected_lon = self._loop(x, y)
+                    self.assertEqual(lat.shape, expected_lat.shape)
+                    self.assertEqual(lat.dtype, expected_lat.dtype)
+                    np.testing.assert_allclose(lat, expected_lat, rtol=0, atol=atol)
+                    np.testing.assert_allclose(lon, expected_lon, rtol=0, atol=atol)
+
+    def test_matches_per_center_loop(self):
+        self._check()
+
+    def test_matches_per_center_loop_without_numba(self):
+        with mock.patch.object(gnomonic_strategy, "NUMBA_AVAILABLE", False):
+            self._check()
+
+    def test_matches_per_center_loop_with_numpy_only(self):
+        with mock.patch.object(gnomonic_strategy, "NUMBA_AVAILABLE", False), \
+                mock.patch.object(gnomonic_strategy, "NUMEXPR_AVAILABLE", False):
+            self._check()
+
+    def test_rejects_mismatched_centers(self):
+        x = np.zeros((1, 4))
+        y = np.zeros((3, 1))
+        with self.assertRaises(ProcessingError):
+            self.strategy.from_projection_to_spherical_batch(x, y, [0.0, 1.0], [0.0])
+
+
+
+class GnomonicForwardMaskTest(unittest.TestCase):
+    """The float32 visibility mask agrees with the one computed in float64."""
+
+    CENTERS = [(0.0, 0.0), (0.0, 37.0), (45.0, 10.0), (90.0, 0.0), (24.653, -82.877)]
+
+    def _check(self):
+        lat = np.linspace(90, -90, 512)[:, None]
+        lon = np.linspace(-180, 180, 1024)[None, :]
+        for phi1, lam0 in self.CENTERS:
+            strategy = GnomonicProjectionStrategy(GnomonicConfig(phi1_deg=phi1, lam0_deg=lam0))
+            expected = strategy.from_spherical_to_projection(lat, lon)[2]
+            grids = {
+                "broadcast": (lat.astype(np.float32), lon.astype(np.float32)),
+                "dense": tuple(np.broadcast_arrays(lat.astype(np.float32), lon.astype(np.float32))),
+            }
+            for layout, (lat32, lon32) in grids.items():
+                with self.subTest(center=(phi1, lam0), layout=layout):
+                    mask = strategy.from_spherical_to_projection(lat32, lon32)[2]
+                    np.testing.assert_array_equal(*np.broadcast_arrays(mask, expected))
+
+    def test_matches_float64(self):
+        self._check()
+
+    def test_matches_float64_without_numba(self):
+        with mock.patch.object(gnomonic_strategy, "NUMBA_AVAILABLE", False):
+            self._check()
+
+    def test_matches_float64_with_numpy_only(self):
+        with mock.patch.object(gnomonic_strategy, "NUMBA_AVAILABLE", False), \
+                mock.patch.object(gnomonic_strategy, "NUMEXPR_AVAILABLE", False):
+            self._check()
+
+
+if __name__ == "__main__":
+    unittest.main()